@@ -1,5 +1,7 @@
 import os
 import pickle
+import threading
+import weakref
 
 from featherstore import _utils
 
@@ -68,9 +70,97 @@ class Metadata:
     def _compact(self):
         if len(self) > len(self.index) * 2:
             items = self.read()
-            _utils._remove_path(self._db_path)
+            tmp_path = f"{self._db_path}.tmp"
+            byte_offsets = []
+            with open(tmp_path, "wb") as f:
+                for key, value in items.items():
+                    byte_offsets.append((key, self._write_item(f, value)))
+            try:
+                # Replaced in one step, so snapshots keep reading the old file
+                os.replace(tmp_path, self._db_path)
+            except PermissionError:  # Still open by a snapshot on Windows
+                _utils._remove_path(tmp_path)
+                return
+            self.index._data = {}
             self.index._db_size = 0
-            self.write(items)
+            self.index.write(byte_offsets)
+
+
+class MetadataSnapshot:
+    """A read-only view of metadata items at the given byte offsets of a
+    database file, which is opened when the snapshot is taken. Items are only
+    read when they're accessed, from the file as it was then, even if it has
+    since been removed.
+    """
+
+    def __init__(self, db_path, byte_offsets):
+        self._byte_offsets = dict(byte_offsets)
+        self._file = None
+        if self._byte_offsets:
+            self._file = open(db_path, "rb")  # noqa: SIM115
+            self._close = weakref.finalize(self, self._file.close)
+        self._lock = threading.Lock()
+
+    def close(self):
+        if self._file is not None:
+            self._close()
+
+    def read(self):
+        return {key: self[key] for key in self.keys()}
+
+    def keys(self):
+        return sorted(self._byte_offsets.keys())
+
+    def __getitem__(self, key: str):
+        byte_offset = self._byte_offsets[key]
+        with self._lock:
+            self._file.seek(byte_offset)
+            return pickle.load(self._file)
+
+
+class MetadataOverlay:
+    """Keeps the changes to the items of a metadata in memory, on top of the
+    items it holds
+    """
+
+    def __init__(self, metadata):
+        self._metadata = metadata
+        self._changes = {}
+        self._deleted = set()
+
+    def write(self, new_data: dict):
+        _can_write_metadata(new_data)
+        self._changes.update(new_data)
+        self._deleted.difference_update(new_data)
+
+    def keys(self):
+        keys = set(self._metadata.keys()) - self._deleted
+        return sorted(keys | self._changes.keys())
+
+    def read(self):
+        items = self._metadata.read()
+        for key in self._deleted:
+            items.pop(key, None)
+        items.update(self._changes)
+        return {key: items[key] for key in sorted(items)}
+
+    def changes(self):
+        """The items written, and the keys deleted, on top of the metadata"""
+        return dict(self._changes), set(self._deleted)
+
+    def __getitem__(self, key: str):
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        return self._metadata[key]
+
+    def __setitem__(self, key: str, value):
+        self.write({key: value})
+
+    def __delitem__(self, key: str):
+        self._changes.pop(key, None)
+        self._deleted.add(key)
 
 
 class KeyIndex:
@@ -106,9 +196,12 @@ class KeyIndex:
         return len(self._data)
 
     def _write_data(self):
-        with open(self._path, "wb") as f:
+        # Replaced in one step, so readers never see a partially written index
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "wb") as f:
             pickle.dump(self._data, f)
             pickle.dump(self._db_size, f)
+        os.replace(tmp_path, self._path)
 
     def _read_data(self):
         with open(self._path, "rb") as f:
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+# About 1% false positives
+BITS_PER_VALUE = 10
+NUM_HASHES = 7
+
+
+def make_bloom_filter(values):
+    hashes = _hash_values(values)
+    num_bits = max(len(hashes) * BITS_PER_VALUE, 64)
+    num_bits += -num_bits % 8
+
+    bits = np.zeros(num_bits, dtype=bool)
+    bits[_bit_positions(hashes, num_bits)] = True
+    return np.packbits(bits).tobytes()
+
+
+def might_contain(bloom_filter, values):
+    """Whether each value may be in the set the filter was made from. False
+    answers are always right; True answers are wrong for about 1% of values.
+    """
+    bloom_filter = np.frombuffer(bloom_filter, dtype=np.uint8)
+    num_bits = len(bloom_filter) * 8
+
+    positions = _bit_positions(_hash_values(values), num_bits)
+    bytes_ = bloom_filter[positions >> 3]
+    bits = (bytes_ >> (7 - (positions & 7)).astype(np.uint8)) & 1
+    return bits.all(axis=1)
+
+
+def _hash_values(values):
+    values = values.to_numpy(zero_copy_only=False)
+    return pd.util.hash_array(values)
+
+
+def _bit_positions(hashes, num_bits):
+    # Double hashing: derives all the hashes from the two halves of one
+    low, high = hashes & 0xFFFFFFFF, hashes >> np.uint64(32)
+    steps = np.arange(NUM_HASHES, dtype=np.uint64)
+    return (low[:, None] + steps * high[:, None]) % np.uint64(num_bits)
@@ -0,0 +1,232 @@
+import bisect
+import json
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from featherstore._table import _keys, _table_utils
+from featherstore._table._indexers import RowIndexer
+from featherstore.exceptions import RowNotFoundError
+
+# A composite index of two levels, like (symbol, timestamp), is stored as a
+# table partitioned by key, with the first level as the partition key and the
+# second as the index. The rows are then sorted lexicographically, and each
+# partition spans the composite bounds (key, min) to (key, max).
+
+ROWS_KEYWORDS = ("before", "after", "between")
+
+
+def get_index_levels(df, index=None):
+    """The names of the levels of a composite index, or None"""
+    if isinstance(index, (list, tuple)):
+        return list(index)
+    if isinstance(df, (pd.DataFrame, pd.Series)) and df.index.nlevels > 1:
+        return list(df.index.names)
+    if isinstance(df, pa.Table):
+        pd_metadata = df.schema.pandas_metadata
+        if pd_metadata is not None and len(pd_metadata["index_columns"]) > 1:
+            return list(pd_metadata["index_columns"])
+    return None
+
+
+def split_index_levels(df):
+    """Moves the first level of a composite index into a column, leaving the
+    second level as the only index of `df`
+    """
+    if isinstance(df, (pd.DataFrame, pd.Series)) and df.index.nlevels > 1:
+        return df.reset_index(level=0)
+    if isinstance(df, pa.Table):
+        pd_metadata = df.schema.pandas_metadata
+        if pd_metadata is not None and len(pd_metadata["index_columns"]) > 1:
+            pd_metadata["index_columns"] = pd_metadata["index_columns"][1:]
+            metadata = {**df.schema.metadata, b"pandas": json.dumps(pd_metadata)}
+            return df.replace_schema_metadata(metadata)
+    return df
+
+
+def set_index_levels(df, index_levels):
+    """Moves the first level of a composite index back into the index of a
+    Pandas DataFrame
+    """
+    first_level, second_level = index_levels
+    df = df.set_index(first_level, append=True)
+    return df.reorder_levels([first_level, second_level])
+
+
+def as_prefix(row):
+    """A row as a tuple of level values, where a single value is a prefix"""
+    if isinstance(row, tuple):
+        return row
+    return (row,)
+
+
+def get_rows_bounds(rows):
+    """The lower and upper bound of a range of rows, either of which can be None"""
+    ((keyword, bounds),) = rows.items()
+    keyword = keyword.lower()
+    if keyword == "before":
+        return None, bounds
+    if keyword == "after":
+        return bounds, None
+    low, high = bounds
+    return low, high
+
+
+class CompositeRows:
+    """The `rows` to read from a table with a composite index.
+
+    Each row is either a `(first, second)` tuple of level values, or a first
+    level value on its own, which selects every row with that value. Ranges
+    compare the rows lexicographically, so `{'between': ['AAPL', 'MSFT']}` reads
+    every row of the first level values from `AAPL` to `MSFT`.
+    """
+
+    def __init__(self, rows, *, partition_key, index_name, key_type, index_type):
+        self._partition_key = partition_key
+        self._index_name = index_name
+        self._key_type = key_type
+        self._index_type = index_type
+
+        self.keyword = None
+        if isinstance(rows, dict):
+            self.keyword = next(iter(rows)).lower()
+            low, high = get_rows_bounds(rows)
+            self._low = self._format_bound(low)
+            self._high = self._format_bound(high)
+            self._rows = [bound for bound in (low, high) if bound is not None]
+        else:
+            self._rows = list(rows)
+            self._format_rows(self._rows)
+
+    def _format_bound(self, bound):
+        if bound is None:
+            return None
+        (key, *index) = as_prefix(bound)
+        (key,) = self._convert_keys([key])
+        if index:
+            index = self._convert_index(index)
+        return (key, *index)
+
+    def _format_rows(self, rows):
+        rows = [as_prefix(row) for row in rows]
+        prefixes = [row[0] for row in rows if len(row) == 1]
+        pairs = [row for row in rows if len(row) == 2]
+        self._prefixes = set(self._convert_keys(prefixes))
+
+        keys = self._convert_keys([key for key, _ in pairs])
+        index = self._convert_index([value for _, value in pairs])
+        self._pairs = pa.table(
+            {
+                "key": pa.array(keys, type=self._key_type),
+                "index": pa.array(index, type=self._index_type),
+            }
+        )
+        self._index_of_keys = {}
+        for key, value in zip(keys, index):
+            self._index_of_keys.setdefault(key, []).append(value)
+        for values in self._index_of_keys.values():
+            values.sort()
+
+    def _convert_keys(self, keys):
+        return pa.array(keys, type=self._key_type).to_pylist()
+
+    def _convert_index(self, index):
+        index = RowIndexer(index).convert_types(to=str(self._index_type)).values()
+        return pa.array(index, type=self._index_type).to_pylist()
+
+    def values(self):
+        return self._rows
+
+    def overlaps(self, partition_data):
+        """Whether the composite bounds of a partition can hold any of the rows"""
+        if partition_data["num_rows"] == 0:
+            return False
+        key = partition_data["key"]
+        first_row = (key, partition_data["min"])
+        last_row = (key, partition_data["max"])
+        if self.keyword:
+            # A prefix bound holds every row starting with it, so the rows are
+            # only compared on as many levels as the bound has
+            is_after_low = self._low is None or last_row[: len(self._low)] >= self._low
+            is_before_high = (
+                self._high is None or first_row[: len(self._high)] <= self._high
+            )
+            return is_after_low and is_before_high
+
+        if key in self._prefixes:
+            return True
+        index = self._index_of_keys.get(key, [])
+        position = bisect.bisect_left(index, first_row[1])
+        return position < len(index) and index[position] <= last_row[1]
+
+    def filter(self, df):
+        keys = _keys.get_key_values(df[self._partition_key])
+        index = df[self._index_name].combine_chunks()
+        if self.keyword:
+            masks = []
+            if self._low is not None:
+                masks.append(_is_at_or_after(keys, index, self._low))
+            if self._high is not None:
+                masks.append(_is_at_or_before(keys, index, self._high))
+            mask = masks[0] if len(masks) == 1 else pc.and_(*masks)
+            return df.filter(mask)
+
+        prefix_positions = self._find_prefixes(keys)
+        pair_positions = self._find_pairs(keys, index)
+        positions = np.union1d(prefix_positions, pair_positions)
+        return df.take(positions)
+
+    def _find_prefixes(self, keys):
+        if not self._prefixes:
+            return np.empty(0, np.int64)
+        prefixes = pa.array(sorted(self._prefixes), type=keys.type)
+        is_stored = pc.is_in(prefixes, value_set=keys)
+        missing = prefixes.filter(pc.invert(is_stored)).to_pylist()
+        if missing:
+            raise RowNotFoundError(
+                f"Trying to access rows not found in table ({missing})"
+            )
+        return np.flatnonzero(
+            pc.is_in(keys, value_set=prefixes).to_numpy(zero_copy_only=False)
+        )
+
+    def _find_pairs(self, keys, index):
+        if self._pairs.num_rows == 0:
+            return np.empty(0, np.int64)
+        stored = pa.table({"key": keys, "index": index})
+        requested = self._pairs.cast(stored.schema)
+        stored = _table_utils.convert_to_polars(stored).with_row_index("position")
+        requested = _table_utils.convert_to_polars(requested)
+
+        missing = requested.join(stored, on=["key", "index"], how="anti")
+        if missing.height > 0:
+            raise RowNotFoundError(
+                f"Trying to access rows not found in table ({missing.rows()})"
+            )
+        matches = stored.join(requested, on=["key", "index"], how="semi")
+        return matches["position"].cast(pl.Int64).to_numpy()
+
+
+def _is_at_or_after(keys, index, low):
+    key = pa.scalar(low[0], type=keys.type)
+    if len(low) == 1:
+        return pc.greater_equal(keys, key)
+    value = pa.scalar(low[1], type=index.type)
+    return pc.or_(
+        pc.greater(keys, key),
+        pc.and_(pc.equal(keys, key), pc.greater_equal(index, value)),
+    )
+
+
+def _is_at_or_before(keys, index, high):
+    key = pa.scalar(high[0], type=keys.type)
+    if len(high) == 1:
+        return pc.less_equal(keys, key)
+    value = pa.scalar(high[1], type=index.type)
+    return pc.or_(
+        pc.less(keys, key),
+        pc.and_(pc.equal(keys, key), pc.less_equal(index, value)),
+    )
@@ -0,0 +1,51 @@
+import zlib
+
+import numpy as np
+import pyarrow as pa
+
+# Rows dropped with a deletion vector stay in the partition file until the
+# partition is rewritten. The partition metadata keeps the number of rows in
+# the file and a compressed bitmap of the dropped ones, which are filtered out
+# when the partition is read.
+
+
+def get_deleted(partition_data):
+    """A mask of the dropped rows in the partition file, or None if no rows
+    are dropped
+    """
+    try:
+        num_rows, bitmap = partition_data["deletion_vector"]
+    except KeyError:
+        return None
+    bits = np.frombuffer(zlib.decompress(bitmap), dtype=np.uint8)
+    return np.unpackbits(bits, count=num_rows).astype(bool)
+
+
+def make_deletion_vector(deleted):
+    bitmap = zlib.compress(np.packbits(deleted).tobytes())
+    return len(deleted), bitmap
+
+
+def filter_deleted(partition, partition_data):
+    deleted = get_deleted(partition_data)
+    if deleted is None:
+        return partition
+    return partition.filter(pa.array(~deleted))
+
+
+def add_deleted(deleted, dropped):
+    """Adds `dropped`, a mask over the rows not yet dropped, to the `deleted`
+    mask over the rows in the file
+    """
+    deleted = deleted.copy()
+    deleted[np.flatnonzero(~deleted)[dropped]] = True
+    return deleted
+
+
+def remap_positions(positions, dropped):
+    """Moves row positions to where the rows are once `dropped`, a mask over the
+    same rows, is removed
+    """
+    positions = positions[~dropped[positions]]
+    num_dropped_before = np.cumsum(dropped)[positions]
+    return (positions - num_dropped_before).astype(positions.dtype)
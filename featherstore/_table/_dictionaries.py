@@ -0,0 +1,96 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Dictionary columns share one dictionary for the whole table, kept in the
+# table metadata. It only ever grows, so the partition files hold nothing but
+# the indices into it.
+INDEX_TYPE = pa.int32()
+
+
+def get_dictionaries(table_data):
+    try:
+        return table_data["dictionaries"]
+    except KeyError:  # Tables without dictionary encoded columns
+        return {}
+
+
+def make_dictionaries(df, cols):
+    dictionaries = {}
+    for col in cols:
+        dtype = df.schema.field(col).type
+        if pa.types.is_dictionary(dtype):
+            dtype = dtype.value_type
+        dictionaries[col] = pa.array([], type=dtype)
+    return dictionaries
+
+
+def cast_cols(df, dictionaries):
+    for col, dictionary in dictionaries.items():
+        if col in df.column_names:
+            dtype = pa.dictionary(INDEX_TYPE, dictionary.type)
+            df = _replace_col(df, col, df[col].cast(dtype))
+    return df
+
+
+def update_dictionaries(dictionaries, partitions):
+    first_partition = next(iter(partitions.values()))
+    updated_dictionaries = {}
+    for col, dictionary in dictionaries.items():
+        if col not in first_partition.column_names:
+            continue
+        if not pa.types.is_dictionary(first_partition.schema.field(col).type):
+            continue  # Changed to another type
+        for partition in partitions.values():
+            dictionary = _add_new_values(dictionary, partition[col].dictionary)
+        updated_dictionaries[col] = dictionary
+    return updated_dictionaries
+
+
+def _add_new_values(dictionary, values):
+    if _starts_with(dictionary, values):
+        return dictionary
+    values = values.cast(dictionary.type)
+    is_new = pc.invert(pc.is_in(values, value_set=dictionary))
+    new_values = pc.unique(values.filter(is_new).drop_null())
+    return pa.concat_arrays([dictionary, new_values])
+
+
+def _starts_with(dictionary, values):
+    if len(values) > len(dictionary):
+        return False
+    return dictionary.slice(0, len(values)).equals(values)
+
+
+def encode_cols(df, dictionaries):
+    """Replaces the dictionary columns with their indices into the dictionaries"""
+    for col, dictionary in dictionaries.items():
+        if col in df.column_names:
+            chunks = [_to_indices(chunk, dictionary) for chunk in df[col].chunks]
+            df = _replace_col(df, col, pa.chunked_array(chunks, type=INDEX_TYPE))
+    return df
+
+
+def _to_indices(array, dictionary):
+    if _starts_with(dictionary, array.dictionary):
+        return array.indices.cast(INDEX_TYPE)
+    values = array.dictionary.cast(dictionary.type)
+    mapping = pc.index_in(values, value_set=dictionary)
+    return mapping.take(array.indices)
+
+
+def decode_cols(df, dictionaries):
+    for col, dictionary in dictionaries.items():
+        if col in df.column_names:
+            dtype = pa.dictionary(INDEX_TYPE, dictionary.type)
+            chunks = [
+                pa.DictionaryArray.from_arrays(chunk, dictionary, safe=False)
+                for chunk in df[col].chunks
+            ]
+            df = _replace_col(df, col, pa.chunked_array(chunks, type=dtype))
+    return df
+
+
+def _replace_col(df, col, values):
+    idx = df.schema.get_field_index(col)
+    field = df.schema.field(idx).with_type(values.type)
+    return df.set_column(idx, field, values)
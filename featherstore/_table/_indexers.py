@@ -2,6 +2,7 @@ from collections.abc import MappingView
 from itertools import chain
 
 import pandas as pd
+import pyarrow as pa
 
 from featherstore._table import _table_utils
 from featherstore._utils import filter_items_like_pattern
@@ -9,7 +10,7 @@ from featherstore._utils import filter_items_like_pattern
 
 class Indexer:
     def __init__(self, items, keywords):
-        if hasattr(items, "copy"):
+        if isinstance(items, (list, dict)):
             items = items.copy()
 
         if isinstance(items, dict):
@@ -131,6 +132,30 @@ class RowIndexer(Indexer):
     def __init__(self, rows):
         super().__init__(rows, keywords=("before", "after", "between"))
 
+    def _set_list(self, items):
+        # Array-likes are kept as Arrow so large key sets are never boxed
+        if _table_utils.is_array(items):
+            return _table_utils.convert_to_arrow_array(items)
+        return super()._set_list(items)
+
+    def is_arrow(self):
+        return isinstance(self.values(), _table_utils.ARROW_ARRAY_TYPES)
+
+    def to_arrow(self):
+        if self.is_arrow():
+            return self.values()
+        return pa.array(self.values())
+
+    def min(self):
+        if self.is_arrow():
+            return pa.compute.min(self.values()).as_py()
+        return min(self.values())
+
+    def max(self):
+        if self.is_arrow():
+            return pa.compute.max(self.values()).as_py()
+        return max(self.values())
+
     def convert_types(self, *, to):
         formatted_rows = self.copy()
         if formatted_rows:
@@ -139,7 +164,9 @@ class RowIndexer(Indexer):
         return formatted_rows
 
     def _convert_rows(self, rows, to):
-        if _table_utils.typestring_is_temporal(to):
+        if isinstance(rows, _table_utils.ARROW_ARRAY_TYPES):
+            rows = self._convert_arrow_rows(rows, to)
+        elif _table_utils.typestring_is_temporal(to):
             if len(rows) >= 2_000:  # Approx. threshold for when Pandas is faster
                 rows = pd.to_datetime(rows).tolist()
             else:
@@ -150,6 +177,20 @@ class RowIndexer(Indexer):
             rows = list(map(int, rows))
         return rows
 
+    def _convert_arrow_rows(self, rows, to):
+        if str(rows.type) == to:
+            return rows
+        try:
+            return rows.cast(pa.type_for_alias(to))
+        except (ValueError, pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return self._convert_rows(rows.to_pylist(), to)
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if isinstance(item, pa.Scalar):
+            item = item.as_py()
+        return item
+
 
 class ColIndexer(Indexer):
     def __init__(self, cols):
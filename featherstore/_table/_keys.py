@@ -0,0 +1,86 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from featherstore._table import _table_utils
+
+# Tables partitioned by a key column group their rows by key, and sort the rows
+# of each key by the index. Every partition holds the rows of a single key, and
+# keeps the key in the partition metadata, so reads of some keys skip the
+# partitions of the others. The index is only unique and sorted within a key.
+
+
+def get_key_column(df, partition_key):
+    """The key column of an incoming DataFrame, as an Arrow array"""
+    if isinstance(df, pd.Series):
+        return _table_utils.convert_to_arrow(df, as_array=True)
+    return _table_utils.convert_to_arrow(df[partition_key], as_array=True)
+
+
+def get_key_values(keys):
+    """The keys as one array, without dictionary encoding"""
+    if isinstance(keys, pa.ChunkedArray):
+        keys = keys.combine_chunks()
+    if pa.types.is_dictionary(keys.type):
+        keys = keys.dictionary_decode()
+    return keys
+
+
+def sort_by_key(df, partition_key, index_name):
+    sort_keys = pa.table(
+        {"key": get_key_values(df[partition_key]), "index": df[index_name]}
+    )
+    indices = pc.sort_indices(
+        sort_keys, sort_keys=[("key", "ascending"), ("index", "ascending")]
+    )
+    return df.take(indices)
+
+
+def is_sorted_by_key(df, partition_key, index_name):
+    if df.num_rows < 2:
+        return True
+    keys = get_key_values(df[partition_key])
+    index = df[index_name].combine_chunks()
+
+    same_key = pc.equal(keys[:-1], keys[1:])
+    key_decreases = pc.greater(keys[:-1], keys[1:])
+    index_decreases = pc.and_(same_key, pc.greater(index[:-1], index[1:]))
+    return not pc.any(pc.or_(key_decreases, index_decreases)).as_py()
+
+
+def split_by_key(df, partition_key):
+    """Splits `df`, sorted by key, into the rows of each key"""
+    keys = get_key_values(df[partition_key])
+    offsets = _get_key_offsets(keys)
+    for start, end in itertools.pairwise(offsets):
+        yield keys[start].as_py(), df.slice(start, end - start)
+
+
+def _get_key_offsets(keys):
+    if len(keys) == 0:
+        return [0, 0]
+    changes = pc.not_equal(keys[:-1], keys[1:]).to_numpy(zero_copy_only=False)
+    return [0, *(np.flatnonzero(changes) + 1).tolist(), len(keys)]
+
+
+def get_partition_key_value(partition, partition_key):
+    if partition.num_rows == 0:
+        return None
+    return partition[partition_key][0].as_py()
+
+
+def get_last_partitions(partition_data):
+    """The last partition of each stored key"""
+    last_partitions = {}
+    for name, data in partition_data.items():
+        if data["num_rows"] > 0:
+            last_partitions[data["key"]] = name
+    return last_partitions
+
+
+def filter_partitions_by_key(partition_names, partition_data, keys):
+    keys = set(keys.to_pylist())
+    return [name for name in partition_names if partition_data[name]["key"] in keys]
@@ -1,52 +1,67 @@
+import itertools
+
+import numpy as np
 import pyarrow as pa
 
-from featherstore._table._table_utils import get_next_item
+from featherstore._table import _keys, _periods
+from featherstore._table._table_utils import get_index_name, get_next_item
 from featherstore.exceptions import PartitionCountMismatchError
 
 PARTITION_NAME_LENGTH = 14
 INSERTION_BUFFER_LENGTH = 10**6
+PERIOD_ID_OFFSET = 5 * 10**7  # Keeps the ids of periods before 1970 positive
 
 
 def make_partitions(df, rows_per_partition):
-    df = df.combine_chunks()
     if rows_per_partition == -1:
-        partitions = _make_single_partition(df)
-    else:
-        partitions = df.to_batches(rows_per_partition)
-        partitions = _combine_small_partitions(partitions, rows_per_partition)
-        if len(partitions) == 0:
-            partitions = [pa.RecordBatch.from_pylist(df.to_pylist(), df.schema)]
+        rows_per_partition = max(df.num_rows, 1)
+    bounds = _compute_partition_bounds(df.num_rows, rows_per_partition)
+    partitions = [_slice_partition(df, start, end) for start, end in bounds]
     return partitions
 
 
-def _make_single_partition(df):
-    return df.to_batches()
+def split_partitions(df, partition_lengths):
+    """Splits `df` into partitions of the given number of rows"""
+    offsets = [0, *itertools.accumulate(partition_lengths)]
+    return [
+        _slice_partition(df, start, end) for start, end in itertools.pairwise(offsets)
+    ]
+
 
+def _compute_partition_bounds(num_rows, rows_per_partition):
+    offsets = [*range(0, num_rows, rows_per_partition), num_rows]
+    offsets = _combine_small_partitions(offsets, rows_per_partition)
+    if len(offsets) == 1:  # Empty table, still stored as one (empty) partition
+        offsets.insert(0, 0)
+    return list(itertools.pairwise(offsets))
 
-def _combine_small_partitions(partitions, partition_size):
-    has_multiple_partitions = len(partitions) > 1
-    try:
-        size_of_last_partition = partitions[-1].num_rows
-    except IndexError:
-        size_of_last_partition = 0
+
+def _combine_small_partitions(offsets, partition_size):
+    has_multiple_partitions = len(offsets) > 2
+    size_of_last_partition = offsets[-1] - offsets[-2] if len(offsets) > 1 else 0
     min_partition_size = partition_size * 0.5
 
     if has_multiple_partitions and size_of_last_partition < min_partition_size:
-        new_last_partition = _combine_last_two_partitions(partitions)
-        partitions = _replace_last_two_partitions(new_last_partition, partitions)
-    return partitions
+        offsets = _combine_last_two_partitions(offsets)
+    return offsets
 
 
-def _combine_last_two_partitions(partitions):
-    last_partition = pa.Table.from_batches(partitions[-2:])
-    last_partition = last_partition.combine_chunks()
-    return last_partition.to_batches()
+def _combine_last_two_partitions(offsets):
+    return [*offsets[:-2], offsets[-1]]
 
 
-def _replace_last_two_partitions(new_last_partition, partitions):
-    partitions = partitions[:-2]
-    partitions.extend(new_last_partition)
-    return partitions
+def _slice_partition(df, start, end):
+    """Slices out a partition without copying, unless it straddles chunks of
+    ``df``. Only those partitions are concatenated into a single record batch.
+    """
+    partition = df.slice(start, end - start)
+    if partition.num_rows == 0:
+        return pa.RecordBatch.from_pylist([], schema=df.schema)
+
+    batches = partition.to_batches()
+    if len(batches) > 1:
+        batches = partition.combine_chunks().to_batches()
+    return batches[0]
 
 
 def convert_int_to_partition_id(partition_id):
@@ -102,8 +117,15 @@ def create_partitions(
     *,
     strategy="reuse",
     all_partition_names=None,
+    partition_by=None,
+    partition_key=None,
 ):
-    partitions = make_partitions(df, rows_per_partition)
+    if partition_by is not None:
+        return make_period_partitions(df, partition_by)
+    if partition_key is not None:
+        partitions = make_key_partitions(df, rows_per_partition, partition_key)
+    else:
+        partitions = make_partitions(df, rows_per_partition)
     names = resolve_partition_names(
         partitions,
         partition_names,
@@ -113,6 +135,35 @@ def create_partitions(
     return assign_ids_to_partitions(partitions, names)
 
 
+def make_key_partitions(df, rows_per_partition, partition_key):
+    """Splits `df`, sorted by key, into partitions holding the rows of one key
+    each
+    """
+    partitions = []
+    for _, key_df in _keys.split_by_key(df, partition_key):
+        partitions.extend(make_partitions(key_df, rows_per_partition))
+    return partitions
+
+
+def make_period_partitions(df, partition_by):
+    """Splits `df` into one partition per calendar period, named after the
+    period
+    """
+    index_name = get_index_name(df)
+    period_ids = _periods.get_period_ids(df[index_name], partition_by)
+    offsets = [0, *(np.flatnonzero(np.diff(period_ids)) + 1).tolist(), df.num_rows]
+
+    partitions = {}
+    for start, end in itertools.pairwise(offsets):
+        partition_name = make_period_partition_name(period_ids[start])
+        partitions[partition_name] = _slice_partition(df, start, end)
+    return partitions
+
+
+def make_period_partition_name(period_id):
+    return convert_int_to_partition_id(int(period_id) + PERIOD_ID_OFFSET)
+
+
 def resolve_partition_names(
     partitions, partition_names, *, strategy, all_partition_names=None
 ):
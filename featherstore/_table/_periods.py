@@ -0,0 +1,35 @@
+import warnings
+
+import pandas as pd
+import pyarrow as pa
+
+# Tables partitioned by a calendar period keep the rows of each period in one
+# partition, named after the period. The partition holding a row is then found
+# from the row alone, without searching the partition metadata. Periods of
+# timezone-aware indices follow UTC.
+
+SUPPORTED_PERIODS = ("h", "D", "W", "M", "Q", "Y")
+
+
+def format_period(partition_by):
+    """The canonical name of the period, or None if it isn't a supported one"""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            period = pd.DatetimeIndex(["2000-01-01"]).to_period(partition_by)
+    except (ValueError, TypeError):
+        return None
+    period = period.freqstr
+    if period.split("-")[0] not in SUPPORTED_PERIODS:
+        return None
+    return period
+
+
+def get_period_ids(values, partition_by):
+    """The ordinal of the period each value falls in"""
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        values = values.to_pandas(date_as_object=False)
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_convert(None)
+    return index.to_period(partition_by).asi8
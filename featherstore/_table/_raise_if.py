@@ -1,4 +1,5 @@
 import os
+from collections import Counter
 from decimal import Decimal
 from numbers import Integral, Real
 
@@ -15,15 +16,18 @@ from featherstore.exceptions import (
     ColumnLengthMismatchError,
     ColumnMismatchError,
     ColumnNotFoundError,
+    CompositeIndexError,
     DuplicateColumnNamesError,
     DuplicateIndexValuesError,
     ForbiddenTableNameError,
     IndexNameInColumnsError,
     IndexNameMismatchError,
     IndexTypeMismatchError,
+    PartitionKeyError,
     RowAlreadyExistsError,
     RowNotFoundError,
     TableAlreadyExistsError,
+    TableInBatchError,
     TableNotFoundError,
     UnsupportedIndexTypeError,
 )
@@ -38,6 +42,31 @@ def table_not_exists(table):
         raise TableNotFoundError(f"Table '{table.name}' not found")
 
 
+def table_in_batch(table):
+    if table._commit is not None:
+        raise TableInBatchError(
+            f"Table '{table.name}' can't be replaced, renamed or dropped in a batch"
+        )
+
+
+def table_has_composite_index(table, operation):
+    composite_index = common.get_composite_index(table)
+    if composite_index is not None:
+        levels = ", ".join(composite_index)
+        raise CompositeIndexError(
+            f"'{operation}' isn't supported for table '{table.name}', which has a "
+            f"composite index ({levels})"
+        )
+
+
+def table_is_partitioned_by_key(table, operation):
+    if common.get_partition_key(table) is not None:
+        raise PartitionKeyError(
+            f"'{operation}' isn't supported for table '{table.name}', which is "
+            f"partitioned by key"
+        )
+
+
 def table_already_exists(table_path):
     table_name = os.path.basename(table_path.replace("\\", "/"))
     if os.path.exists(table_path):
@@ -202,9 +231,8 @@ def to_not_provided(cols, to):
 
 def rows_items_not_all_same_type(rows):
     try:
-        rows = rows.values()
-        if rows is not None:
-            pa.array(rows)
+        if rows.values() is not None:
+            rows.to_arrow()
     except (TypeError, pa.ArrowInvalid, pa.ArrowTypeError):
         raise TypeError("'rows' items not all of same type")
 
@@ -390,8 +418,8 @@ def index_in_cols(cols, table_data):
 
 
 def col_names_contains_duplicates(cols):
-    col_list = list(cols)
-    duplicates = sorted({col for col in col_list if col_list.count(col) > 1})
+    col_counts = Counter(cols)
+    duplicates = sorted(col for col, count in col_counts.items() if count > 1)
     if duplicates:
         raise DuplicateColumnNamesError(
             f"Column names must be unique (duplicates={duplicates})"
@@ -406,6 +434,22 @@ def index_values_contains_duplicates(index):
             raise DuplicateIndexValuesError("Index values must be unique")
 
 
+def index_values_contains_duplicates_within_keys(index, keys):
+    if index is not None:
+        rows = pa.table({"key": keys, "index": index})
+        rows = _table_utils.convert_to_polars(rows)
+        contains_duplicates = rows.n_unique() < rows.height
+        if contains_duplicates:
+            raise DuplicateIndexValuesError(
+                "Index values must be unique within each key"
+            )
+
+
+def partition_keys_contains_nulls(keys):
+    if keys.null_count > 0:
+        raise ValueError("The partition key column can't contain null values")
+
+
 def not_connected():
     Connection._raise_if_not_connected()
 
@@ -2,6 +2,7 @@ import json
 from collections.abc import Iterable
 from collections.abc import Set as AbstractSet
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
@@ -14,6 +15,7 @@ from featherstore.exceptions import (
 
 SUPPORTED_TABLE_TYPES = (pd.DataFrame, pd.Series, pl.DataFrame, pl.Series, pa.Table)
 EDIT_TABLE_TYPES = (pd.DataFrame, pd.Series, pl.DataFrame, pa.Table)
+ARROW_ARRAY_TYPES = (pa.Array, pa.ChunkedArray)
 
 
 def concat_arrow_tables(*dfs):
@@ -93,6 +95,21 @@ def convert_to_arrow(df, as_array=False):
     return df
 
 
+def is_array(obj):
+    if isinstance(obj, (np.ndarray, pd.Series, pd.Index)):
+        return obj.ndim == 1 and obj.dtype != object
+    return isinstance(obj, (pl.Series, *ARROW_ARRAY_TYPES))
+
+
+def convert_to_arrow_array(values):
+    """Converts a 1-d array to Arrow without copying where the layout allows it."""
+    if isinstance(values, ARROW_ARRAY_TYPES):
+        return values
+    if isinstance(values, pl.Series):
+        return values.to_arrow()
+    return pa.array(values)
+
+
 def convert_to_polars(df, as_array=False):
     if isinstance(df, (pd.Series, pd.DataFrame, pd.Index)):
         df = convert_to_arrow(df, as_array=as_array)
@@ -243,7 +260,7 @@ def filter_arrow_table(df, rows, index_col_name):
 
 
 def _fetch_rows_in_list(df, index, rows):
-    if not rows:
+    if len(rows) == 0:
         return pa.table([[]] * len(df.column_names), schema=df.schema)
     row_indices = pa.compute.index_in(rows, value_set=index)
     _raise_if_rows_not_in_table(row_indices, rows, index)
@@ -251,6 +268,17 @@ def _fetch_rows_in_list(df, index, rows):
     return df
 
 
+def filter_arrow_table_by_values(df, rows, index_col_name):
+    """Keeps every row whose index is in `rows`, in stored order, for indices
+    that may hold a value more than once
+    """
+    index = df[index_col_name]
+    df = df.filter(pa.compute.is_in(index, value_set=rows))
+    row_indices = pa.compute.index_in(rows, value_set=df[index_col_name])
+    _raise_if_rows_not_in_table(row_indices, rows, df[index_col_name])
+    return df
+
+
 def _raise_if_rows_not_in_table(row_indices, rows, index):
     contains_null = row_indices.null_count > 0
     if contains_null:
@@ -325,6 +353,15 @@ def _fetch_last_row_idx(index):
     return len(index)
 
 
+def values_are_continuous(values):
+    if values.null_count > 0:
+        return False
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    steps = pa.compute.pairwise_diff(values)
+    return pa.compute.all(pa.compute.equal(steps, 1), min_count=0).as_py()
+
+
 def is_collection(obj):
     return isinstance(obj, Iterable) and not isinstance(obj, (str, bytes))
 
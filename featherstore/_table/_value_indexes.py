@@ -0,0 +1,29 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# The index of an indexed column is kept in a sidecar file per partition,
+# holding the values of the column sorted, next to the position of the row each
+# value is in. Positions count the rows in the partition file, dropped rows
+# included. The sidecars are listed in the manifest of each version like the
+# partition files, and only ever opened by reads with `where=`.
+INDEX_FOLDER_NAME = "indexes"
+
+
+def make_value_index(values):
+    """The values sorted, with the position of the row holding each"""
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    positions = pc.sort_indices(values)
+    return pa.table(
+        {"value": values.take(positions), "position": positions.cast(pa.uint32())}
+    )
+
+
+def find_positions(value_index, values):
+    """The positions of the rows holding any of `values`, in stored order"""
+    is_match = pc.is_in(value_index["value"], value_set=values)
+    positions = value_index["position"].filter(is_match)
+    return np.sort(positions.to_numpy().astype(np.int64))
@@ -0,0 +1,445 @@
+import contextlib
+import copy
+import os
+import pickle
+import time
+import uuid
+import weakref
+
+from featherstore import _utils
+from featherstore._metadata import (
+    METADATA_FOLDER_NAME,
+    Metadata,
+    MetadataOverlay,
+    MetadataSnapshot,
+)
+from featherstore._table._value_indexes import INDEX_FOLDER_NAME
+
+# Every commit to a table publishes a new version of it. The changes are
+# staged in memory until the commit is published. Partition files are never
+# overwritten: a rewritten partition gets a new file, and the manifest of each
+# version lists the file of every partition. Readers pin the published version
+# while they read, and files no longer in the current or any pinned version are
+# removed after each commit. The sidecar indexes of indexed columns are
+# versioned the same way, listed in the manifest by partition and column.
+#
+# The table and partition metadata of each version are never changed either.
+# Their items are appended to a database file shared by the versions, and the
+# manifest of each version holds the byte offset of every item it has. Once
+# the file holds more than twice as many items as the version, the items are
+# written to a new file instead. The manifest is written before the version
+# file is replaced, so a commit is published in one step and readers never
+# wait on a writer.
+VERSION_FILE_NAME = "version"
+MANIFEST_FOLDER_NAME = "manifests"
+READER_FOLDER_NAME = "readers"
+METADATA_NAMES = ("table", "partition")
+
+# Leases of readers that crashed are ignored after this many seconds
+LEASE_TIMEOUT = 60 * 60
+
+
+class Commit:
+    def __init__(self, version):
+        self.version = version
+        self.partitions = {}
+        self.files = {}
+        self.num_index_files = 0
+
+
+def read_version(table_path):
+    """The published version of the table"""
+    try:
+        return _read_pickle(_make_version_path(table_path))
+    except FileNotFoundError:  # Tables not committed to since versions were added
+        return -1
+
+
+def create(table_path):
+    metadata_folder = os.path.join(table_path, METADATA_FOLDER_NAME)
+    os.makedirs(metadata_folder)
+    _utils.mark_as_hidden(metadata_folder)
+
+
+def load_metadata(table_path, version=None):
+    """The table and partition metadata of `version`, by default the
+    published version
+    """
+    if version is None:
+        version = read_version(table_path)
+    manifest = _read_manifest(table_path, version)
+    return _load_metadata(table_path, manifest)
+
+
+def _load_metadata(table_path, manifest):
+    if manifest is None:  # Tables not committed to since versions were added
+        metadata = [Metadata(table_path, name) for name in METADATA_NAMES]
+        return tuple(
+            MetadataSnapshot(data._db_path, data.index._data) for data in metadata
+        )
+    db_path = _make_db_path(table_path, manifest["db"])
+    return tuple(
+        MetadataSnapshot(db_path, manifest["metadata"][name]) for name in METADATA_NAMES
+    )
+
+
+def make_file_name(partition_name, version):
+    if version <= 0:
+        return f"{partition_name}.feather"
+    return f"{partition_name}_{version}.feather"
+
+
+def new_partition_file(table, partition_name):
+    file_name = make_file_name(partition_name, table._commit.version)
+    table._commit.files[partition_name] = file_name
+    return file_name
+
+
+def new_index_file(table, partition_name, col):
+    # Column names aren't safe file names, so sidecars are numbered instead
+    commit = table._commit
+    file_name = f"{partition_name}_{commit.version}_{commit.num_index_files}.feather"
+    file_name = os.path.join(INDEX_FOLDER_NAME, file_name)
+    commit.num_index_files += 1
+    commit.files[(partition_name, col)] = file_name
+    return file_name
+
+
+def rename_index_file(table, partition_name, col, *, to):
+    """Lists the sidecar index of `col` as the index of the column `to`"""
+    index_files = get_index_files(table)
+    table._commit.files[(partition_name, to)] = index_files[(partition_name, col)]
+
+
+def get_staged_partitions(table):
+    if table._commit is None:
+        return {}
+    return table._commit.partitions
+
+
+def get_partition_files(table):
+    """The file of every partition, as of the version the table is pinned to"""
+    files = _get_files(table)
+    return {name: file for name, file in files.items() if isinstance(name, str)}
+
+
+def get_index_files(table):
+    """The sidecar index file of each indexed column of every partition, by
+    `(partition_name, col)`, as of the version the table is pinned to
+    """
+    files = _get_files(table)
+    return {key: file for key, file in files.items() if isinstance(key, tuple)}
+
+
+def _get_files(table):
+    if table._pinned_files is not None:
+        return table._pinned_files
+
+    if table._commit is None:
+        version = read_version(table._table_path)
+    else:
+        version = table._commit.version - 1
+    files = _read_manifest_files(table._table_path, version)
+    if table._commit is not None:
+        files.update(table._commit.files)
+    return _list_files(files, table._partition_data.keys())
+
+
+def make_partition_path(table, partition_name, files=None):
+    if files is None:
+        files = get_partition_files(table)
+    return os.path.join(table._table_path, files[partition_name])
+
+
+def _list_files(files, partition_names, indexed_cols=None):
+    partition_names = list(partition_names)
+    listed = {
+        name: files.get(name, make_file_name(name, 0)) for name in partition_names
+    }
+    # The sidecar indexes of dropped partitions and columns are left out
+    partition_names = set(partition_names)
+    for key, file_name in files.items():
+        if not isinstance(key, tuple):
+            continue
+        partition_name, col = key
+        if partition_name in partition_names and (
+            indexed_cols is None or col in indexed_cols
+        ):
+            listed[key] = file_name
+    return listed
+
+
+@contextlib.contextmanager
+def stage(table):
+    """Keeps the changes made to the table within the block in memory, where
+    they are only seen by the table itself until they are published. The
+    changes are made on top of the published version.
+    """
+    table_path = table._table_path
+    version = read_version(table_path)
+    table_data, partition_data = load_metadata(table_path, version)
+    table._commit = Commit(version + 1)
+    table._table_data = MetadataOverlay(table_data)
+    table._partition_data = MetadataOverlay(partition_data)
+    try:
+        yield
+    finally:
+        table._commit = None
+        table._table_data, table._partition_data = load_metadata(table_path)
+
+
+def publish(table, indexed_cols=()):
+    """Writes the staged metadata and publishes it as a new version. The staged
+    partitions and the sidecar indexes of `indexed_cols` must already be
+    written.
+    """
+    table_path = table._table_path
+    version = table._commit.version
+    _make_folder_path(table_path, MANIFEST_FOLDER_NAME)
+    previous_manifest = _read_manifest(table_path, version - 1)
+
+    files = _read_manifest_files(table_path, version - 1)
+    files.update(table._commit.files)
+    files = _list_files(files, table._partition_data.keys(), indexed_cols)
+    overlays = dict(zip(METADATA_NAMES, (table._table_data, table._partition_data)))
+    manifest = _write_metadata(table_path, version, previous_manifest, overlays)
+    manifest["files"] = files
+    _write_manifest(table_path, version, manifest)
+
+    _write_version(table_path, version)  # Published once the file is replaced
+    collect_garbage(table_path, version)
+
+
+def _write_metadata(table_path, version, previous_manifest, overlays):
+    num_items = sum(len(overlay.keys()) for overlay in overlays.values())
+    if previous_manifest is not None:
+        db_size = previous_manifest["db_size"]
+        db_size += sum(len(overlay.changes()[0]) for overlay in overlays.values())
+        if db_size <= 2 * num_items:
+            return _append_metadata(table_path, previous_manifest, overlays, db_size)
+    return _rewrite_metadata(table_path, version, overlays, num_items)
+
+
+def _append_metadata(table_path, previous_manifest, overlays, db_size):
+    db = previous_manifest["db"]
+    metadata = {}
+    with open(_make_db_path(table_path, db), "ab") as f:
+        for name, overlay in overlays.items():
+            byte_offsets = dict(previous_manifest["metadata"][name])
+            changes, deleted = overlay.changes()
+            for key in deleted:
+                byte_offsets.pop(key, None)
+            for key, value in changes.items():
+                byte_offsets[key] = _write_item(f, value)
+            metadata[name] = byte_offsets
+    return {"metadata": metadata, "db": db, "db_size": db_size}
+
+
+def _rewrite_metadata(table_path, version, overlays, num_items):
+    # Written to a file of its own, as older versions may still be read from
+    # the file they share
+    metadata = {}
+    with open(_make_db_path(table_path, version), "wb") as f:
+        for name, overlay in overlays.items():
+            items = overlay.read()
+            metadata[name] = {
+                key: _write_item(f, value) for key, value in items.items()
+            }
+    return {"metadata": metadata, "db": version, "db_size": num_items}
+
+
+def _write_item(f, value):
+    byte_offset = f.tell()
+    pickle.dump(value, f)
+    return byte_offset
+
+
+def discard(table):
+    """Removes the files written for a commit that won't be published"""
+    collect_garbage(table._table_path, read_version(table._table_path))
+
+
+def collect_garbage(table_path, version):
+    kept_versions = {version, *_get_pinned_versions(table_path)}
+    kept_files = set()
+    kept_dbs = set()
+    for kept_version in kept_versions:
+        manifest = _read_manifest(table_path, kept_version)
+        if manifest is None:  # Pinned before versions were added; keep everything
+            return
+        kept_files.update(manifest["files"].values())
+        kept_dbs.add(f"{manifest['db']}.db")
+
+    for file_name in os.listdir(table_path):
+        if file_name.endswith(".feather") and file_name not in kept_files:
+            _remove_file(os.path.join(table_path, file_name))
+    index_folder = os.path.join(table_path, INDEX_FOLDER_NAME)
+    if os.path.isdir(index_folder):
+        for file_name in os.listdir(index_folder):
+            file_name = os.path.join(INDEX_FOLDER_NAME, file_name)
+            if file_name.endswith(".feather") and file_name not in kept_files:
+                _remove_file(os.path.join(table_path, file_name))
+
+    manifest_folder = _make_folder_path(table_path, MANIFEST_FOLDER_NAME)
+    oldest_version = min(kept_versions)
+    for file_name in os.listdir(manifest_folder):
+        if file_name.isdigit():
+            is_kept = int(file_name) >= oldest_version
+        else:
+            is_kept = not file_name.endswith(".db") or file_name in kept_dbs
+        if not is_kept:
+            _remove_file(os.path.join(manifest_folder, file_name))
+
+
+def _remove_file(path):
+    try:
+        _utils._remove_path(path)
+    except PermissionError:  # Still mapped by a reader; removed by a later commit
+        pass
+
+
+@contextlib.contextmanager
+def pin(table):
+    """Yields a copy of the table that reads the version published when the
+    block is entered, however the table is changed while it is read
+    """
+    pinned_table, lease_path = pin_version(table)
+    try:
+        yield pinned_table
+    finally:
+        release(lease_path)
+        if pinned_table is not table:
+            close_metadata(pinned_table)
+
+
+def pin_version(table):
+    if table._pinned_files is not None or table._commit is not None:
+        return table, None  # Already pinned, or reading its own commit
+
+    table_path = table._table_path
+    if not os.path.exists(os.path.join(table_path, METADATA_FOLDER_NAME)):
+        return table, None  # Left for the read to report the missing table
+
+    while True:
+        version = read_version(table_path)
+        lease_path = _take_lease(table_path, version)
+        # Once the lease is taken while the version is still published, its
+        # files are kept by every later commit
+        if read_version(table_path) == version:
+            break
+        release(lease_path)
+
+    try:
+        return _load_version(table, version), lease_path
+    except BaseException:
+        release(lease_path)
+        raise
+
+
+def release_when_collected(obj, lease_path):
+    if lease_path is not None:
+        weakref.finalize(obj, release, lease_path)
+
+
+def release(lease_path):
+    if lease_path is not None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(lease_path)
+
+
+def _load_version(table, version):
+    # Only the manifest is read up front. The metadata of each partition is
+    # read as it's used
+    table_path = table._table_path
+    manifest = _read_manifest(table_path, version)
+    pinned_table = copy.copy(table)
+    metadata = _load_metadata(table_path, manifest)
+    pinned_table._table_data, pinned_table._partition_data = metadata
+    files = {} if manifest is None else manifest["files"]
+    pinned_table._pinned_files = _list_files(files, pinned_table._partition_data.keys())
+    return pinned_table
+
+
+def close_metadata(table):
+    """Closes the files of the metadata the table reads, before they're moved
+    or removed
+    """
+    for metadata in (table._table_data, table._partition_data):
+        if isinstance(metadata, MetadataSnapshot):
+            metadata.close()
+
+
+def _take_lease(table_path, version):
+    reader_folder = _make_folder_path(table_path, READER_FOLDER_NAME)
+    lease_path = os.path.join(reader_folder, uuid.uuid4().hex)
+    _write_pickle(lease_path, version)
+    return lease_path
+
+
+def _get_pinned_versions(table_path):
+    reader_folder = _make_folder_path(table_path, READER_FOLDER_NAME)
+    now = time.time()
+    versions = []
+    for entry in os.scandir(reader_folder):
+        if entry.name.endswith(".tmp"):
+            continue
+        try:
+            if now - entry.stat().st_mtime > LEASE_TIMEOUT:
+                continue
+            versions.append(_read_pickle(entry.path))
+        except FileNotFoundError:  # Released while listed
+            continue
+    return versions
+
+
+def _read_manifest_files(table_path, version):
+    manifest = _read_manifest(table_path, version)
+    return {} if manifest is None else dict(manifest["files"])
+
+
+def _read_manifest(table_path, version):
+    try:
+        return _read_pickle(_make_manifest_path(table_path, version))
+    except FileNotFoundError:
+        return None
+
+
+def _write_manifest(table_path, version, manifest):
+    _write_pickle(_make_manifest_path(table_path, version), manifest)
+
+
+def _write_version(table_path, version):
+    _write_pickle(_make_version_path(table_path), version)
+
+
+def _make_version_path(table_path):
+    return os.path.join(table_path, METADATA_FOLDER_NAME, VERSION_FILE_NAME)
+
+
+def _make_manifest_path(table_path, version):
+    return os.path.join(
+        table_path, METADATA_FOLDER_NAME, MANIFEST_FOLDER_NAME, str(version)
+    )
+
+
+def _make_db_path(table_path, db):
+    return _make_manifest_path(table_path, f"{db}.db")
+
+
+def _make_folder_path(table_path, folder_name):
+    path = os.path.join(table_path, METADATA_FOLDER_NAME, folder_name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _read_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _write_pickle(path, value):
+    # Written to a temp file first, so readers never see a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(value, f)
+    os.replace(tmp_path, path)
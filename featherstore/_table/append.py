@@ -1,16 +1,27 @@
+import numpy as np
 import pyarrow as pa
 
 from featherstore import _utils
-from featherstore._table import _partitions, _raise_if, _table_utils, common
+from featherstore._table import (
+    _composite,
+    _keys,
+    _partitions,
+    _raise_if,
+    _table_utils,
+    common,
+)
 from featherstore._utils import DEFAULT_ARROW_INDEX_NAME
 from featherstore.exceptions import AppendIndexError, MissingIndexError
 
 
-def can_append_table(table, df, warnings):
+def can_append_table(table, df, warnings, validate):
     _raise_if.not_connected_or_table_not_exists(table)
     _utils.raise_if_warnings_argument_is_not_valid(warnings)
+    _utils.raise_if_validate_argument_is_not_valid(validate)
 
     _raise_if.df_is_not_table_type(df, _table_utils.SUPPORTED_TABLE_TYPES)
+    if validate == "none":
+        return
 
     table_data = table._table_data
     index_name = table_data["index_name"]
@@ -23,20 +34,39 @@ def can_append_table(table, df, warnings):
     has_default_index = table_data["has_default_index"]
 
     index = _table_utils.get_index_if_exists(df, index_name)
+    partition_key = common.get_partition_key(table)
+    if partition_key is not None:
+        _raise_if_key_append_data_is_not_valid(
+            table, df, index, partition_key, validate
+        )
+        return
+
     index_is_provided = index is not None
+    is_sorted = validate == "cheap"
     if (not has_default_index or index_is_provided) and not common.index_is_default(
         index
     ):
         _raise_if_append_data_not_ordered_after_stored_data(
-            index, table._partition_data
+            index, table._partition_data, is_sorted=is_sorted
         )
 
     raise_if_index_not_exist(index, has_default_index)
-    _raise_if.index_values_contains_duplicates(index)
+    if validate == "full":
+        _raise_if.index_values_contains_duplicates(index)
+
 
+def split_index_levels(df):
+    """Moves the first level of an appended composite index into its column"""
+    return _composite.split_index_levels(df)
 
-def _raise_if_append_data_not_ordered_after_stored_data(index, partition_data):
-    append_data_start = pa.compute.min(index).as_py()
+
+def _raise_if_append_data_not_ordered_after_stored_data(
+    index, partition_data, *, is_sorted=False
+):
+    if is_sorted:
+        append_data_start = index[0].as_py()
+    else:
+        append_data_start = pa.compute.min(index).as_py()
     stored_data_end = _get_last_stored_value(partition_data)
     if append_data_start <= stored_data_end:
         raise AppendIndexError(
@@ -45,6 +75,37 @@ def _raise_if_append_data_not_ordered_after_stored_data(index, partition_data):
         )
 
 
+def _raise_if_key_append_data_is_not_valid(table, df, index, partition_key, validate):
+    raise_if_index_not_exist(index, has_default_index=False)
+    keys = _keys.get_key_column(df, partition_key)
+    _raise_if.partition_keys_contains_nulls(keys)
+    _raise_if_append_data_not_ordered_after_stored_keys(
+        index, keys, table._partition_data
+    )
+    if validate == "full":
+        _raise_if.index_values_contains_duplicates_within_keys(index, keys)
+
+
+def _raise_if_append_data_not_ordered_after_stored_keys(index, keys, partition_data):
+    # Each key is appended to on its own, so the rows only have to come after
+    # the stored rows of the same key
+    partition_data = partition_data.read()
+    last_partitions = _keys.get_last_partitions(partition_data)
+    rows = pa.table({"key": _keys.get_key_values(keys), "index": index})
+    first_rows = rows.group_by("key").aggregate([("index", "min")])
+    for key, append_data_start in zip(
+        first_rows["key"].to_pylist(), first_rows["index_min"].to_pylist()
+    ):
+        if key not in last_partitions:
+            continue
+        stored_data_end = partition_data[last_partitions[key]]["max"]
+        if append_data_start <= stored_data_end:
+            raise AppendIndexError(
+                f"New_data.index can't be <= old_data.index[-1] for key {key!r} "
+                f"({append_data_start} <= {stored_data_end})"
+            )
+
+
 def _get_last_stored_value(partition_data):
     df = partition_data
     last_partition_name = df.keys()[-1]
@@ -67,7 +128,7 @@ def format_default_index(table, df):
 
     append_data_start = stored_data_end + 1
     append_data_end = append_data_start + len(index_col)
-    formatted_index_col = pa.array(range(append_data_start, append_data_end))
+    formatted_index_col = pa.array(np.arange(append_data_start, append_data_end))
 
     df = df.set_column(0, DEFAULT_ARROW_INDEX_NAME, formatted_index_col)
     return df
@@ -78,7 +139,72 @@ def append_data(df, *, to):
     return df
 
 
-def create_partitions(df, rows_per_partition, last_partition_name):
+def get_last_partitions_of_keys(table, df):
+    """The last stored partition of each key in `df`"""
+    partition_key = common.get_partition_key(table)
+    partition_data = table._partition_data.read()
+    last_partitions = _keys.get_last_partitions(partition_data)
+    keys = _keys.get_key_values(df[partition_key]).unique().to_pylist()
+    return {key: last_partitions[key] for key in keys if key in last_partitions}
+
+
+def update_index_freq(table, df):
+    """Checks whether the index keeps its frequency after `df`, the last stored
+    partition with the appended data, is written back
+    """
+    stored_freq = common.get_index_freq(table)
+    if stored_freq is None:  # An irregular index stays irregular
+        return None
+
+    index_name = table._table_data["index_name"]
+    freq = common.infer_index_freq(df[index_name])
+    is_whole_table = table._table_data["num_partitions"] == 1
+    if is_whole_table or freq in (None, stored_freq):
+        return freq
+    return common.INFER_FREQ
+
+
+def create_partitions(
+    df, rows_per_partition, last_partition_name, *, partition_by=None
+):
     return _partitions.create_partitions(
-        df, rows_per_partition, last_partition_name, strategy="append"
+        df,
+        rows_per_partition,
+        last_partition_name,
+        strategy="append",
+        partition_by=partition_by,
     )
+
+
+def create_key_partitions(
+    df, rows_per_partition, last_partitions, all_partition_names, *, partition_key
+):
+    """Partitions the rows of each key in `df`. The rows of a stored key replace
+    the last partition of that key, and any extra partitions are named to come
+    right after it. New keys are added after the last partition.
+    """
+    index_name = _table_utils.get_index_name(df)
+    df = _keys.sort_by_key(df, partition_key, index_name)
+    key_dfs = dict(_keys.split_by_key(df, partition_key))
+
+    partitions = {}
+    for key, partition_name in last_partitions.items():
+        partitions.update(
+            _partitions.create_partitions(
+                key_dfs.pop(key),
+                rows_per_partition,
+                [partition_name],
+                strategy="insert",
+                all_partition_names=all_partition_names,
+            )
+        )
+
+    last_partition_name = max([*all_partition_names, *partitions])
+    for key_df in key_dfs.values():
+        key_partitions = _partitions.make_partitions(key_df, rows_per_partition)
+        names = _partitions.append_new_partition_ids(
+            len(key_partitions) + 1, [last_partition_name]
+        )
+        partitions.update(zip(names[1:], key_partitions))
+        last_partition_name = names[-1]
+    return dict(sorted(partitions.items()))
@@ -42,8 +42,6 @@ def _raise_if_new_index_type_is_not_valid(cols, table_data):
 
 
 def change_type(df, cols):
-    df = df.combine_chunks()
-
     schema = df.schema
     for col, dtype in cols.items():
         dtype = _convert_to_pa_dtype(dtype)
@@ -68,9 +66,21 @@ def _convert_to_pa_dtype(dtype):
     return dtype
 
 
-def create_partitions(df, rows_per_partition, partition_names=None):
+def create_partitions(
+    df,
+    rows_per_partition,
+    partition_names=None,
+    *,
+    partition_by=None,
+    partition_key=None,
+):
     return _partitions.create_partitions(
-        df, rows_per_partition, partition_names, strategy="grow"
+        df,
+        rows_per_partition,
+        partition_names,
+        strategy="grow",
+        partition_by=partition_by,
+        partition_key=partition_key,
     )
 
 
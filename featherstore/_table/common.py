@@ -5,11 +5,12 @@ import pandas as pd
 import pyarrow as pa
 from pyarrow import pandas_compat as pc
 
-from featherstore._table import _table_utils
+from featherstore._table import _bloom_filter, _dictionaries, _keys, _table_utils
 from featherstore._table._indexers import ColIndexer, RowIndexer
 from featherstore.exceptions import MultiTypeColumnError
 
 HAS_MULTI_TYPE_COLUMN = (pa.lib.ArrowTypeError, pa.lib.ArrowInvalid)
+INFER_FREQ = "infer"
 
 _STRING_ARROW_TYPES = {"string", "utf8", "large_string", "large_utf8"}
 _PANDAS_MAJOR = int(pd.__version__.split(".", 1)[0])
@@ -42,7 +43,21 @@ def format_cols_and_to_args(cols, to):
     return formatted_cols
 
 
-def format_table(df, index_name, warnings):
+def format_table(
+    df,
+    index_name,
+    warnings,
+    *,
+    assume_sorted=False,
+    schema=None,
+    dictionaries=None,
+    partition_key=None,
+):
+    if _has_stored_schema(df, schema) and (
+        assume_sorted or _is_sorted(df, index_name, partition_key)
+    ):
+        return df
+
     try:
         df = _table_utils.convert_to_arrow(df)
         new_metadata = json.dumps({"transposed": False})
@@ -55,11 +70,32 @@ def format_table(df, index_name, warnings):
     if index_name not in df.column_names:
         df = _make_default_index(df, index_name)
 
-    df = _sort_table_if_unsorted(df, index_name, warnings)
+    if partition_key is None:
+        df = _sort_table_if_unsorted(df, index_name, warnings, assume_sorted)
+    else:
+        df = _sort_table_by_key_if_unsorted(
+            df, partition_key, index_name, assume_sorted
+        )
     df = _format_pd_metadata(df, index_name)
+    if dictionaries:
+        df = _dictionaries.cast_cols(df, dictionaries)
     return df
 
 
+def _has_stored_schema(df, schema):
+    # A table formatted like the stored partitions can keep its metadata as is
+    if schema is None or not isinstance(df, pa.Table):
+        return False
+    return df.schema.equals(schema, check_metadata=True)
+
+
+def get_stored_schema(table):
+    try:
+        return table._table_data["schema"]
+    except KeyError:  # Tables written before the schema was kept in metadata
+        return None
+
+
 def _transpose_table_and_convert_to_arrow(df):
     if isinstance(df, pd.Series):
         df = df.to_frame()
@@ -82,8 +118,8 @@ def _make_default_index(df, index_name):
     return df
 
 
-def _sort_table_if_unsorted(df, index_name, warnings):
-    was_unsorted = not _is_sorted(df, index_name)
+def _sort_table_if_unsorted(df, index_name, warnings, assume_sorted=False):
+    was_unsorted = not assume_sorted and not _is_sorted(df, index_name)
     if was_unsorted:
         if warnings == "warn":
             _warnings.warn("Index is unsorted and will be sorted before storage")
@@ -93,6 +129,19 @@ def _sort_table_if_unsorted(df, index_name, warnings):
     return df
 
 
+def _sort_table_by_key_if_unsorted(df, partition_key, index_name, assume_sorted):
+    # Incoming rows are rarely grouped by key already, so regrouping them isn't
+    # warned about
+    was_unsorted = not assume_sorted and not _keys.is_sorted_by_key(
+        df, partition_key, index_name
+    )
+    if was_unsorted:
+        df = _keys.sort_by_key(df, partition_key, index_name)
+    new_metadata = json.dumps({"sorted": was_unsorted})
+    df = _add_featherstore_metadata(df, new_metadata)
+    return df
+
+
 def _add_featherstore_metadata(df, new_metadata):
     old_metadata = df.schema.metadata
     if old_metadata:
@@ -108,7 +157,9 @@ def _add_featherstore_metadata(df, new_metadata):
     return df
 
 
-def _is_sorted(df, index_name=None):
+def _is_sorted(df, index_name=None, partition_key=None):
+    if partition_key is not None:
+        return _keys.is_sorted_by_key(df, partition_key, index_name)
     if index_name:
         index = df[index_name]
     else:
@@ -262,18 +313,28 @@ def compute_rows_per_partition(df, target_size):
 
 
 def update_metadata(table, df, old_partition_names, **kwargs):
-    new_partition_metadata = _make_partition_metadata(df)
+    first_partition = next(iter(df.values()))
+    indexed_cols = get_indexed_cols(table)
+    indexed_cols = [col for col in indexed_cols if col in first_partition.column_names]
+
+    new_partition_metadata = _make_partition_metadata(
+        df,
+        bloom_filter=has_bloom_filters(table),
+        partition_key=get_partition_key(table),
+    )
     table_metadata = _compute_table_metadata_update(
         table, new_partition_metadata, old_partition_names
     )
-    first_partition = next(iter(df.values()))
     table_metadata["num_columns"] = first_partition.num_columns
     table_metadata["index_dtype"] = _table_utils.get_index_dtype(first_partition)
+    table_metadata["schema"] = first_partition.schema
+    table_metadata["indexed_cols"] = indexed_cols
+    table_metadata["dictionaries"] = update_dictionaries(table, df)
     table_metadata.update(kwargs)
     return table_metadata, new_partition_metadata
 
 
-def _make_partition_metadata(df):
+def _make_partition_metadata(df, *, bloom_filter=False, partition_key=None):
     metadata = {}
 
     first_partition = next(iter(df.values()))
@@ -284,10 +345,63 @@ def _make_partition_metadata(df):
             "max": _get_index_max(partition, index_col_name),
             "num_rows": partition.num_rows,
         }
+        if partition_key is not None:
+            data["key"] = _keys.get_partition_key_value(partition, partition_key)
+        if bloom_filter:
+            index = partition[index_col_name]
+            data["bloom_filter"] = _bloom_filter.make_bloom_filter(index)
         metadata[name] = data
     return metadata
 
 
+def get_dictionaries(table):
+    return _dictionaries.get_dictionaries(table._table_data)
+
+
+def update_dictionaries(table, partitions):
+    dictionaries = get_dictionaries(table)
+    return _dictionaries.update_dictionaries(dictionaries, partitions)
+
+
+def has_bloom_filters(table):
+    try:
+        return table._table_data["bloom_filter"]
+    except KeyError:  # Tables written before Bloom filters were added
+        return False
+
+
+def get_partition_by(table):
+    try:
+        return table._table_data["partition_by"]
+    except KeyError:  # Tables written before partitioning by period was added
+        return None
+
+
+def get_partition_key(table):
+    try:
+        return table._table_data["partition_key"]
+    except KeyError:  # Tables written before partitioning by key was added
+        return None
+
+
+def get_composite_index(table):
+    """The names of the levels of a composite index, or None"""
+    try:
+        is_composite = table._table_data["composite_index"]
+    except KeyError:  # Tables written before composite indices were added
+        return None
+    if not is_composite:
+        return None
+    return [get_partition_key(table), table._table_data["index_name"]]
+
+
+def get_indexed_cols(table):
+    try:
+        return table._table_data["indexed_cols"]
+    except KeyError:  # Tables that never had a column indexed
+        return []
+
+
 def _get_index_min(df, index_name):
     try:
         first_index_value = df[index_name][0].as_py()
@@ -352,15 +466,34 @@ def _update_num_partitions(dropped_partitions_data, new_partitions_data):
     return added - dropped
 
 
+def infer_index_freq(index):
+    is_datetime = pa.types.is_timestamp(index.type) or pa.types.is_date(index.type)
+    if not is_datetime:
+        return None
+    if len(index) < 3:  # Too short to tell, so leave it to the reader
+        return INFER_FREQ
+    index = pd.DatetimeIndex(index.to_pandas(date_as_object=False))
+    return index.inferred_freq
+
+
+def get_index_freq(table):
+    try:
+        return table._table_data["index_freq"]
+    except KeyError:  # Tables written before the freq was kept in metadata
+        return INFER_FREQ
+
+
+def reset_index_freq(table):
+    index_dtype = table._table_data["index_dtype"]
+    if _table_utils.typestring_is_temporal(index_dtype):
+        return INFER_FREQ
+    return None
+
+
 def index_is_default(index):
     if not pa.types.is_integer(index.type):
         return False
     if len(index) == 0:
         return True
-
-    default_rangeindex = pa.array(range(len(index)))
-    try:
-        return index.equals(default_rangeindex)
-    except TypeError:  # index is chunked array
-        default_rangeindex = pa.chunked_array([default_rangeindex])
-        return index.equals(default_rangeindex)
+    starts_at_zero = index[0].as_py() == 0
+    return starts_at_zero and _table_utils.values_are_continuous(index)
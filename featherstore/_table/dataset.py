@@ -0,0 +1,204 @@
+import itertools
+import os
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs, ipc
+
+from featherstore._table import _versions, common, read
+from featherstore._table._indexers import ColIndexer
+
+
+def can_make_dataset(table, mmap):
+    read.can_read_table(table, cols=None, rows=None, mmap=mmap)
+
+
+def can_register_duckdb(connection, name):
+    if not hasattr(connection, "register"):
+        raise TypeError(
+            f"'connection' must be a DuckDB connection (is type {type(connection)})"
+        )
+    if not isinstance(name, (str, type(None))):
+        raise TypeError(f"'name' must be a str or None (is type {type(name)})")
+
+
+def make_dataset(table, mmap):
+    table, lease = _versions.pin_version(table)
+    try:
+        dataset = _make_dataset(table, mmap)
+    except BaseException:
+        _versions.release(lease)
+        raise
+    # The files of the version stay pinned as long as the dataset is referenced
+    _versions.release_when_collected(dataset, lease)
+    return dataset
+
+
+def _make_dataset(table, mmap):
+    schema = read.get_arrow_schema(table, mmap)
+    partition_names = table._partition_data.keys()
+
+    datasets = []
+    for stores_index, names in _group_by_stored_index(table, partition_names, schema):
+        if stores_index:
+            dataset = _make_file_dataset(table, list(names), schema, mmap)
+        else:
+            dataset = _make_decoded_dataset(table, list(names), schema, mmap)
+        datasets.append(dataset)
+
+    if len(datasets) == 1:
+        return datasets[0]
+    return ds.dataset(datasets)
+
+
+def _group_by_stored_index(table, partition_names, schema):
+    if common.get_dictionaries(table):  # The files only hold the indices
+        return [(False, partition_names)]
+    index_name = table._table_data["index_name"]
+    if index_name not in schema.names:  # Default index, left out of the dataset
+        return [(True, partition_names)]
+
+    def stores_index(partition_name):
+        partition_data = table._partition_data[partition_name]
+        if "deletion_vector" in partition_data:
+            return False  # The dropped rows are still in the file
+        # Partitions written while the table had a default index don't store
+        # it, and tables written before the flag was kept always store it
+        return not partition_data.get("virtual_index", False)
+
+    return itertools.groupby(partition_names, key=stores_index)
+
+
+def _make_file_dataset(table, partition_names, schema, mmap):
+    index_name = table._table_data["index_name"]
+    files = _versions.get_partition_files(table)
+    paths = [_make_partition_path(table, name, files) for name in partition_names]
+    bounds = [
+        _make_partition_bounds(table._partition_data[name], index_name, schema)
+        for name in partition_names
+    ]
+    use_mmap = read.use_mmap(mmap)
+    return ds.FileSystemDataset.from_paths(
+        paths,
+        schema=schema,
+        format=ds.IpcFileFormat(),
+        filesystem=fs.LocalFileSystem(use_mmap=use_mmap),
+        partitions=bounds,
+    )
+
+
+def _make_decoded_dataset(table, partition_names, schema, mmap):
+    # The files don't hold the data as the dataset needs it, so these
+    # partitions are read with the index and dictionaries rebuilt instead, one
+    # at a time as the dataset scans them
+    index_name = table._table_data["index_name"]
+    bounds = [
+        _make_partition_bounds(table._partition_data[name], index_name, schema)
+        for name in partition_names
+    ]
+    handler = _DecodedPartitionHandler(table, schema, mmap)
+    return ds.FileSystemDataset.from_paths(
+        partition_names,
+        schema=schema,
+        format=ds.IpcFileFormat(),
+        filesystem=fs.PyFileSystem(handler),
+        partitions=bounds,
+    )
+
+
+class _DecodedPartitionHandler(fs.FileSystemHandler):
+    """A read-only file system holding a file for each partition of the
+    table, named by the partition, with its data as `read_arrow` reads it.
+    Only the last partition opened is kept in memory.
+    """
+
+    def __init__(self, table, schema, mmap):
+        self._table = table
+        self._schema = schema
+        self._mmap = mmap
+        self._last_opened = None, None
+
+    def get_type_name(self):
+        return "featherstore"
+
+    def normalize_path(self, path):
+        return path
+
+    def get_file_info(self, paths):
+        return [fs.FileInfo(path, fs.FileType.File) for path in paths]
+
+    def open_input_file(self, path):
+        partition_name, buffer = self._last_opened
+        if partition_name != path:
+            buffer = self._decode_partition(path)
+            self._last_opened = path, buffer
+        return pa.BufferReader(buffer)
+
+    def open_input_stream(self, path):
+        return self.open_input_file(path)
+
+    def _decode_partition(self, partition_name):
+        cols = ColIndexer(self._schema.names)
+        partitions = read.iter_partitions(
+            self._table, [partition_name], cols, self._mmap
+        )
+        partition = next(partitions).select(self._schema.names)
+        sink = pa.BufferOutputStream()
+        with ipc.new_file(sink, partition.schema) as writer:
+            writer.write_table(partition)
+        return sink.getvalue()
+
+    def get_file_info_selector(self, selector):
+        raise NotImplementedError("The partitions can only be read")
+
+    def create_dir(self, path, recursive):
+        raise NotImplementedError("The partitions can only be read")
+
+    def delete_dir(self, path):
+        raise NotImplementedError("The partitions can only be read")
+
+    def delete_dir_contents(self, path, missing_dir_ok):
+        raise NotImplementedError("The partitions can only be read")
+
+    def delete_root_dir_contents(self):
+        raise NotImplementedError("The partitions can only be read")
+
+    def delete_file(self, path):
+        raise NotImplementedError("The partitions can only be read")
+
+    def move(self, src, dest):
+        raise NotImplementedError("The partitions can only be read")
+
+    def copy_file(self, src, dest):
+        raise NotImplementedError("The partitions can only be read")
+
+    def open_output_stream(self, path, metadata):
+        raise NotImplementedError("The partitions can only be read")
+
+    def open_append_stream(self, path, metadata):
+        raise NotImplementedError("The partitions can only be read")
+
+
+def _make_partition_path(table, partition_name, files):
+    path = _versions.make_partition_path(table, partition_name, files)
+    return os.path.abspath(path)
+
+
+def _make_partition_bounds(partition_data, index_name, schema):
+    """An expression that holds for every row of the partition, which lets the
+    dataset skip partitions that can't match a filter on the index
+    """
+    has_index = index_name in schema.names
+    if not has_index or partition_data["num_rows"] == 0:
+        return ds.scalar(True)
+
+    index_type = schema.field(index_name).type
+    lower_bound = pa.scalar(partition_data["min"], type=index_type)
+    upper_bound = pa.scalar(partition_data["max"], type=index_type)
+    index = ds.field(index_name)
+    return (index >= lower_bound) & (index <= upper_bound)
+
+
+def register_duckdb(table, connection, name):
+    name = table.name if name is None else name
+    connection.register(name, make_dataset(table, mmap=None))
@@ -1,23 +1,36 @@
 import bisect
-import itertools
-import os
 
+import numpy as np
 import pyarrow as pa
 
-from featherstore import _utils
-from featherstore._table import _partitions, _raise_if, _table_utils
+from featherstore._table import (
+    _deletion_vectors,
+    _partitions,
+    _raise_if,
+    _table_utils,
+    _versions,
+    common,
+    read,
+)
 from featherstore._table._indexers import ColIndexer
 from featherstore._table.read import get_partition_names as _get_partition_names
 from featherstore.exceptions import (
     CannotDropAllColumnsError,
     CannotDropAllRowsError,
     ColumnNotFoundError,
+    CompositeIndexError,
+    PartitionKeyError,
 )
 
 
-def can_drop_rows_from_table(table, rows):
+def can_drop_rows_from_table(table, rows, deletion_vector=False):
     _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if.table_has_composite_index(table, "drop_rows")
+    _raise_if.table_is_partitioned_by_key(table, "drop_rows")
     _raise_if.rows_argument_is_not_valid(rows, table._table_data)
+    if not isinstance(deletion_vector, bool):
+        dtype = type(deletion_vector)
+        raise TypeError(f"'deletion_vector' must be a bool (is type {dtype})")
 
 
 def get_partition_names(table, rows):
@@ -26,6 +39,47 @@ def get_partition_names(table, rows):
     return partition_names
 
 
+def split_covered_partitions(table, rows):
+    """The partitions that a range of rows fully covers, which are dropped
+    without being read, and the other partitions holding rows to drop
+    """
+    partition_names = _get_partition_names(table, rows)
+    if not rows.keyword:
+        return [], partition_names
+
+    covered_partitions = []
+    other_partitions = []
+    for partition_name in partition_names:
+        partition_data = table._partition_data[partition_name]
+        if partition_data["num_rows"] == 0:  # Empty table
+            other_partitions.append(partition_name)
+        elif _range_covers(rows, partition_data):
+            covered_partitions.append(partition_name)
+        elif _range_overlaps(rows, partition_data):
+            other_partitions.append(partition_name)
+    return covered_partitions, other_partitions
+
+
+def _range_covers(rows, partition_data):
+    if rows.keyword == "before":
+        return partition_data["max"] <= rows[0]
+    if rows.keyword == "after":
+        return partition_data["min"] >= rows[0]
+    return partition_data["min"] >= rows[0] and partition_data["max"] <= rows[1]
+
+
+def _range_overlaps(rows, partition_data):
+    if rows.keyword == "before":
+        return partition_data["min"] <= rows[0]
+    if rows.keyword == "after":
+        return partition_data["max"] >= rows[0]
+    return partition_data["min"] <= rows[1] and partition_data["max"] >= rows[0]
+
+
+def add_adjacent_partition(table, partition_names):
+    return _get_adjacent_partition_name(table, partition_names)
+
+
 def _get_adjacent_partition_name(table, partitions_selected):
     """Fetches an extra partition name so we can use that partition when
     combining small partitions.
@@ -80,6 +134,100 @@ def _raise_if_all_rows_is_dropped(df):
         raise CannotDropAllRowsError("Can't drop all rows from stored table")
 
 
+def read_stored_indexes(table, partition_names):
+    """The index of each partition as it is stored, or None if a partition
+    doesn't store its index and so can't get a deletion vector
+    """
+    if table._table_data["has_default_index"]:
+        return None
+
+    index_name = table._table_data["index_name"]
+    files = _versions.get_partition_files(table)
+    indexes = {}
+    for partition_name in partition_names:
+        partition = read.read_stored_partition(table, partition_name, files)
+        if index_name not in partition.column_names:
+            return None
+        indexes[partition_name] = partition[index_name]
+    return indexes
+
+
+def mark_rows_as_deleted(table, rows, stored_indexes):
+    """Adds the rows to the deletion vectors of the partitions instead of
+    rewriting them. Returns the new metadata and the emptied partitions.
+    """
+    index_name = table._table_data["index_name"]
+    live_indexes = {}
+    for partition_name, index in stored_indexes.items():
+        partition_data = table._partition_data[partition_name]
+        index = pa.table({index_name: index})
+        live_indexes[partition_name] = _deletion_vectors.filter_deleted(
+            index, partition_data
+        )[index_name]
+
+    index = pa.table({index_name: pa.chunked_array(live_indexes.values())})
+    rows_to_drop = _table_utils.filter_arrow_table(index, rows, index_name)[index_name]
+
+    partition_metadata = {}
+    emptied_partitions = []
+    for partition_name, index in live_indexes.items():
+        dropped = pa.compute.is_in(index, value_set=rows_to_drop)
+        dropped = dropped.to_numpy(zero_copy_only=False)
+        if not dropped.any():
+            continue
+        partition_data = table._partition_data[partition_name]
+        if dropped.all():
+            emptied_partitions.append(partition_name)
+        else:
+            partition_metadata[partition_name] = _drop_from_partition_metadata(
+                partition_data, stored_indexes[partition_name], index, dropped
+            )
+
+    num_dropped = len(rows_to_drop)
+    if num_dropped == table._table_data["num_rows"]:
+        raise CannotDropAllRowsError("Can't drop all rows from stored table")
+    num_partitions = table._table_data["num_partitions"] - len(emptied_partitions)
+    table_metadata = {
+        "num_rows": table._table_data["num_rows"] - num_dropped,
+        "num_partitions": num_partitions,
+    }
+    return (table_metadata, partition_metadata), emptied_partitions
+
+
+def _drop_from_partition_metadata(partition_data, stored_index, index, dropped):
+    deleted = _deletion_vectors.get_deleted(partition_data)
+    if deleted is None:
+        deleted = np.zeros(len(stored_index), dtype=bool)
+    deleted = _deletion_vectors.add_deleted(deleted, dropped)
+
+    partition_data = dict(partition_data)
+    partition_data["deletion_vector"] = _deletion_vectors.make_deletion_vector(deleted)
+    index = index.filter(pa.array(~dropped))
+    partition_data["num_rows"] = len(index)
+    partition_data["min"] = index[0].as_py()
+    partition_data["max"] = index[-1].as_py()
+    return partition_data
+
+
+def can_compact_table(table):
+    _raise_if.not_connected_or_table_not_exists(table)
+
+
+def get_partitions_to_compact(table):
+    partition_data = table._partition_data.read()
+    return [name for name, data in partition_data.items() if "deletion_vector" in data]
+
+
+def compact_partitions(table, partition_names):
+    """Reads the partitions without their dropped rows, to be written back"""
+    df = read.read_table(table, partition_names)
+    partition_lengths = [
+        table._partition_data[name]["num_rows"] for name in partition_names
+    ]
+    partitions = _partitions.split_partitions(df, partition_lengths)
+    return dict(zip(partition_names, partitions, strict=True))
+
+
 def has_still_default_index(table, rows):
     has_default_index = table._table_data["has_default_index"]
     if not has_default_index:
@@ -101,6 +249,14 @@ def has_still_default_index(table, rows):
     return is_still_default
 
 
+def update_index_freq(table, rows):
+    stored_freq = common.get_index_freq(table)
+    drops_from_the_ends = rows.keyword in ("before", "after")
+    if drops_from_the_ends and stored_freq not in (None, common.INFER_FREQ):
+        return stored_freq
+    return common.reset_index_freq(table)
+
+
 def _idx_still_default_after_dropping_rows_before(rows, partition_metadata):
     first_stored_value = _partitions.get_first_stored_index_value(partition_metadata)
     before = rows[0]
@@ -131,11 +287,11 @@ def _idx_still_default_after_dropping_rows_between(rows, partition_metadata):
 
 def _idx_still_default_after_dropping_rows_list(rows, partition_metadata):
     last_stored_value = _partitions.get_last_stored_index_value(partition_metadata)
-    rows = sorted(rows)
-    last_row_value = rows[-1]
+    rows = rows.to_arrow().sort()
+    last_row_value = rows[-1].as_py()
 
     last_row_removed = last_row_value == last_stored_value
-    rows_are_continuous = all(a + 1 == b for a, b in itertools.pairwise(rows))
+    rows_are_continuous = _table_utils.values_are_continuous(rows)
     values_removed_only_from_end_of_table = last_row_removed and rows_are_continuous
     if values_removed_only_from_end_of_table:
         _has_still_default_index = True
@@ -154,6 +310,7 @@ def can_drop_cols_from_table(table, cols):
     raise_if = CheckDropCols(cols, table)
     raise_if.items_not_str()
     raise_if.index_is_dropped()
+    raise_if.partition_key_is_dropped()
     raise_if.cols_are_not_in_stored_data()
     raise_if.all_rows_are_dropped()
 
@@ -162,6 +319,8 @@ class CheckDropCols:
     def __init__(self, cols, table):
         self._table_path = table._table_path
         self._table_data = table._table_data
+        self._partition_key = common.get_partition_key(table)
+        self._composite_index = common.get_composite_index(table)
         self._cols = ColIndexer(cols)
 
         self._stored_cols = self._get_stored_cols()
@@ -180,6 +339,18 @@ class CheckDropCols:
     def index_is_dropped(self):
         _raise_if.index_in_cols(self._dropped_cols, self._table_data)
 
+    def partition_key_is_dropped(self):
+        if self._partition_key not in self._dropped_cols:
+            return
+        if self._composite_index is not None:
+            raise CompositeIndexError(
+                f"Can't drop the first level of the composite index "
+                f"({self._partition_key})"
+            )
+        raise PartitionKeyError(
+            f"Can't drop the partition key column ({self._partition_key})"
+        )
+
     def cols_are_not_in_stored_data(self):
         missing_cols = self._dropped_cols - self._stored_cols
         if missing_cols:
@@ -202,9 +373,16 @@ def drop_cols_from_data(df, cols):
     return df.drop(cols.values())
 
 
-def create_partitions(df, rows_per_partition, partition_names):
+def create_partitions(
+    df, rows_per_partition, partition_names, *, partition_by=None, partition_key=None
+):
     return _partitions.create_partitions(
-        df, rows_per_partition, partition_names, strategy="shrink"
+        df,
+        rows_per_partition,
+        partition_names,
+        strategy="shrink",
+        partition_by=partition_by,
+        partition_key=partition_key,
     )
 
 
@@ -213,16 +391,22 @@ def get_partitions_to_drop(df, partition_names):
     return names
 
 
-def drop_partitions(table, partitions):
-    for partition in partitions:
-        _delete_partition(table, partition)
-        _delete_partition_metadata(table, partition)
-
+def drop_covered_partitions(table, partitions, **kwargs):
+    """Drops whole partitions by only removing them from the metadata"""
+    if len(partitions) == table._table_data["num_partitions"]:
+        raise CannotDropAllRowsError("Can't drop all rows from stored table")
 
-def _delete_partition(table, partition):
-    partition_path = os.path.join(table._table_path, f"{partition}.feather")
-    _utils._remove_path(partition_path)
+    num_rows = sum(table._partition_data[name]["num_rows"] for name in partitions)
+    table_metadata = {
+        "num_rows": table._table_data["num_rows"] - num_rows,
+        "num_partitions": table._table_data["num_partitions"] - len(partitions),
+        **kwargs,
+    }
+    drop_partitions(table, partitions)
+    table._table_data.write(table_metadata)
 
 
-def _delete_partition_metadata(table, partition):
-    del table._partition_data[partition]
+def drop_partitions(table, partitions):
+    # The files are removed once no reader has the table version pinned
+    for partition in partitions:
+        del table._partition_data[partition]
@@ -9,6 +9,8 @@ from featherstore.exceptions import IndexMismatchError
 
 def can_insert_columns(table, df, idx, warnings):
     _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if.table_has_composite_index(table, "insert_columns")
+    _raise_if.table_is_partitioned_by_key(table, "insert_columns")
     _utils.raise_if_warnings_argument_is_not_valid(warnings)
     _raise_if.df_is_not_table_type(df, _table_utils.EDIT_TABLE_TYPES)
 
@@ -96,7 +98,11 @@ def _insert_columns_block(old_df, df, new_cols, index):
     return result
 
 
-def create_partitions(df, rows_per_partition, partition_names):
+def create_partitions(df, rows_per_partition, partition_names, *, partition_by=None):
     return _partitions.create_partitions(
-        df, rows_per_partition, partition_names, strategy="grow"
+        df,
+        rows_per_partition,
+        partition_names,
+        strategy="grow",
+        partition_by=partition_by,
     )
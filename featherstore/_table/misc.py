@@ -13,8 +13,9 @@ def can_init_table(table_name, store_name):
     _raise_if.table_name_is_forbidden(table_name)
 
 
-def can_rename_table(new_table_name, new_table_path):
+def can_rename_table(table, new_table_name, new_table_path):
     _raise_if.not_connected()
+    _raise_if.table_in_batch(table)
 
     _raise_if.table_name_is_not_str(new_table_name)
     _raise_if.table_name_is_forbidden(new_table_name)
@@ -22,11 +23,16 @@ def can_rename_table(new_table_name, new_table_path):
 
 
 def can_drop_table(table, warnings):
+    _raise_if.table_in_batch(table)
     _utils.raise_if_warnings_argument_is_not_valid(warnings)
     if not table.exists() and warnings == "warn":
         _warnings.warn(f"Table '{table.name}' not found")
 
 
+def can_start_batch(table):
+    _raise_if.not_connected_or_table_not_exists(table)
+
+
 def can_reorder_columns(table, cols):
     _raise_if.not_connected_or_table_not_exists(table)
 
@@ -1,14 +1,31 @@
+import bisect
 import os
 import platform
+from numbers import Integral
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 from pyarrow import ipc
 
-from featherstore._metadata import Metadata
-from featherstore._table import _raise_if, _table_utils
+from featherstore._table import (
+    _bloom_filter,
+    _composite,
+    _deletion_vectors,
+    _dictionaries,
+    _keys,
+    _partitions,
+    _periods,
+    _raise_if,
+    _table_utils,
+    _value_indexes,
+    _versions,
+    common,
+)
 from featherstore._table._indexers import ColIndexer, RowIndexer
+from featherstore.exceptions import IndexTypeMismatchError
 
 
 def can_read_table(table, cols, rows, mmap):
@@ -16,7 +33,10 @@ def can_read_table(table, cols, rows, mmap):
 
     _raise_if_mmap_is_not_bool_or_none(mmap)
 
-    _raise_if.rows_argument_is_not_valid(rows, table._table_data, allow_none=True)
+    if common.get_composite_index(table) is None:
+        _raise_if.rows_argument_is_not_valid(rows, table._table_data, allow_none=True)
+    else:
+        _raise_if_composite_rows_are_not_valid(table, rows)
 
     _raise_if.cols_argument_is_not_collection_or_none(cols)
     cols = ColIndexer(cols)
@@ -31,17 +51,281 @@ def _raise_if_mmap_is_not_bool_or_none(mmap):
         raise ValueError(f"'mmap' must be a bool or None (is {type(mmap)})")
 
 
+def _raise_if_composite_rows_are_not_valid(table, rows):
+    _raise_if.rows_argument_is_not_collection_or_none(rows)
+    if rows is None:
+        return
+
+    if isinstance(rows, dict):
+        keyword = next(iter(rows), None)
+        is_keyword = isinstance(keyword, str) and keyword.lower() in (
+            _composite.ROWS_KEYWORDS
+        )
+        if len(rows) != 1 or not is_keyword:
+            raise ValueError(
+                f"'rows' must hold one of {_composite.ROWS_KEYWORDS} as its key"
+            )
+        if keyword.lower() == "between" and len(rows[keyword]) != 2:
+            raise ValueError("'between' must be given a lower and an upper bound")
+        rows = [row for row in _composite.get_rows_bounds(rows) if row is not None]
+
+    rows = [_composite.as_prefix(row) for row in rows]
+    if any(len(row) not in (1, 2) for row in rows):
+        raise ValueError(
+            "Rows of a table with a composite index must be a value of its first "
+            "level, or a tuple of a value of each level"
+        )
+    key_type, _ = get_composite_index_types(table)
+    try:
+        pa.array([row[0] for row in rows], type=key_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        raise IndexTypeMismatchError(
+            f"'rows' type doesn't match the first level of the table index "
+            f"(dtype={key_type})"
+        ) from None
+    index = RowIndexer([row[1] for row in rows if len(row) == 2])
+    _raise_if.rows_argument_items_type_not_same_as_index(index, table._table_data)
+
+
+def get_composite_index_types(table):
+    partition_key, index_name = common.get_composite_index(table)
+    schema = select_schema(table, [partition_key, index_name], mmap=None)
+    key_type = schema.field(partition_key).type
+    if pa.types.is_dictionary(key_type):
+        key_type = key_type.value_type
+    return key_type, schema.field(index_name).type
+
+
+def format_rows_arg(table, rows):
+    index_levels = common.get_composite_index(table)
+    if rows is None or index_levels is None:
+        index_type = table._table_data["index_dtype"]
+        return common.format_rows_arg(rows, to_dtype=index_type)
+
+    partition_key, index_name = index_levels
+    key_type, index_type = get_composite_index_types(table)
+    return _composite.CompositeRows(
+        rows,
+        partition_key=partition_key,
+        index_name=index_name,
+        key_type=key_type,
+        index_type=index_type,
+    )
+
+
+def add_index_levels_to_cols(table, cols):
+    """The first level of a composite index is always read, like the index"""
+    index_levels = common.get_composite_index(table)
+    if index_levels is not None and index_levels[0] not in cols:
+        cols.insert(0, index_levels[0])
+    return cols
+
+
+def can_filter_where(table, where):
+    if where is None:
+        return
+    if not isinstance(where, dict):
+        raise TypeError(f"'where' must be a dict or None (is type {type(where)})")
+    for col in where:
+        if not isinstance(col, str):
+            raise TypeError(f"Keys in 'where' must be of type str (is {type(col)})")
+    _raise_if.cols_not_in_table(list(where), table._table_data)
+
+    schema = select_schema(table, list(where), mmap=None)
+    for col, values in where.items():
+        try:
+            _make_where_values(values, schema.field(col).type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            raise TypeError(
+                f"Values in 'where' must match the type of column {col!r} "
+                f"({schema.field(col).type})"
+            ) from None
+
+
+def format_where_arg(table, where):
+    if not where:
+        return {}
+    schema = select_schema(table, list(where), mmap=None)
+    return {
+        col: _make_where_values(values, schema.field(col).type)
+        for col, values in where.items()
+    }
+
+
+def _make_where_values(values, dtype):
+    if not _table_utils.is_collection(values):
+        values = [values]
+    if pa.types.is_dictionary(dtype):
+        dtype = dtype.value_type
+    return pa.array(list(values), type=dtype)
+
+
+def can_read_iloc(table, iloc, rows, where):
+    if iloc is None:
+        return
+    if rows is not None or where:
+        raise ValueError("'iloc' can't be combined with 'rows' or 'where'")
+
+    if isinstance(iloc, slice):
+        _raise_if_iloc_slice_is_not_valid(iloc)
+    elif isinstance(iloc, (list, np.ndarray)):
+        _raise_if_positions_are_not_valid(iloc, table._table_data["num_rows"])
+    else:
+        raise TypeError(f"'iloc' must be a slice, list or array (is type {type(iloc)})")
+
+
+def _raise_if_iloc_slice_is_not_valid(iloc):
+    for bound in (iloc.start, iloc.stop):
+        is_int = isinstance(bound, Integral) and not isinstance(bound, bool)
+        if not (is_int or bound is None):
+            raise TypeError(f"'iloc' bounds must be ints (is type {type(bound)})")
+    if iloc.step not in (None, 1):
+        raise ValueError(f"'iloc' slices must have a step of 1 (is {iloc.step})")
+
+
+def _raise_if_positions_are_not_valid(positions, num_rows):
+    positions = np.asarray(positions)
+    if not positions.size:
+        return
+    if positions.dtype.kind not in "iu":
+        raise TypeError(f"'iloc' positions must be ints (is {positions.dtype})")
+    for position in (positions.min(), positions.max()):
+        if not -num_rows <= position < num_rows:
+            raise IndexError(
+                f"Position {position} is out of bounds for a table with {num_rows} rows"
+            )
+
+
+def can_limit_rows(limit):
+    is_int = isinstance(limit, Integral) and not isinstance(limit, bool)
+    if not (is_int or limit is None):
+        raise TypeError(f"'limit' must be an int or None (is type {type(limit)})")
+
+
+def can_read_head_or_tail(n):
+    can_limit_rows(n)
+    if n is None or n < 0:
+        raise ValueError(f"'n' must be a non-negative int (is {n})")
+
+
+def can_convert_to_pandas(low_memory):
+    if not isinstance(low_memory, bool):
+        raise TypeError(f"'low_memory' must be a bool (is {type(low_memory)})")
+
+
 def get_partition_names(table, rows):
     partition_data = table._partition_data
     if rows is None:
         rows = RowIndexer(None)
 
     partition_names = partition_data.keys()
-    if rows.values():
+    partition_by = common.get_partition_by(table)
+    if isinstance(rows, _composite.CompositeRows):
+        partition_names = _composite_filtering(rows, partition_names, partition_data)
+    elif rows.values() and partition_by is not None:
+        partition_names = _period_filtering(rows, partition_names, partition_by)
+    elif rows.values() and common.get_partition_key(table) is not None:
+        partition_names = _overlap_filtering(rows, partition_names, partition_data)
+    elif rows.values():
         partition_names = _predicate_filtering(rows, partition_names, partition_data)
     return partition_names
 
 
+def get_partition_names_between(table, low, high):
+    """The partitions that may hold index values from `low` to `high`, where
+    None leaves that end open
+    """
+    if (low is None and high is None) or table._table_data["num_rows"] == 0:
+        return table._partition_data.keys()
+
+    if low is None:
+        rows = {"before": [high]}
+    elif high is None:
+        rows = {"after": [low]}
+    else:
+        rows = {"between": [low, high]}
+    index_type = table._table_data["index_dtype"]
+    rows = common.format_rows_arg(rows, to_dtype=index_type)
+    return get_partition_names(table, rows)
+
+
+def _period_filtering(rows, partition_names, partition_by):
+    # The partitions are named after their period, so the ones holding the rows
+    # are found from the names alone
+    if rows.keyword == "before":
+        start = 0
+        end = _last_partition_up_to(rows[0], partition_names, partition_by)
+    elif rows.keyword == "after":
+        start = _first_partition_from(rows[0], partition_names, partition_by)
+        end = len(partition_names) - 1
+    elif rows.keyword == "between":
+        start = _first_partition_from(rows[0], partition_names, partition_by)
+        end = _last_partition_up_to(rows[1], partition_names, partition_by)
+    else:  # When a list of rows is provided
+        start = _first_partition_from(rows.min(), partition_names, partition_by)
+        end = _last_partition_up_to(rows.max(), partition_names, partition_by)
+
+    # Rows outside of the stored periods still read the nearest partition
+    start = min(start, len(partition_names) - 1)
+    end = max(end, 0)
+    start, end = min(start, end), max(start, end)
+    return partition_names[start : end + 1]
+
+
+def _first_partition_from(target, partition_names, partition_by):
+    partition_name = _get_period_partition_name(target, partition_by)
+    return bisect.bisect_left(partition_names, partition_name)
+
+
+def _last_partition_up_to(target, partition_names, partition_by):
+    partition_name = _get_period_partition_name(target, partition_by)
+    return bisect.bisect_right(partition_names, partition_name) - 1
+
+
+def _get_period_partition_name(target, partition_by):
+    (period_id,) = _periods.get_period_ids([target], partition_by)
+    return _partitions.make_period_partition_name(period_id)
+
+
+def _overlap_filtering(rows, partition_names, partition_data):
+    # The index ranges of partitions of different keys overlap, so every
+    # partition is checked on its own
+    low, high = None, None
+    if rows.keyword == "before":
+        high = rows[0]
+    elif rows.keyword == "after":
+        low = rows[0]
+    elif rows.keyword == "between":
+        low, high = rows[0], rows[1]
+    else:  # When a list of rows is provided
+        low, high = rows.min(), rows.max()
+
+    overlapping_names = [
+        name
+        for name in partition_names
+        if _partition_overlaps(partition_data[name], low, high)
+    ]
+    # Still read one partition, so rows not in the table are reported
+    return overlapping_names or partition_names[:1]
+
+
+def _partition_overlaps(partition_data, low, high):
+    if partition_data["num_rows"] == 0:
+        return False
+    is_after_low = low is None or partition_data["max"] >= low
+    is_before_high = high is None or partition_data["min"] <= high
+    return is_after_low and is_before_high
+
+
+def _composite_filtering(rows, partition_names, partition_data):
+    # The composite bounds of each partition are its key and index range
+    overlapping_names = [
+        name for name in partition_names if rows.overlaps(partition_data[name])
+    ]
+    # Still read one partition, so rows not in the table are reported
+    return overlapping_names or partition_names[:1]
+
+
 def _predicate_filtering(rows, partition_names, partition_data):
     if rows.keyword == "before":
         start = 0
@@ -57,8 +341,8 @@ def _predicate_filtering(rows, partition_names, partition_data):
         start = _binary_search(target_start, partition_names, partition_data)
         end = _binary_search(target_end, partition_names, partition_data)
     else:  # When a list of rows is provided
-        start = _binary_search(min(rows.values()), partition_names, partition_data)
-        end = _binary_search(max(rows.values()), partition_names, partition_data)
+        start = _binary_search(rows.min(), partition_names, partition_data)
+        end = _binary_search(rows.max(), partition_names, partition_data)
 
     partition_names = partition_names[start : end + 1]
     return partition_names
@@ -98,7 +382,94 @@ def _row_after_candidate(target, candidate):
     return target <= candidate["min"]
 
 
-def read_table(table, partition_names, cols=None, rows=None, mmap=None):
+def skip_partitions_without_rows(table, partition_names, rows):
+    # Index ranges only narrow a list of rows down to the partitions between
+    # the smallest and the largest row, so the Bloom filters are checked too
+    is_row_list = rows.values() is not None and not rows.keyword
+    if not is_row_list or not common.has_bloom_filters(table):
+        return partition_names
+    if isinstance(rows, _composite.CompositeRows):
+        return partition_names
+
+    partition_data = [table._partition_data[name] for name in partition_names]
+    if any(data["num_rows"] == 0 for data in partition_data):
+        return partition_names
+
+    index_type = pa.type_for_alias(table._table_data["index_dtype"])
+    rows = rows.to_arrow().cast(index_type)
+    if common.get_partition_key(table) is not None:
+        return _skip_key_partitions_without_rows(partition_names, partition_data, rows)
+    mins = pa.array([data["min"] for data in partition_data], type=index_type)
+    # Partitions don't overlap, so each row can only be in the last partition
+    # starting at or before it
+    positions = np.searchsorted(
+        mins.to_numpy(zero_copy_only=False),
+        rows.to_numpy(zero_copy_only=False),
+        side="right",
+    )
+    positions = positions - 1
+
+    kept_names = []
+    for position in np.unique(positions[positions >= 0]):
+        data = partition_data[position]
+        candidates = rows.filter(pa.array(positions == position))
+        if _bloom_filter.might_contain(data["bloom_filter"], candidates).any():
+            kept_names.append(partition_names[position])
+    # Still read one partition, so rows not in the table are reported
+    return kept_names or partition_names[:1]
+
+
+def _skip_key_partitions_without_rows(partition_names, partition_data, rows):
+    # Partitions of different keys overlap, so every row is checked against
+    # every partition
+    kept_names = [
+        name
+        for name, data in zip(partition_names, partition_data)
+        if _bloom_filter.might_contain(data["bloom_filter"], rows).any()
+    ]
+    return kept_names or partition_names[:1]
+
+
+def locate_positions(table, iloc):
+    """Finds the partitions holding the rows at the `iloc` positions, and
+    the positions relative to the first row of those partitions
+    """
+    partition_names = table._partition_data.keys()
+    partition_data = table._partition_data.read()
+    num_rows = [partition_data[name]["num_rows"] for name in partition_names]
+    offsets = np.cumsum([0, *num_rows])
+
+    if isinstance(iloc, slice):
+        start, stop, _ = iloc.indices(offsets[-1])
+        stop = max(start, stop)
+        first = np.searchsorted(offsets, start, side="right") - 1
+        last = np.searchsorted(offsets, stop, side="left")
+        first = min(first, len(partition_names) - 1)
+        last = max(last, first + 1)  # Still read one partition for the schema
+        offset = offsets[first]
+        return partition_names[first:last], slice(start - offset, stop - offset)
+
+    positions = np.asarray(iloc, dtype=np.int64)
+    positions[positions < 0] += offsets[-1]
+    partition_ids = np.searchsorted(offsets, positions, side="right") - 1
+    read_ids = np.unique(partition_ids) if len(positions) else np.array([0])
+    # Offsets of the partitions once only the read ones are combined
+    read_offsets = np.cumsum([0, *np.asarray(num_rows)[read_ids][:-1]])
+    shift = read_offsets - offsets[read_ids]
+    positions = positions + shift[np.searchsorted(read_ids, partition_ids)]
+    return [partition_names[idx] for idx in read_ids], positions
+
+
+def read_table(
+    table,
+    partition_names,
+    cols=None,
+    rows=None,
+    mmap=None,
+    where=None,
+    limit=None,
+    iloc=None,
+):
     if cols is None:
         cols = ColIndexer(None)
     if rows is None:
@@ -106,34 +477,195 @@ def read_table(table, partition_names, cols=None, rows=None, mmap=None):
     index_name = table._table_data["index_name"]
     if cols.values() is None:
         cols = ColIndexer(table._table_data["columns"])
-    dfs = _read_partitions(partition_names, table._table_path, cols, mmap)
-    df = _combine_partitions(dfs)
-    df = _filter_table_rows(df, rows, index_name)
+
+    is_row_list = rows.values() is not None and not rows.keyword
+    if limit is not None and not is_row_list and iloc is None:
+        df = _read_first_rows(table, partition_names, cols, rows, where, limit, mmap)
+        return _limit_rows(df, limit)
+
+    dfs = list(_iter_partitions(table, partition_names, cols, where, mmap))
+    if common.get_partition_key(table) is not None:
+        df = _filter_key_partitions(dfs, rows, index_name)
+    else:
+        df = _combine_partitions(dfs)
+        df = _filter_table_rows(df, rows, index_name)
+    if iloc is not None:
+        df = _take_positions(df, iloc)
+    if limit is not None:
+        df = _limit_rows(df, limit)
     return df
 
 
-def _read_partitions(partition_names, table_path, cols, mmap):
-    cols = __add_index_to_cols(cols, table_path)
+def _filter_key_partitions(partitions, rows, index_col_name):
+    """Filters the partitions of a table partitioned by key, where the index is
+    only sorted within each partition. A list of rows selects every row holding
+    one of the values, in stored order.
+    """
+    if rows.values() is None or rows.keyword:
+        partitions = [
+            _filter_table_rows(partition, rows, index_col_name)
+            for partition in partitions
+        ]
+        return _combine_partitions(partitions)
 
-    partitions = []
-    for partition_name in partition_names:
-        partition_path = os.path.join(table_path, f"{partition_name}.feather")
-        partition = __read_feather(partition_path, cols, mmap)
-        partitions.append(partition)
-    return partitions
+    df = _combine_partitions(partitions)
+    if isinstance(rows, _composite.CompositeRows):
+        return rows.filter(df)
+    values = rows.to_arrow().cast(df.schema.field(index_col_name).type)
+    return _table_utils.filter_arrow_table_by_values(df, values, index_col_name)
+
+
+def _iter_partitions(table, partition_names, cols, where, mmap):
+    if where:
+        return _iter_matching_rows(table, partition_names, cols, where, mmap)
+    return iter_partitions(table, partition_names, cols, mmap)
+
+
+def _read_first_rows(table, partition_names, cols, rows, where, limit, mmap):
+    """Reads partitions from the start, or from the end if `limit` is negative,
+    until `limit` rows are found
+    """
+    index_name = table._table_data["index_name"]
+    from_end = limit < 0
+    if from_end:
+        partition_names = partition_names[::-1]
+
+    dfs = []
+    num_rows = 0
+    for partition in _iter_partitions(table, partition_names, cols, where, mmap):
+        partition = _filter_table_rows(partition, rows, index_name)
+        dfs.append(partition)
+        num_rows += partition.num_rows
+        if num_rows >= abs(limit):
+            break
+
+    if from_end:
+        dfs.reverse()
+    return _combine_partitions(dfs)
 
 
-def __add_index_to_cols(cols, table_path):
-    index_col = Metadata(table_path, "table")["index_name"]
+def _take_positions(df, iloc):
+    if isinstance(iloc, slice):
+        return df.slice(iloc.start, iloc.stop - iloc.start)
+    return df.take(iloc)
+
+
+def _limit_rows(df, limit):
+    if limit < 0:
+        return df.slice(max(df.num_rows + limit, 0))
+    return df.slice(0, limit)
+
+
+def iter_partitions(table, partition_names, cols, mmap):
+    table_data = table._table_data.read()
+    cols = __add_index_to_cols(cols, table_data["index_name"])
+    dictionaries = _dictionaries.get_dictionaries(table_data)
+    files = _versions.get_partition_files(table)
+
+    for partition_name in partition_names:
+        partition_data = table._partition_data[partition_name]
+        partition = read_stored_partition(table, partition_name, files, mmap)
+        partition = _deletion_vectors.filter_deleted(partition, partition_data)
+        partition = _dictionaries.decode_cols(partition, dictionaries)
+        if table_data["index_name"] not in partition.column_names:
+            partition = _add_virtual_index(partition, partition_data, table_data)
+        yield partition.select(cols.values())
+
+
+def read_stored_partition(table, partition_name, files, mmap=None):
+    """The partition as it is stored, including the rows dropped with a
+    deletion vector
+    """
+    staged_partitions = _versions.get_staged_partitions(table)
+    if partition_name in staged_partitions:  # Not yet written to disk
+        partition = pa.Table.from_batches([staged_partitions[partition_name]])
+        return _dictionaries.encode_cols(partition, common.get_dictionaries(table))
+    path = _versions.make_partition_path(table, partition_name, files)
+    return __read_feather(path, mmap)
+
+
+def _iter_matching_rows(table, partition_names, cols, where, mmap):
+    indexed_cols = [col for col in where if col in common.get_indexed_cols(table)]
+    partition_data = table._partition_data
+    partition_key = common.get_partition_key(table)
+    if partition_key in where:  # The partitions of other keys are never opened
+        key_partition_names = _keys.filter_partitions_by_key(
+            partition_names, partition_data, where[partition_key]
+        )
+        partition_names = key_partition_names or partition_names[:1]
+    index_files = _versions.get_index_files(table) if indexed_cols else {}
+    staged_partitions = _versions.get_staged_partitions(table)
+    positions = {}
+    for name in partition_names:
+        if name in staged_partitions:  # Only indexed once it is written
+            positions[name] = None
+            continue
+        positions[name] = _find_matching_rows(
+            table, name, index_files, indexed_cols, where, mmap
+        )
+    # Partitions the indexes rule out are never opened
+    matching_names = [
+        name
+        for name in partition_names
+        if positions[name] is None or len(positions[name]) > 0
+    ]
+    if not matching_names:  # Still read one partition to get an empty table
+        matching_names = partition_names[:1]
+
+    cols = __add_index_to_cols(cols, table._table_data["index_name"])
+    read_cols = ColIndexer([*cols.values(), *(col for col in where if col not in cols)])
+    partitions = iter_partitions(table, matching_names, read_cols, mmap)
+    for name, partition in zip(matching_names, partitions):
+        filtered_cols = where
+        if positions[name] is not None:
+            partition = partition.take(positions[name])
+            filtered_cols = [col for col in where if col not in indexed_cols]
+        for col in filtered_cols:
+            partition = partition.filter(pc.is_in(partition[col], where[col]))
+        yield partition.select(cols.values())
+
+
+def _find_matching_rows(table, partition_name, index_files, indexed_cols, where, mmap):
+    positions = None
+    for col in indexed_cols:
+        path = os.path.join(table._table_path, index_files[(partition_name, col)])
+        value_index = _read_ipc_table(path, use_mmap(mmap))
+        col_positions = _value_indexes.find_positions(value_index, where[col])
+        if positions is None:
+            positions = col_positions
+        else:
+            positions = np.intersect1d(positions, col_positions, assume_unique=True)
+    if positions is None:
+        return None
+    # The sidecars count the dropped rows still in the partition file
+    deleted = _deletion_vectors.get_deleted(table._partition_data[partition_name])
+    if deleted is not None:
+        positions = _deletion_vectors.remap_positions(positions, deleted)
+    return positions
+
+
+def __add_index_to_cols(cols, index_col):
     if index_col not in cols:
         cols.insert(0, index_col)
     return cols
 
 
-def __read_feather(path, cols, mmap):
-    use_mmap = mmap if mmap is not None else platform.system() != "Windows"
-    table = _read_ipc_table(path, use_mmap)
-    return table.select(cols.values())
+def __read_feather(path, mmap):
+    return _read_ipc_table(path, use_mmap(mmap))
+
+
+def use_mmap(mmap):
+    return mmap if mmap is not None else platform.system() != "Windows"
+
+
+def _add_virtual_index(partition, partition_data, table_data):
+    # Partitions written while the table had a default index don't store it.
+    # Their index is the running row position, starting at the partition min.
+    start = partition_data["min"] or 0
+    positions = np.arange(start, start + partition.num_rows)
+    index_type = pa.type_for_alias(table_data["index_dtype"])
+    index = pa.array(positions, type=index_type)
+    return partition.add_column(0, table_data["index_name"], index)
 
 
 def _read_ipc_table(path, use_mmap):
@@ -154,7 +686,9 @@ def _combine_partitions(partitions):
 
 def _filter_table_rows(df, rows, index_col_name):
     should_be_filtered = rows.values() is not None
-    if should_be_filtered:
+    if should_be_filtered and isinstance(rows, _composite.CompositeRows):
+        df = rows.filter(df)
+    elif should_be_filtered:
         df = _table_utils.filter_arrow_table(df, rows, index_col_name)
     return df
 
@@ -164,11 +698,96 @@ def drop_default_index(df, index_col_name):
     return df
 
 
-def convert_table_to_pandas(df):
+def get_arrow_schema(table, mmap=None):
+    stored_cols = table._table_data["columns"]
+    if table._table_data["has_default_index"]:
+        stored_cols = stored_cols[1:]
+    return select_schema(table, stored_cols, mmap)
+
+
+def select_schema(table, cols, mmap):
+    schema = common.get_stored_schema(table)
+    if schema is None:  # Tables written before the schema was kept in metadata
+        stored_cols = ColIndexer(table._table_data["columns"])
+        first_partition_name = table._partition_data.keys()[:1]
+        partitions = iter_partitions(table, first_partition_name, stored_cols, mmap)
+        schema = next(partitions).schema
+
+    fields = [schema.field(col) for col in cols]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def stream_table(table, partition_names, cols, rows, mmap, lease=None):
+    index_name = table._table_data["index_name"]
+    drop_index = table._table_data["has_default_index"] and _starts_at_zero(rows)
+
+    cols = __add_index_to_cols(cols, index_name)
+    if drop_index:
+        cols = ColIndexer(cols.values()[1:])
+    schema = select_schema(table, cols.values(), mmap)
+
+    def read_batches():
+        read_cols = ColIndexer(cols.values())
+        partitions = iter_partitions(table, partition_names, read_cols, mmap)
+        try:
+            for partition in partitions:
+                partition = _filter_table_rows(partition, rows, index_name)
+                partition = partition.select(schema.names)
+                for batch in partition.to_batches():
+                    yield pa.RecordBatch.from_arrays(batch.columns, schema=schema)
+        finally:
+            _versions.release(lease)
+
+    return pa.RecordBatchReader.from_batches(schema, read_batches())
+
+
+def _starts_at_zero(rows):
+    # Whether a range of a default index starts at its first row, and so is
+    # still a default index
+    if rows.values() is None or rows.keyword == "before":
+        return True
+    return rows[0] <= 0
+
+
+def make_batch_reader(df):
+    return pa.RecordBatchReader.from_batches(df.schema, df.to_batches())
+
+
+def make_default_index(table):
+    num_rows = table._table_data["num_rows"]
+    return pd.RangeIndex(num_rows)
+
+
+def is_row_range(rows):
+    # Filter keywords select stored rows without gaps and in stored order
+    return rows is None or isinstance(rows, dict)
+
+
+def get_index_freq(table, is_row_range):
+    if is_row_range:
+        return common.get_index_freq(table)
+    return common.INFER_FREQ
+
+
+def convert_table_to_pandas(
+    df,
+    *,
+    index_freq=common.INFER_FREQ,
+    is_row_range=False,
+    low_memory=False,
+    index_levels=None,
+):
     was_transposed = _table_utils.is_transposed(df)
-    df = df.to_pandas(date_as_object=False)
+    if low_memory:
+        df = df.to_pandas(date_as_object=False, split_blocks=True, self_destruct=True)
+    else:
+        df = df.to_pandas(date_as_object=False)
     if was_transposed:
         df = df.T
+        index_freq = common.INFER_FREQ
+        is_row_range = False
+    if index_levels is not None:
+        df = _composite.set_index_levels(df, index_levels)
 
     if _can_be_converted_to_series(df):
         df = df.squeeze(axis=1)
@@ -176,10 +795,10 @@ def convert_table_to_pandas(df):
             df.name = None
 
     index = df.index
-    if _can_be_converted_to_rangeindex(index):
+    if _can_be_converted_to_rangeindex(index, is_row_range):
         df.index = _make_rangeindex(df)
     elif isinstance(index, pd.DatetimeIndex):
-        df.index.freq = index.inferred_freq
+        df.index = _set_index_freq(index, index_freq)
     return df
 
 
@@ -188,13 +807,30 @@ def _can_be_converted_to_series(df):
     return num_cols == 1
 
 
-def _can_be_converted_to_rangeindex(index):
+def _can_be_converted_to_rangeindex(index, is_row_range):
     if isinstance(index, pd.RangeIndex):
         return False
+    if is_row_range and len(index) > 0:
+        # A stored index is sorted and unique, so a range of it is only
+        # 0, 1, ..., n - 1 if it starts at 0 and ends at n - 1
+        is_int = pd.api.types.is_integer_dtype(index)
+        return is_int and index[0] == 0 and index[-1] == len(index) - 1
     corresponding_rangeindex = pd.RangeIndex(start=0, stop=len(index))
     return index.equals(corresponding_rangeindex)
 
 
+def _set_index_freq(index, freq):
+    # Rebuilding a tz-aware index from its freq could shift values across DST
+    if freq == common.INFER_FREQ or index.tz is not None:
+        index.freq = index.inferred_freq
+        return index
+    if freq is None or len(index) < 3:
+        return index
+    return pd.date_range(
+        index[0], periods=len(index), freq=freq, unit=index.unit, name=index.name
+    )
+
+
 def _make_rangeindex(df):
     index = pd.RangeIndex(len(df))
     index.name = df.index.name
@@ -1,4 +1,4 @@
-from featherstore._table import _raise_if
+from featherstore._table import _raise_if, common
 
 
 def can_rename_columns(table, cols, new_col_names):
@@ -43,7 +43,25 @@ def _replace_col_names(stored_cols, cols):
     return renamed_cols
 
 
-def write_metadata(table, df):
+def get_renamed_partition_key(table, cols):
+    partition_key = common.get_partition_key(table)
+    return dict(cols.items()).get(partition_key, partition_key)
+
+
+def write_metadata(table, df, cols):
     first_partition = next(iter(df.values()))
     col_names = first_partition.schema.names
-    table._table_data["columns"] = col_names
+    partition_key = get_renamed_partition_key(table, cols)
+    cols = dict(cols.items())
+    dictionaries = {
+        cols.get(col, col): dictionary
+        for col, dictionary in common.get_dictionaries(table).items()
+    }
+    table._table_data.write(
+        {
+            "columns": col_names,
+            "schema": first_partition.schema,
+            "dictionaries": dictionaries,
+            "partition_key": partition_key,
+        }
+    )
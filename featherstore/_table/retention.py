@@ -0,0 +1,103 @@
+import datetime
+from numbers import Integral
+
+import pandas as pd
+
+from featherstore._table import _partitions, _raise_if, read
+from featherstore._table._indexers import ColIndexer
+
+
+def can_enforce_retention(table):
+    _raise_if.not_connected_or_table_not_exists(table)
+
+
+def can_set_retention(table, keep, max_rows):
+    _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if.table_has_composite_index(table, "set_retention")
+    _raise_if.table_is_partitioned_by_key(table, "set_retention")
+    if keep is not None:
+        _raise_if_keep_is_not_valid(keep, table._table_data["index_dtype"])
+    if max_rows is not None:
+        _raise_if_max_rows_is_not_valid(max_rows)
+
+
+def _raise_if_keep_is_not_valid(keep, index_dtype):
+    if not isinstance(keep, (str, datetime.timedelta)):
+        raise TypeError(
+            f"'keep' must be a str, timedelta or None (is type {type(keep)})"
+        )
+    if "timestamp" not in index_dtype and "date" not in index_dtype:
+        raise TypeError(
+            f"'keep' is only supported for datetime indices (index_dtype={index_dtype})"
+        )
+    try:
+        keep = pd.Timedelta(keep)
+    except ValueError:
+        raise ValueError(f"'keep' is not a valid time span ({keep!r})") from None
+    if keep <= pd.Timedelta(0):
+        raise ValueError(f"'keep' must be a positive time span ({keep})")
+
+
+def _raise_if_max_rows_is_not_valid(max_rows):
+    if not isinstance(max_rows, Integral) or isinstance(max_rows, bool):
+        raise TypeError(f"'max_rows' must be a int or None (is type {type(max_rows)})")
+    if max_rows < 1:
+        raise ValueError(f"'max_rows' must be at least 1 (is {max_rows})")
+
+
+def make_retention(keep, max_rows):
+    if keep is None and max_rows is None:
+        return None
+    if keep is not None:
+        keep = pd.Timedelta(keep).to_pytimedelta()
+    return {"keep": keep, "max_rows": max_rows}
+
+
+def get_retention(table):
+    try:
+        return table._table_data["retention"]
+    except KeyError:  # Tables written before retention policies were added
+        return None
+
+
+def get_rows_to_drop(table):
+    """The rows the retention policy of the table drops, as a `before` filter
+    found from the partition metadata, or None if no rows are to be dropped
+    """
+    retention = get_retention(table)
+    if retention is None or table._table_data["num_rows"] == 0:
+        return None
+
+    cutoffs = []
+    if retention["keep"] is not None:
+        cutoffs.append(_get_keep_cutoff(table, retention["keep"]))
+    if retention["max_rows"] is not None:
+        cutoffs.append(_get_max_rows_cutoff(table, retention["max_rows"]))
+    cutoffs = [cutoff for cutoff in cutoffs if cutoff is not None]
+    if not cutoffs:
+        return None
+    return {"before": max(cutoffs)}
+
+
+def _get_keep_cutoff(table, keep):
+    """Rows more than `keep` older than the last row are dropped"""
+    first_value = _partitions.get_first_stored_index_value(table._partition_data)
+    last_value = _partitions.get_last_stored_index_value(table._partition_data)
+    cutoff = pd.Timestamp(last_value) - keep
+    if cutoff < pd.Timestamp(first_value):
+        return None
+    if isinstance(last_value, datetime.datetime):
+        return cutoff.to_pydatetime()
+    return cutoff.date()
+
+
+def _get_max_rows_cutoff(table, max_rows):
+    num_dropped = table._table_data["num_rows"] - max_rows
+    if num_dropped <= 0:
+        return None
+
+    # The index value of the last dropped row, read from its partition only
+    index_name = table._table_data["index_name"]
+    partition_names, positions = read.locate_positions(table, [num_dropped - 1])
+    df = read.read_table(table, partition_names, cols=ColIndexer([]), iloc=positions)
+    return df[index_name][0].as_py()
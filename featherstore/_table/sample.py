@@ -0,0 +1,51 @@
+from numbers import Integral, Real
+
+import numpy as np
+
+from featherstore._table import _raise_if
+
+
+def can_sample(table, n, frac, seed):
+    _raise_if.not_connected_or_table_not_exists(table)
+    if (n is None) == (frac is None):
+        raise ValueError("Provide exactly one of 'n' and 'frac'")
+
+    num_rows = table._table_data["num_rows"]
+    if n is not None:
+        if not isinstance(n, Integral) or isinstance(n, bool):
+            raise TypeError(f"'n' must be an int (is type {type(n)})")
+        if not 0 <= n <= num_rows:
+            raise ValueError(
+                f"'n' must be between 0 and the number of rows ({num_rows}), is {n}"
+            )
+    else:
+        if not isinstance(frac, Real) or isinstance(frac, bool):
+            raise TypeError(f"'frac' must be a float (is type {type(frac)})")
+        if not 0 <= frac <= 1:
+            raise ValueError(f"'frac' must be between 0 and 1 (is {frac})")
+
+    if not isinstance(seed, (Integral, type(None))) or isinstance(seed, bool):
+        raise TypeError(f"'seed' must be an int or None (is type {type(seed)})")
+
+
+def sample_positions(table, n, frac, seed):
+    num_rows = table._table_data["num_rows"]
+    if n is None:
+        n = round(frac * num_rows)
+    rng = np.random.default_rng(seed)
+    # How many rows to sample from each partition is drawn first, so positions
+    # are only ever drawn among the rows of one partition
+    partition_names = table._partition_data.keys()
+    partition_sizes = np.array(
+        [table._partition_data[name]["num_rows"] for name in partition_names],
+        dtype=np.int64,
+    )
+    counts = rng.multivariate_hypergeometric(partition_sizes, n)
+    offsets = np.cumsum(partition_sizes) - partition_sizes
+
+    positions = []
+    for size, count, offset in zip(partition_sizes, counts, offsets):
+        partition_positions = rng.choice(size, size=count, replace=False)
+        # Sorted positions read each partition once and keep the stored order
+        positions.append(offset + np.sort(partition_positions))
+    return np.concatenate(positions)
@@ -0,0 +1,159 @@
+import io
+import json
+
+import polars as pl
+from polars.io.plugins import register_io_source
+
+from featherstore._table import _versions, read
+from featherstore._table._indexers import ColIndexer
+
+# Comparisons of a literal to a column, as comparisons of the column to it
+_FLIPPED_COMPARISONS = {
+    "Gt": "Lt",
+    "GtEq": "LtEq",
+    "Lt": "Gt",
+    "LtEq": "GtEq",
+    "Eq": "Eq",
+}
+
+
+def can_scan_table(table, mmap):
+    read.can_read_table(table, cols=None, rows=None, mmap=mmap)
+
+
+def scan_table(table, mmap):
+    table, lease = _versions.pin_version(table)
+    # The version stays pinned as long as the scan, or any query built on it,
+    # is referenced
+    _versions.release_when_collected(table, lease)
+    schema = read.get_arrow_schema(table, mmap)
+    schema = pl.from_arrow(schema.empty_table()).schema
+
+    def io_source(with_columns, predicate, n_rows, batch_size):
+        cols = list(schema) if with_columns is None else with_columns
+        return _scan_partitions(table, cols, predicate, n_rows, mmap)
+
+    return register_io_source(io_source, schema=schema)
+
+
+def _scan_partitions(table, cols, predicate, n_rows, mmap):
+    index_name = table._table_data["index_name"]
+    predicate_cols = [] if predicate is None else predicate.meta.root_names()
+    read_cols = [*cols, *(col for col in predicate_cols if col not in cols)]
+
+    partition_names = _prune_partitions(table, predicate, index_name)
+    for partition_name in partition_names:
+        if n_rows is not None and n_rows <= 0:
+            break
+        partition = _read_partition(table, partition_name, read_cols, mmap)
+        if n_rows is not None and predicate is None:
+            partition = partition.slice(0, n_rows)
+
+        df = pl.from_arrow(partition, rechunk=False)
+        if predicate is not None:
+            df = df.filter(predicate)
+        df = df.select(cols)
+        if n_rows is not None:
+            df = df.head(n_rows)
+            n_rows -= df.height
+        yield df
+
+
+def _prune_partitions(table, predicate, index_name):
+    # Partitions outside the index bounds the predicate keeps are skipped from
+    # the partition metadata alone, without opening their files
+    low, high = _get_index_bounds(predicate, index_name)
+    try:
+        return read.get_partition_names_between(table, low, high)
+    except (TypeError, ValueError):  # Bounds that can't be compared to the index
+        return table._partition_data.keys()
+
+
+def _get_index_bounds(predicate, index_name):
+    """The lowest and highest index value the predicate can keep, where None
+    leaves that end open. Only comparisons of the index to literals are
+    understood; the rest of the predicate is left to the filter
+    """
+    if predicate is None:
+        return None, None
+    try:
+        node = json.loads(predicate.meta.serialize(format="json"))
+        return _find_index_bounds(node, index_name)
+    except (TypeError, ValueError, KeyError, pl.exceptions.PolarsError):
+        return None, None
+
+
+def _find_index_bounds(node, index_name):
+    if "BinaryExpr" in node:
+        left = node["BinaryExpr"]["left"]
+        op = node["BinaryExpr"]["op"]
+        right = node["BinaryExpr"]["right"]
+        if op == "And":
+            return _intersect_bounds(
+                _find_index_bounds(left, index_name),
+                _find_index_bounds(right, index_name),
+            )
+        if op == "Or":
+            return _union_bounds(
+                _find_index_bounds(left, index_name),
+                _find_index_bounds(right, index_name),
+            )
+        if _is_column(right, index_name) and "Literal" in left:
+            left, right, op = right, left, _FLIPPED_COMPARISONS.get(op)
+        if _is_column(left, index_name) and "Literal" in right:
+            (value,) = _read_literal(right)
+            if op in ("Gt", "GtEq"):
+                return value, None
+            if op in ("Lt", "LtEq"):
+                return None, value
+            if op == "Eq":
+                return value, value
+
+    elif "Function" in node:
+        inputs = node["Function"]["input"]
+        function = node["Function"]["function"]
+        function = function.get("Boolean", {}) if isinstance(function, dict) else {}
+        is_on_index = _is_column(inputs[0], index_name) and all(
+            "Literal" in arg for arg in inputs[1:]
+        )
+        if is_on_index and "IsBetween" in function:
+            (low,) = _read_literal(inputs[1])
+            (high,) = _read_literal(inputs[2])
+            return low, high
+        if is_on_index and "IsIn" in function:
+            values = [value for value in _read_literal(inputs[1]) if value is not None]
+            return min(values), max(values)
+
+    return None, None
+
+
+def _is_column(node, col):
+    return node == {"Column": col}
+
+
+def _read_literal(node):
+    literal = pl.Expr.deserialize(io.StringIO(json.dumps(node)), format="json")
+    values = pl.select(literal).to_series()
+    if values.dtype == pl.List:
+        values = values.explode()
+    return values.to_list()
+
+
+def _intersect_bounds(bounds, other_bounds):
+    lows = [low for low in (bounds[0], other_bounds[0]) if low is not None]
+    highs = [high for high in (bounds[1], other_bounds[1]) if high is not None]
+    low = max(lows) if lows else None
+    high = min(highs) if highs else None
+    return low, high
+
+
+def _union_bounds(bounds, other_bounds):
+    (low, high), (other_low, other_high) = bounds, other_bounds
+    low = None if low is None or other_low is None else min(low, other_low)
+    high = None if high is None or other_high is None else max(high, other_high)
+    return low, high
+
+
+def _read_partition(table, partition_name, cols, mmap):
+    partitions = read.iter_partitions(table, [partition_name], ColIndexer(cols), mmap)
+    return next(partitions)
@@ -0,0 +1,57 @@
+from featherstore._table import _dictionaries, _raise_if, _versions, common, read, write
+
+
+def can_create_index(table, col):
+    _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if_col_is_not_str(col)
+    _raise_if.cols_not_in_table([col], table._table_data)
+    _raise_if.index_in_cols([col], table._table_data)
+
+
+def can_drop_index(table, col):
+    _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if_col_is_not_str(col)
+    if col not in common.get_indexed_cols(table):
+        raise ValueError(f"Column {col!r} is not indexed")
+
+
+def _raise_if_col_is_not_str(col):
+    if not isinstance(col, str):
+        raise TypeError(f"'col' must be a str (is type {type(col)})")
+
+
+def create_index(table, col):
+    indexed_cols = common.get_indexed_cols(table)
+    if col not in indexed_cols:
+        table._table_data["indexed_cols"] = [*indexed_cols, col]
+
+    files = _versions.get_partition_files(table)
+    staged_partitions = _versions.get_staged_partitions(table)
+    dictionaries = common.get_dictionaries(table)
+    for partition_name in files:
+        if partition_name in staged_partitions:
+            continue  # Indexed once the staged partition is written
+        partition = read.read_stored_partition(table, partition_name, files)
+        partition = _dictionaries.decode_cols(partition.select([col]), dictionaries)
+        write.write_value_indexes(table, partition_name, partition, [col])
+
+
+def drop_index(table, col):
+    # The sidecar indexes of columns no longer indexed are left out of the
+    # next version, and removed with its old files
+    indexed_cols = common.get_indexed_cols(table)
+    indexed_cols = [indexed_col for indexed_col in indexed_cols if indexed_col != col]
+    table._table_data["indexed_cols"] = indexed_cols
+
+
+def rename_indexes(table, cols):
+    cols = dict(cols.items())
+    indexed_cols = common.get_indexed_cols(table)
+    renamed_cols = [cols.get(col, col) for col in indexed_cols]
+    if renamed_cols == indexed_cols:
+        return
+
+    for partition_name, col in _versions.get_index_files(table):
+        if col in cols:
+            _versions.rename_index_file(table, partition_name, col, to=cols[col])
+    table._table_data["indexed_cols"] = renamed_cols
@@ -2,20 +2,26 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
 
-from featherstore._table import _raise_if, _table_utils
+from featherstore import _utils
+from featherstore._table import _partitions, _raise_if, _table_utils, common
 from featherstore.exceptions import ColumnDtypeMismatchError, RowNotFoundError
 
 
-def can_update_table(table, df):
+def can_update_table(table, df, validate):
     _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if.table_has_composite_index(table, "update")
+    _raise_if.table_is_partitioned_by_key(table, "update")
+    _utils.raise_if_validate_argument_is_not_valid(validate)
     _raise_if.df_is_not_table_type(df, _table_utils.EDIT_TABLE_TYPES)
+    if validate == "none":
+        return
 
     table_data = table._table_data
     index_name = table_data["index_name"]
     cols = _table_utils.get_col_names(df, index_name=index_name)
     index = _table_utils.get_index_if_exists(df, index_name)
     _raise_if.incoming_index_schema_incompatible_with_stored(
-        df, table_data, cols, index=index
+        df, table_data, cols, index=index, check_index_values=validate == "full"
     )
     _raise_if.cols_not_in_table(cols, table_data)
 
@@ -26,6 +32,17 @@ def update_data(old_df, *, to):
     return _update_columns(old_df, to, row_positions, index_name)
 
 
+def create_partitions(table, df, partition_names):
+    """Splits the updated rows into the partitions they were read from, which
+    keeps the partition metadata valid
+    """
+    partition_lengths = [
+        table._partition_data[name]["num_rows"] for name in partition_names
+    ]
+    partitions = _partitions.split_partitions(df, partition_lengths)
+    return dict(zip(partition_names, partitions, strict=True))
+
+
 def _get_row_positions(old_index, new_index):
     """Position each updated row within ``old_index``, using Pandas' hash index
     since it outperforms Arrow's ``index_in`` for this direction of lookup.
@@ -66,3 +83,9 @@ def _cast_col(col, dtype):
         raise ColumnDtypeMismatchError(
             "New and old column dtypes do not match"
         ) from None
+
+
+def update_dictionaries(table, partitions):
+    if common.get_dictionaries(table):
+        dictionaries = common.update_dictionaries(table, partitions)
+        table._table_data["dictionaries"] = dictionaries
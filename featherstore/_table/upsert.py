@@ -0,0 +1,44 @@
+import pyarrow.compute as pc
+
+from featherstore._table import _partitions, _raise_if, _table_utils, insert_rows
+
+
+def can_upsert_table(table, df, warnings, validate):
+    _raise_if.not_connected_or_table_not_exists(table)
+    _raise_if.table_has_composite_index(table, "upsert")
+    _raise_if.table_is_partitioned_by_key(table, "upsert")
+    insert_rows.can_insert_rows(table, df, warnings, validate)
+
+
+def only_appends(table, df):
+    """Whether every incoming row comes after the last stored row"""
+    index_name = table._table_data["index_name"]
+    if len(df) == 0:
+        return False
+    last_stored_value = _partitions.get_last_stored_index_value(table._partition_data)
+    return pc.min(df[index_name]).as_py() > last_stored_value
+
+
+def upsert_data(df, *, to):
+    """Replaces the stored rows that are also in `df` and adds the rest, found
+    with a single lookup of the stored index in the incoming one
+    """
+    index_name = _table_utils.get_index_name(df)
+    is_replaced = pc.is_in(to[index_name], value_set=df[index_name])
+    kept_rows = to.filter(pc.invert(is_replaced))
+
+    df = _table_utils.concat_arrow_tables(kept_rows, df)
+    df = _table_utils.sort_arrow_table(df, by=index_name)
+    return df
+
+
+def has_still_default_index(table, df, stored_df):
+    """Whether the index stays default when the rows of `df` not already in
+    `stored_df` are added
+    """
+    if not table._table_data["has_default_index"]:
+        return False
+
+    index_name = table._table_data["index_name"]
+    is_new = pc.invert(pc.is_in(df[index_name], value_set=stored_df[index_name]))
+    return insert_rows.has_still_default_index(table, df.filter(is_new))
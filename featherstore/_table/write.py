@@ -1,21 +1,58 @@
+import contextlib
 import json
 import os
 from numbers import Integral
 
+import numpy as np
+import pandas as pd
 import pyarrow as pa
 from pyarrow import ipc
 
 from featherstore import _utils
-from featherstore._table import _partitions, _raise_if, _table_utils, common
+from featherstore._table import (
+    _composite,
+    _dictionaries,
+    _keys,
+    _partitions,
+    _periods,
+    _raise_if,
+    _table_utils,
+    _value_indexes,
+    _versions,
+    common,
+)
 from featherstore._utils import DEFAULT_ARROW_INDEX_NAME
-from featherstore.exceptions import IndexNotInColumnsError
-
-
-def can_write_table(table, df, index_name, partition_size, errors, warnings):
+from featherstore.exceptions import (
+    AppendIndexError,
+    ColumnDtypeMismatchError,
+    ColumnMismatchError,
+    ColumnNotFoundError,
+    IndexNotInColumnsError,
+)
+
+STREAM_BATCH_TYPES = (*_table_utils.SUPPORTED_TABLE_TYPES, pa.RecordBatch)
+
+
+def can_write_table(
+    table,
+    df,
+    index_name,
+    partition_size,
+    errors,
+    warnings,
+    validate,
+    bloom_filter,
+    dictionary,
+    partition_by,
+    partition_key,
+):
     _raise_if.not_connected()
+    _raise_if.table_in_batch(table)
     _utils.raise_if_errors_argument_is_not_valid(errors)
     _utils.raise_if_warnings_argument_is_not_valid(warnings)
+    _utils.raise_if_validate_argument_is_not_valid(validate)
     _raise_if_partition_size_is_not_int(partition_size)
+    _raise_if_bloom_filter_is_not_bool(bloom_filter)
 
     if errors == "raise":
         _raise_if.table_already_exists(table._table_path)
@@ -24,12 +61,100 @@ def can_write_table(table, df, index_name, partition_size, errors, warnings):
     cols = _table_utils.get_col_and_index_names(df, has_default_index=False)
     _raise_if_index_argument_is_not_str_or_none(index_name)
     _raise_if_provided_index_not_in_cols(index_name, cols)
+    _raise_if_dictionary_cols_are_not_valid(dictionary, df, index_name)
+    _raise_if_partition_by_is_not_valid(partition_by, df, index_name)
+    _raise_if_partition_key_is_not_valid(partition_key, partition_by, df, index_name)
+    if validate == "none":
+        return
+
     _raise_if.cols_argument_items_is_not_str_or_none(cols)
     _raise_if.col_names_contains_duplicates(cols)
 
     index = _table_utils.get_index_if_exists(df, index_name)
     _raise_if.index_type_not_supported(index)
-    _raise_if.index_values_contains_duplicates(index)
+    if validate != "full":
+        return
+    if partition_key is None:
+        _raise_if.index_values_contains_duplicates(index)
+    else:
+        keys = _keys.get_key_column(df, partition_key)
+        _raise_if.index_values_contains_duplicates_within_keys(index, keys)
+
+
+def can_write_stream(
+    table,
+    batches,
+    schema,
+    index_name,
+    partition_size,
+    errors,
+    warnings,
+    validate,
+    bloom_filter,
+):
+    _raise_if.not_connected()
+    _raise_if.table_in_batch(table)
+    _utils.raise_if_errors_argument_is_not_valid(errors)
+    _utils.raise_if_warnings_argument_is_not_valid(warnings)
+    _utils.raise_if_validate_argument_is_not_valid(validate)
+    _raise_if_partition_size_is_not_int(partition_size)
+    _raise_if_bloom_filter_is_not_bool(bloom_filter)
+
+    if errors == "raise":
+        _raise_if.table_already_exists(table._table_path)
+    _raise_if_batches_is_not_iterable(batches)
+    if schema is not None and not isinstance(schema, pa.Schema):
+        dtype = type(schema)
+        raise TypeError(f"'schema' must be a pyarrow Schema or None (is type {dtype})")
+    if index_name is not None and not isinstance(index_name, str):
+        dtype = type(index_name)
+        raise TypeError(f"'index' must be a str or None (is type {dtype})")
+
+
+def _raise_if_batches_is_not_iterable(batches):
+    # A single DataFrame is iterable too, but over its columns
+    is_table = isinstance(batches, STREAM_BATCH_TYPES)
+    if is_table or not _table_utils.is_collection(batches):
+        dtype = type(batches)
+        raise TypeError(
+            f"'batches' must be an iterable of DataFrames or Arrow batches "
+            f"(is type {dtype})"
+        )
+
+
+def can_write_index_levels(df, index, partition_by, partition_key):
+    index_levels = _composite.get_index_levels(df, index)
+    if index_levels is None:
+        return
+    if len(index_levels) != 2:
+        raise ValueError(
+            f"Composite indices must have two levels (has {len(index_levels)})"
+        )
+    for level in index_levels:
+        if not isinstance(level, str):
+            raise TypeError(
+                f"Composite index levels must be named by a str (is type {type(level)})"
+            )
+    if partition_by is not None or partition_key is not None:
+        raise ValueError(
+            "A composite index can't be combined with 'partition_by' or 'partition_key'"
+        )
+
+
+def has_composite_index(df, index):
+    return _composite.get_index_levels(df, index) is not None
+
+
+def split_index_levels(df, index, partition_key):
+    """Stores the first level of a composite index as the partition key, and
+    the second as the index
+    """
+    index_levels = _composite.get_index_levels(df, index)
+    if index_levels is None:
+        return df, index, partition_key
+    df = _composite.split_index_levels(df)
+    partition_key, index = index_levels
+    return df, index, partition_key
 
 
 def _raise_if_partition_size_is_not_int(partition_size):
@@ -38,10 +163,84 @@ def _raise_if_partition_size_is_not_int(partition_size):
         raise TypeError(f"'partition_size' must be a int or (is type {dtype})")
 
 
+def _raise_if_bloom_filter_is_not_bool(bloom_filter):
+    if not isinstance(bloom_filter, bool):
+        dtype = type(bloom_filter)
+        raise TypeError(f"'bloom_filter' must be a bool (is type {dtype})")
+
+
+def _raise_if_dictionary_cols_are_not_valid(dictionary, df, index_name):
+    if dictionary is None:
+        return
+    if not _table_utils.is_collection(dictionary):
+        dtype = type(dictionary)
+        raise TypeError(f"'dictionary' must be a collection or None (is type {dtype})")
+    _raise_if.cols_argument_items_is_not_str_or_none(dictionary)
+
+    cols = _table_utils.get_col_names(df, index_name=index_name)
+    missing = sorted(set(dictionary) - set(cols))
+    if missing:
+        raise ColumnNotFoundError(
+            f"Trying to dictionary encode columns not found in table ({missing})"
+        )
+
+
+def _raise_if_partition_by_is_not_valid(partition_by, df, index_name):
+    if partition_by is None:
+        return
+    if not isinstance(partition_by, str):
+        dtype = type(partition_by)
+        raise TypeError(f"'partition_by' must be a str or None (is type {dtype})")
+    if _periods.format_period(partition_by) is None:
+        raise ValueError(
+            f"'partition_by' must be one of {_periods.SUPPORTED_PERIODS} "
+            f"(is {partition_by!r})"
+        )
+
+    index = _table_utils.get_index_if_exists(df, index_name)
+    is_temporal = index is not None and (
+        pa.types.is_timestamp(index.type) or pa.types.is_date(index.type)
+    )
+    if not is_temporal:
+        index_type = None if index is None else index.type
+        raise TypeError(
+            f"'partition_by' is only supported for datetime indices "
+            f"(index type is {index_type})"
+        )
+    if len(index) == 0:
+        raise ValueError("'partition_by' needs rows to derive the partitions from")
+
+
+def _raise_if_partition_key_is_not_valid(partition_key, partition_by, df, index_name):
+    if partition_key is None:
+        return
+    if not isinstance(partition_key, str):
+        dtype = type(partition_key)
+        raise TypeError(f"'partition_key' must be a str or None (is type {dtype})")
+    if partition_by is not None:
+        raise ValueError("'partition_key' can't be combined with 'partition_by'")
+
+    cols = _table_utils.get_col_names(df, index_name=index_name)
+    if partition_key not in cols or partition_key == index_name:
+        raise ColumnNotFoundError(
+            f"Trying to partition by a column not found in table ({partition_key})"
+        )
+    keys = _keys.get_key_values(_keys.get_key_column(df, partition_key))
+    if not _table_utils.index_type_is_supported(keys.type):
+        raise TypeError(
+            f"'partition_key' column type is not supported (is type {keys.type})"
+        )
+    _raise_if.partition_keys_contains_nulls(keys)
+    if len(keys) == 0:
+        raise ValueError("'partition_key' needs rows to derive the partitions from")
+
+
 def _raise_if_index_argument_is_not_str_or_none(index):
     is_str_or_none = isinstance(index, str) or index is None
     if not is_str_or_none:
-        raise TypeError(f"'index' must be a str or None (is type {type(index)})")
+        raise TypeError(
+            f"'index' must be a str, a list of two str or None (is type {type(index)})"
+        )
 
 
 def _raise_if_provided_index_not_in_cols(index, cols):
@@ -51,16 +250,61 @@ def _raise_if_provided_index_not_in_cols(index, cols):
         )
 
 
-def create_partitions(df, rows_per_partition, partition_names=None):
+def create_partitions(
+    df,
+    rows_per_partition,
+    partition_names=None,
+    *,
+    partition_by=None,
+    partition_key=None,
+):
     strategy = "new" if partition_names is None else "reuse"
     return _partitions.create_partitions(
-        df, rows_per_partition, partition_names, strategy=strategy
+        df,
+        rows_per_partition,
+        partition_names,
+        strategy=strategy,
+        partition_by=partition_by,
+        partition_key=partition_key,
     )
 
 
-def generate_metadata(df, partition_size, rows_per_partition):
+def format_partition_by(partition_by):
+    if partition_by is None:
+        return None
+    return _periods.format_period(partition_by)
+
+
+def cast_dictionary_cols(df, dictionary):
+    if not dictionary:
+        return df
+    dictionaries = _dictionaries.make_dictionaries(df, dictionary)
+    return _dictionaries.cast_cols(df, dictionaries)
+
+
+def generate_metadata(
+    df,
+    partition_size,
+    rows_per_partition,
+    bloom_filter=False,
+    dictionary=None,
+    partition_by=None,
+    partition_key=None,
+    composite_index=False,
+):
     table_metadata = _make_table_metadata(df, partition_size, rows_per_partition)
-    partition_metadata = common._make_partition_metadata(df)
+    table_metadata["bloom_filter"] = bloom_filter
+    table_metadata["partition_by"] = partition_by
+    table_metadata["partition_key"] = partition_key
+    table_metadata["composite_index"] = composite_index
+    if partition_key is not None:
+        # The index is only sorted within each key, so it is always stored
+        table_metadata["has_default_index"] = False
+        table_metadata["index_freq"] = None
+    table_metadata["dictionaries"] = _make_dictionaries(df, dictionary)
+    partition_metadata = common._make_partition_metadata(
+        df, bloom_filter=bloom_filter, partition_key=partition_key
+    )
     return table_metadata, partition_metadata
 
 
@@ -74,13 +318,23 @@ def _make_table_metadata(df, partition_size, rows_per_partition):
         "columns": _get_partitioned_df_col_names(df),
         "index_name": _table_utils.get_index_name(df[0]),
         "index_dtype": _table_utils.get_index_dtype(df[0]),
+        "schema": df[0].schema,
         "has_default_index": _has_default_index(df),
+        "index_freq": _get_index_freq(df),
         "partition_size": int(partition_size),
         "rows_per_partition": rows_per_partition,
     }
     return metadata
 
 
+def _make_dictionaries(df, dictionary):
+    if not dictionary:
+        return {}
+    first_partition = next(iter(df.values()))
+    dictionaries = _dictionaries.make_dictionaries(first_partition, dictionary)
+    return _dictionaries.update_dictionaries(dictionaries, df)
+
+
 def _get_partitioned_df_col_names(df):
     cols = df[0].schema.names
     return cols
@@ -110,6 +364,12 @@ def _has_default_index(df):
     return common.index_is_default(index)
 
 
+def _get_index_freq(df):
+    index_name = _table_utils.get_index_name(df[0])
+    index = pa.chunked_array(batch[index_name] for batch in df)
+    return common.infer_index_freq(index)
+
+
 def __index_was_sorted(df):
     featherstore_metadata = df[0].schema.metadata[b"featherstore"]
     metadata_dict = json.loads(featherstore_metadata)
@@ -123,11 +383,305 @@ def write_metadata(table, metadata):
     table._partition_data.write(partition_metadata)
 
 
-def write_partitions(partitions, table_path):
-    for file_name, partition in partitions.items():
+def replace_metadata(table, metadata):
+    """Writes the metadata of a table written anew in place of the stored
+    metadata, which readers keep seeing until the commit is published
+    """
+    stored_keys = table._table_data.keys()
+    for key in stored_keys:
+        del table._table_data[key]
+    partition_names = table._partition_data.keys()
+    for partition_name in partition_names:
+        del table._partition_data[partition_name]
+    write_metadata(table, metadata)
+
+
+def write_partitions(table, partitions):
+    """Stages the partitions, which are written to disk once the commit is
+    published
+    """
+    table._commit.partitions.update(partitions)
+    _clear_deletion_vectors(table, partitions)
+
+
+def _clear_deletion_vectors(table, partition_names):
+    # Rewritten partitions no longer hold the rows their deletion vector drops
+    stored_partitions = set(table._partition_data.keys())
+    cleared_partitions = {}
+    for partition_name in partition_names:
+        if partition_name not in stored_partitions:
+            continue
+        partition_data = table._partition_data[partition_name]
+        if "deletion_vector" in partition_data:
+            del partition_data["deletion_vector"]
+            cleared_partitions[partition_name] = partition_data
+    if cleared_partitions:
+        table._partition_data.write(cleared_partitions)
+
+
+def write_stream(
+    table, batches, schema, index_name, partition_size, warnings, validate, bloom_filter
+):
+    """Writes the partitions of a stream of batches to disk as they fill up,
+    and returns the metadata of the table once the stream ends
+    """
+    stream = _PartitionStream(
+        table, schema, index_name, partition_size, warnings, validate, bloom_filter
+    )
+    for df in batches:
+        stream.write(df)
+    return stream.close()
+
+
+class _PartitionStream:
+    """Formats each batch of a stream like `Table.write` formats a DataFrame,
+    and writes a partition to disk as soon as the rows after it fill another.
+
+    The last partition is held back until the stream ends, so a small remainder
+    can be merged into it like `make_partitions` does. The partition files are
+    only published once the commit is, together with the metadata.
+    """
+
+    def __init__(
+        self,
+        table,
+        schema,
+        index_name,
+        partition_size,
+        warnings,
+        validate,
+        bloom_filter,
+    ):
+        self._table = table
+        self._schema = schema
+        self._index_name = index_name
+        self._partition_size = partition_size
+        self._warnings = warnings
+        self._validate = validate
+        self._bloom_filter = bloom_filter
+
+        self._has_default_index = None
+        self._rows_per_partition = None
+        self._last_index_value = None
+        self._num_rows = 0
+        self._buffer = []
+        self._buffered_rows = 0
+        self._partition_metadata = {}
+
+    def write(self, df):
+        df = self._format_batch(df)
+        if df.num_rows == 0:
+            return
+        if self._rows_per_partition is None:
+            self._rows_per_partition = common.compute_rows_per_partition(
+                df, self._partition_size
+            )
+        self._buffer.append(df)
+        self._buffered_rows += df.num_rows
+        self._write_full_partitions()
+
+    def close(self):
+        if not self._buffer:  # An empty stream is stored as one empty partition
+            if self._schema is None:
+                raise ValueError("Can't write an empty stream without a 'schema'")
+            self._buffer.append(self._format_batch(self._schema.empty_table()))
+        df = pa.concat_tables(self._buffer)
+        if self._rows_per_partition is None:
+            self._rows_per_partition = common.compute_rows_per_partition(
+                df, self._partition_size
+            )
+        self._write_partitions(df)
+        return self._make_table_metadata(df.schema), self._partition_metadata
+
+    def _format_batch(self, df):
+        _raise_if.df_is_not_table_type(df, STREAM_BATCH_TYPES)
+        df = _convert_batch_to_arrow(df)
+        if self._has_default_index is None:
+            self._set_up_stream(df)
+        df = _cast_batch_to_schema(df, self._schema)
+
+        assume_sorted = self._validate != "full"
+        df = common.format_table(
+            df, self._index_name, self._warnings, assume_sorted=assume_sorted
+        )
+        if self._has_default_index:
+            index = np.arange(self._num_rows, self._num_rows + df.num_rows)
+            df = df.set_column(0, self._index_name, pa.array(index, pa.int64()))
+        elif self._validate != "none":
+            index = df[self._index_name]
+            self._raise_if_batch_is_not_after_previous_batch(index)
+            if self._validate == "full":
+                _raise_if.index_values_contains_duplicates(index)
+        self._num_rows += df.num_rows
+        return df
+
+    def _set_up_stream(self, df):
+        cols = df.column_names
+        _raise_if_provided_index_not_in_cols(self._index_name, cols)
+        if self._validate != "none":
+            _raise_if.cols_argument_items_is_not_str_or_none(cols)
+            _raise_if.col_names_contains_duplicates(cols)
+
+        if self._schema is None:
+            self._schema = df.schema
+        if self._index_name is None:
+            self._index_name = _table_utils.get_index_name(df)
+        # Without an index column, the index counts the rows of the whole stream
+        self._has_default_index = self._index_name not in cols
+        if not self._has_default_index and self._validate != "none":
+            _raise_if.index_type_not_supported(df[self._index_name])
+
+    def _raise_if_batch_is_not_after_previous_batch(self, index):
+        if len(index) == 0:
+            return
+        batch_start = index[0].as_py()
+        if self._last_index_value is not None and batch_start <= self._last_index_value:
+            raise AppendIndexError(
+                f"Each batch must come after the previous one, sorted by the index "
+                f"({batch_start} <= {self._last_index_value})"
+            )
+        self._last_index_value = index[-1].as_py()
+
+    def _write_full_partitions(self):
+        rows_per_partition = self._rows_per_partition
+        if rows_per_partition == -1 or self._buffered_rows < 2 * rows_per_partition:
+            return
+        num_partitions = self._buffered_rows // rows_per_partition - 1
+        num_rows = num_partitions * rows_per_partition
+        df = pa.concat_tables(self._buffer)
+        self._write_partitions(df.slice(0, num_rows))
+        self._buffer = [df.slice(num_rows)]
+        self._buffered_rows -= num_rows
+
+    def _write_partitions(self, df):
+        partitions = _partitions.make_partitions(df, self._rows_per_partition)
+        first_id = len(self._partition_metadata) + 1
+        partition_names = [
+            _partitions.convert_int_to_partition_id(partition_num)
+            for partition_num in range(first_id, first_id + len(partitions))
+        ]
+        partitions = dict(zip(partition_names, partitions))
+        self._partition_metadata.update(
+            common._make_partition_metadata(partitions, bloom_filter=self._bloom_filter)
+        )
+        for partition_name, partition in partitions.items():
+            partition = pa.Table.from_batches([partition])
+            if self._has_default_index:
+                partition = partition.drop_columns([self._index_name])
+            _write_partition_file(self._table, partition_name, partition)
+
+    def _make_table_metadata(self, schema):
+        index_type = schema.field(0).type
+        is_datetime = pa.types.is_timestamp(index_type) or pa.types.is_date(index_type)
+        return {
+            "num_rows": self._num_rows,
+            "num_columns": len(schema),
+            "num_partitions": len(self._partition_metadata),
+            "columns": schema.names,
+            "index_name": self._index_name,
+            "index_dtype": str(index_type),
+            "schema": schema,
+            "has_default_index": self._has_default_index,
+            # Inferred on read, as the index is never in memory at once
+            "index_freq": common.INFER_FREQ if is_datetime else None,
+            "partition_size": int(self._partition_size),
+            "rows_per_partition": self._rows_per_partition,
+            "bloom_filter": self._bloom_filter,
+            "partition_by": None,
+            "partition_key": None,
+            "composite_index": False,
+            "dictionaries": {},
+        }
+
+
+def _convert_batch_to_arrow(df):
+    if isinstance(df, pa.RecordBatch):
+        return pa.Table.from_batches([df])
+    if isinstance(df, pd.Series):
+        df = df.to_frame()
+    if isinstance(df, pd.DataFrame):
+        # A range index, like the chunks of a file read by Pandas have, is left
+        # out so the rows are numbered across the stream
+        has_range_index = isinstance(df.index, pd.RangeIndex) and df.index.name is None
+        return pa.Table.from_pandas(
+            df, preserve_index=None if has_range_index else True
+        )
+    return _table_utils.convert_to_arrow(df)
+
+
+def _cast_batch_to_schema(df, schema):
+    if sorted(df.column_names) != sorted(schema.names):
+        raise ColumnMismatchError(
+            f"Batch columns doesn't match the stream schema "
+            f"({df.column_names} != {schema.names})"
+        )
+    # Keeps the Pandas metadata of the batch, which holds its index name
+    schema = pa.schema(schema, metadata=df.schema.metadata)
+    try:
+        return df.select(schema.names).cast(schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        raise ColumnDtypeMismatchError(
+            "Batch column types doesn't match the stream schema"
+        )
+
+
+@contextlib.contextmanager
+def commit(table):
+    """Publishes the changes made to the table within the block as one new
+    version. Nested blocks are part of the outermost commit.
+    """
+    if table._commit is not None:
+        yield
+        return
+
+    with _versions.stage(table):
+        try:
+            yield
+            _write_staged_partitions(table)
+        except BaseException:
+            _versions.discard(table)
+            raise
+        _versions.publish(table, common.get_indexed_cols(table))
+
+
+def _write_staged_partitions(table):
+    has_default_index = table._table_data["has_default_index"]
+    index_name = table._table_data["index_name"]
+    dictionaries = common.get_dictionaries(table)
+    indexed_cols = common.get_indexed_cols(table)
+    stored_partitions = set(table._partition_data.keys())
+
+    partition_metadata = {}
+    for partition_name, partition in table._commit.partitions.items():
+        if partition_name not in stored_partitions:
+            continue  # Dropped later in the same commit
         partition = pa.Table.from_batches([partition])
-        file_path = os.path.join(table_path, f"{file_name}.feather")
-        _write_feather(partition, file_path)
+        write_value_indexes(table, partition_name, partition, indexed_cols)
+        if has_default_index:  # Synthesized from the partition metadata on read
+            partition = partition.drop_columns([index_name])
+        partition = _dictionaries.encode_cols(partition, dictionaries)
+        _write_partition_file(table, partition_name, partition)
+        partition_data = table._partition_data[partition_name]
+        partition_data["virtual_index"] = has_default_index
+        partition_metadata[partition_name] = partition_data
+    if partition_metadata:
+        table._partition_data.write(partition_metadata)
+
+
+def write_value_indexes(table, partition_name, partition, cols):
+    """Writes the sidecar index of each of `cols` of the partition"""
+    for col in cols:
+        value_index = _value_indexes.make_value_index(partition[col])
+        file_name = _versions.new_index_file(table, partition_name, col)
+        file_path = os.path.join(table._table_path, file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        _write_feather(value_index, file_path)
+
+
+def _write_partition_file(table, partition_name, partition):
+    file_name = _versions.new_partition_file(table, partition_name)
+    file_path = os.path.join(table._table_path, file_name)
+    _write_feather(partition, file_path)
 
 
 def _write_feather(df, file_path):
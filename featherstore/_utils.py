@@ -146,3 +146,8 @@ def raise_if_errors_argument_is_not_valid(errors):
 def raise_if_warnings_argument_is_not_valid(warnings):
     if warnings not in {"warn", "ignore"}:
         raise ValueError("'warnings' must be either 'warn' or 'ignore'")
+
+
+def raise_if_validate_argument_is_not_valid(validate):
+    if validate not in {"full", "cheap", "none"}:
+        raise ValueError("'validate' must be either 'full', 'cheap' or 'none'")
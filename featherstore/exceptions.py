@@ -37,6 +37,18 @@ class PartitionCountMismatchError(TableError):
     """Raised when partition count does not match partition names."""
 
 
+class TableInBatchError(TableError):
+    """Raised when replacing, renaming or dropping a table inside a batch."""
+
+
+class PartitionKeyError(TableError):
+    """Raised when an operation isn't supported for a table partitioned by key."""
+
+
+class CompositeIndexError(TableError):
+    """Raised when an operation isn't supported for a table with a composite index."""
+
+
 class StoreError(FeatherStoreError):
     """Base class for store-related errors."""
 
@@ -239,7 +239,17 @@ class Store:
     def table_exists(self, table_name):
         return Table(table_name, self.name).exists()
 
-    def read_arrow(self, table_name, *, cols=None, rows=None, mmap=None):
+    def read_arrow(
+        self,
+        table_name,
+        *,
+        cols=None,
+        rows=None,
+        where=None,
+        limit=None,
+        iloc=None,
+        mmap=None,
+    ):
         """Reads PyArrow Table from store
 
         Parameters
@@ -250,7 +260,23 @@ class Store:
         rows : Collection, optional
             List of index values or filter-predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
-            or `between`. If not provided, all rows are read.
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are `(first, second)` tuples, or first level values
+            that select all of their rows, and ranges compare them
+            lexicographically.
+        where : dict, optional
+            Mapping of column names to the values to keep rows for, e.g.
+            `{'symbol': ['AAPL', 'MSFT']}`. Rows must match every column.
+            Columns indexed with `Table.create_index` are looked up in the
+            index, so only the partitions holding the values are read. If not
+            provided, rows are not filtered by value.
+        limit : int, optional
+            Maximum number of rows to read. A negative limit reads the last
+            rows instead. If not provided, all matching rows are read.
+        iloc : slice, list or numpy.ndarray of int, optional
+            Positions of the rows to read, e.g. `slice(1000, 2000)`. Can't be
+            combined with `rows` or `where`. If not provided, rows are not
+            selected by position.
         mmap: bool, optional
             Use memory mapping when opening table on disk, by default `False` on
             Windows and `True` on other systems.
@@ -276,13 +302,30 @@ class Store:
         IndexTypeMismatchError
             If row values do not match the table index dtype.
         TypeError
-            If ``table_name``, ``cols``, or ``rows`` has an invalid type.
+            If ``table_name``, ``cols``, ``rows``, ``where``, ``limit``, or
+            ``iloc`` has an invalid type.
         ValueError
-            If ``mmap`` is not a bool or ``None``.
+            If ``mmap`` is not a bool or ``None``, or ``iloc`` is combined with
+            ``rows`` or ``where``.
+        IndexError
+            If any position in ``iloc`` is out of bounds.
         """
-        return Table(table_name, self.name).read_arrow(cols=cols, rows=rows, mmap=mmap)
+        return Table(table_name, self.name).read_arrow(
+            cols=cols, rows=rows, where=where, limit=limit, iloc=iloc, mmap=mmap
+        )
 
-    def read_pandas(self, table_name, *, cols=None, rows=None, mmap=None):
+    def read_pandas(
+        self,
+        table_name,
+        *,
+        cols=None,
+        rows=None,
+        where=None,
+        limit=None,
+        iloc=None,
+        mmap=None,
+        low_memory=False,
+    ):
         """Reads Pandas DataFrame or Series from store
 
         Parameters
@@ -293,10 +336,31 @@ class Store:
         rows : Collection, optional
             List of index values or filter-predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
-            or `between`. If not provided, all rows are read.
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are `(first, second)` tuples, or first level values
+            that select all of their rows, and ranges compare them
+            lexicographically.
+        where : dict, optional
+            Mapping of column names to the values to keep rows for, e.g.
+            `{'symbol': ['AAPL', 'MSFT']}`. Rows must match every column.
+            Columns indexed with `Table.create_index` are looked up in the
+            index, so only the partitions holding the values are read. If not
+            provided, rows are not filtered by value.
+        limit : int, optional
+            Maximum number of rows to read. A negative limit reads the last
+            rows instead. If not provided, all matching rows are read.
+        iloc : slice, list or numpy.ndarray of int, optional
+            Positions of the rows to read, e.g. `slice(1000, 2000)`. Can't be
+            combined with `rows` or `where`. If not provided, rows are not
+            selected by position.
         mmap: bool, optional
             Use memory mapping when opening table on disk, by default `False` on
             Windows and `True` on other systems.
+        low_memory: bool, optional
+            Convert to Pandas one column at a time, releasing the Arrow memory
+            as each column is converted. Lowers peak memory use to about the
+            size of the table, but leaves every column in its own block, which
+            can make some Pandas operations slower. By default `False`
 
         Returns
         -------
@@ -319,13 +383,33 @@ class Store:
         IndexTypeMismatchError
             If row values do not match the table index dtype.
         TypeError
-            If ``table_name``, ``cols``, or ``rows`` has an invalid type.
+            If ``table_name``, ``cols``, ``rows``, ``where``, ``limit``,
+            ``iloc``, or ``low_memory`` has an invalid type.
         ValueError
             If ``mmap`` is not a bool or ``None``.
         """
-        return Table(table_name, self.name).read_pandas(cols=cols, rows=rows, mmap=mmap)
+        table = Table(table_name, self.name)
+        return table.read_pandas(
+            cols=cols,
+            rows=rows,
+            where=where,
+            limit=limit,
+            iloc=iloc,
+            mmap=mmap,
+            low_memory=low_memory,
+        )
 
-    def read_polars(self, table_name, *, cols=None, rows=None, mmap=None):
+    def read_polars(
+        self,
+        table_name,
+        *,
+        cols=None,
+        rows=None,
+        where=None,
+        limit=None,
+        iloc=None,
+        mmap=None,
+    ):
         """Reads Polars DataFrame or Series from store
 
         Parameters
@@ -336,7 +420,23 @@ class Store:
         rows : Collection, optional
             List of index values or filter-predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
-            or `between`. If not provided, all rows are read.
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are `(first, second)` tuples, or first level values
+            that select all of their rows, and ranges compare them
+            lexicographically.
+        where : dict, optional
+            Mapping of column names to the values to keep rows for, e.g.
+            `{'symbol': ['AAPL', 'MSFT']}`. Rows must match every column.
+            Columns indexed with `Table.create_index` are looked up in the
+            index, so only the partitions holding the values are read. If not
+            provided, rows are not filtered by value.
+        limit : int, optional
+            Maximum number of rows to read. A negative limit reads the last
+            rows instead. If not provided, all matching rows are read.
+        iloc : slice, list or numpy.ndarray of int, optional
+            Positions of the rows to read, e.g. `slice(1000, 2000)`. Can't be
+            combined with `rows` or `where`. If not provided, rows are not
+            selected by position.
         mmap: bool, optional
             Use memory mapping when opening table on disk, by default `False` on
             Windows and `True` on other systems.
@@ -362,11 +462,44 @@ class Store:
         IndexTypeMismatchError
             If row values do not match the table index dtype.
         TypeError
-            If ``table_name``, ``cols``, or ``rows`` has an invalid type.
+            If ``table_name``, ``cols``, ``rows``, ``where``, ``limit``, or
+            ``iloc`` has an invalid type.
+        ValueError
+            If ``mmap`` is not a bool or ``None``.
+        """
+        return Table(table_name, self.name).read_polars(
+            cols=cols, rows=rows, where=where, limit=limit, iloc=iloc, mmap=mmap
+        )
+
+    def scan_polars(self, table_name, *, mmap=None):
+        """Lazily scans a table in the store as a Polars LazyFrame
+
+        Parameters
+        ----------
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        polars.LazyFrame
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        StoreNotFoundError
+            If the store does not exist.
+        ForbiddenTableNameError
+            If ``table_name`` is reserved or not a valid path name.
+        TableNotFoundError
+            If the table does not exist.
+        TypeError
+            If ``table_name`` has an invalid type.
         ValueError
             If ``mmap`` is not a bool or ``None``.
         """
-        return Table(table_name, self.name).read_polars(cols=cols, rows=rows, mmap=mmap)
+        return Table(table_name, self.name).scan_polars(mmap=mmap)
 
     def write_table(
         self,
@@ -378,6 +511,11 @@ class Store:
         partition_size=DEFAULT_PARTITION_SIZE,
         errors="raise",
         warnings="warn",
+        validate="full",
+        bloom_filter=False,
+        dictionary=None,
+        partition_by=None,
+        partition_key=None,
     ):
         """Writes a DataFrame to the current store as a partitioned table
 
@@ -392,9 +530,11 @@ class Store:
             The name of the table the DataFrame will be stored as
         df : pandas DataFrame or Series, polars DataFrame or Series, or pyarrow Table
             The DataFrame to be stored
-        index : str, optional
-            The name of the column to be used as index. Uses current index for
-            Pandas or a standard integer index for Arrow and Polars if `index` not
+        index : str or list of str, optional
+            The name of the column to be used as index, or the names of the two
+            columns of a composite index, which sorts the rows lexicographically.
+            Uses current index for Pandas, including a MultiIndex of two levels,
+            or a standard integer index for Arrow and Polars if `index` not
             provided, by default `None`
         partition_size : int, optional
             The size of each partition in bytes. A `partition_size` value of `-1`
@@ -406,6 +546,28 @@ class Store:
         warnings : str, optional
             Whether or not to warn if an unsorted index is about to get sorted.
             Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
+        bloom_filter : bool, optional
+            Keep a Bloom filter of the index values of each partition, so reads
+            of a list of rows skip partitions that don't hold any of them. By
+            default `False`
+        dictionary : Collection[str], optional
+            Columns to store dictionary encoded, with one dictionary shared by
+            the whole table. The columns are read as categoricals. By default
+            `None`
+        partition_by : str, optional
+            Partition a table with a datetime index by calendar period instead
+            of by size. Can be either `h`, `D`, `W`, `M`, `Q` or `Y`. By
+            default `None`
+        partition_key : str, optional
+            Column to group the rows by, with the rows of each key sorted by
+            the index and stored in partitions of their own. Reads with
+            `where={partition_key: [...]}` only open the partitions of those
+            keys. By default `None`
 
         Raises
         ------
@@ -430,7 +592,7 @@ class Store:
         TypeError
             If arguments have invalid types.
         ValueError
-            If ``errors`` or ``warnings`` is invalid.
+            If ``errors``, ``warnings`` or ``validate`` is invalid.
         """
         Table(table_name, self.name).write(
             df,
@@ -438,9 +600,14 @@ class Store:
             errors=errors,
             warnings=warnings,
             partition_size=partition_size,
+            validate=validate,
+            bloom_filter=bloom_filter,
+            dictionary=dictionary,
+            partition_by=partition_by,
+            partition_key=partition_key,
         )
 
-    def append_table(self, table_name, df, *, warnings="warn"):
+    def append_table(self, table_name, df, *, warnings="warn", validate="full"):
         """Appends data to a table
 
         Parameters
@@ -452,6 +619,19 @@ class Store:
         warnings : str, optional
             Whether or not to warn if an unsorted index is about to get sorted.
             Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
+        bloom_filter : bool, optional
+            Keep a Bloom filter of the index values of each partition, so reads
+            of a list of rows skip partitions that don't hold any of them. By
+            default `False`
+        dictionary : Collection[str], optional
+            Columns to store dictionary encoded, with one dictionary shared by
+            the whole table. The columns are read as categoricals. By default
+            `None`
 
         Raises
         ------
@@ -482,9 +662,24 @@ class Store:
         TypeError
             If arguments have invalid types.
         ValueError
-            If ``warnings`` is invalid.
+            If ``warnings`` or ``validate`` is invalid.
+        """
+        Table(table_name, self.name).append(df, warnings=warnings, validate=validate)
+
+    def enforce_retention(self):
+        """Drops the rows that the retention policies of the tables in the
+        store don't keep. Tables without a retention policy are left as they
+        are.
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        StoreNotFoundError
+            If the store does not exist.
         """
-        Table(table_name, self.name).append(df, warnings=warnings)
+        for table_name in self.list_tables():
+            Table(table_name, self.name).enforce_retention()
 
     def rename_table(self, table_name, *, to):
         """Renames a table
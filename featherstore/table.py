@@ -1,11 +1,13 @@
+import contextlib
 import os
 
 from featherstore import _utils
-from featherstore._metadata import Metadata
 from featherstore._table import (
+    _versions,
     append,
     astype,
     common,
+    dataset,
     drop,
     insert,
     insert_cols,
@@ -13,7 +15,12 @@ from featherstore._table import (
     misc,
     read,
     rename_cols,
+    retention,
+    sample,
+    scan,
+    secondary_index,
     update,
+    upsert,
     write,
 )
 from featherstore.connection import current_db
@@ -58,10 +65,14 @@ class Table:
         misc.can_init_table(table_name, store_name)
 
         self._table_path = os.path.join(current_db(), store_name, table_name)
-        self._table_data = Metadata(self._table_path, "table")
-        self._partition_data = Metadata(self._table_path, "partition")
+        metadata = _versions.load_metadata(self._table_path)
+        self._table_data, self._partition_data = metadata
+        self._commit = None
+        self._pinned_files = None
 
-    def read_arrow(self, *, cols=None, rows=None, mmap=None):
+    def read_arrow(
+        self, *, cols=None, rows=None, where=None, limit=None, iloc=None, mmap=None
+    ):
         """Reads the data as a PyArrow Table
 
         Parameters
@@ -72,7 +83,26 @@ class Table:
         rows : Collection, optional
             List of index values or filter-predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
-            or `between`. If not provided, all rows are read.
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are `(first, second)` tuples, or first level values
+            that select all of their rows, and ranges compare them
+            lexicographically.
+        where : dict, optional
+            Mapping of column names to the values to keep rows for, e.g.
+            `{'symbol': ['AAPL', 'MSFT']}`. Rows must match every column.
+            Columns indexed with `create_index` are looked up in the index,
+            so only the partitions holding the values are read, as are only
+            the partitions of the given keys of a table partitioned by key. If
+            not provided, rows are not filtered by value.
+        limit : int, optional
+            Maximum number of rows to read. A negative limit reads the last
+            rows instead. Only the partitions holding the rows are opened. If
+            not provided, all matching rows are read.
+        iloc : slice, list or numpy.ndarray of int, optional
+            Positions of the rows to read, e.g. `slice(1000, 2000)`. Only the
+            partitions overlapping the positions are opened. Can't be combined
+            with `rows` or `where`. If not provided, rows are not selected by
+            position.
         mmap: bool, optional
             Use memory mapping when opening table on disk, by default `False` on
             Windows and `True` on other systems.
@@ -94,31 +124,125 @@ class Table:
         IndexTypeMismatchError
             If row values do not match the table index dtype.
         TypeError
-            If ``cols`` or ``rows`` has an invalid type.
+            If ``cols``, ``rows``, ``where``, ``limit`` or ``iloc`` has an
+            invalid type, or the values in ``where`` don't match their column
+            types.
         ValueError
-            If ``mmap`` is not a bool or ``None``.
+            If ``mmap`` is not a bool or ``None``, or ``iloc`` is combined with
+            ``rows`` or ``where``.
+        IndexError
+            If any position in ``iloc`` is out of bounds.
         """
-        read.can_read_table(self, cols, rows, mmap)
+        with _versions.pin(self) as table:
+            read.can_read_table(table, cols, rows, mmap)
+            read.can_filter_where(table, where)
+            read.can_limit_rows(limit)
+            read.can_read_iloc(table, iloc, rows, where)
+
+            index_name = table._table_data["index_name"]
+            has_default_index = table._table_data["has_default_index"]
+            stored_cols = table._table_data["columns"]
+
+            cols = common.format_cols_arg(cols, like=stored_cols)
+            cols = read.add_index_levels_to_cols(table, cols)
+            rows = read.format_rows_arg(table, rows)
+            where = read.format_where_arg(table, where)
+
+            if iloc is None:
+                partition_names = read.get_partition_names(table, rows)
+                partition_names = read.skip_partitions_without_rows(
+                    table, partition_names, rows
+                )
+            else:
+                partition_names, iloc = read.locate_positions(table, iloc)
+            df = read.read_table(
+                table,
+                partition_names,
+                cols,
+                rows,
+                mmap=mmap,
+                where=where,
+                limit=limit,
+                iloc=iloc,
+            )
+
+        reads_all_rows = (
+            rows.values() is None and not where and limit is None and iloc is None
+        )
+        if has_default_index and (
+            reads_all_rows or common.index_is_default(df[index_name])
+        ):
+            df = read.drop_default_index(df, index_name)
 
-        index_name = self._table_data["index_name"]
-        index_type = self._table_data["index_dtype"]
-        has_default_index = self._table_data["has_default_index"]
-        stored_cols = self._table_data["columns"]
+        return df
+
+    def read_batches(self, *, cols=None, rows=None, mmap=None):
+        """Reads the data as a stream of PyArrow record batches
+
+        Partitions are read one at a time as the stream is consumed. The
+        returned reader implements the Arrow PyCapsule stream interface, so it
+        can be passed directly to any library that accepts Arrow streams.
+
+        Parameters
+        ----------
+        cols : Collection, optional
+            List of column names or filter predicates in the form of
+            `{'like': pattern}`. If not provided, all columns are read.
+        rows : Collection, optional
+            List of index values or filter-predicates in the form of
+            `{keyword: value}`, where keyword can be either `before`, `after`,
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are given as in :meth:`read_arrow`. A list of index
+            values is read in full before streaming starts.
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        pyarrow.RecordBatchReader
+
+        Raises
+        ------
+        Same exceptions as :meth:`read_arrow`.
+        """
+        if not read.is_row_range(rows):
+            df = self.read_arrow(cols=cols, rows=rows, mmap=mmap)
+            return read.make_batch_reader(df)
+
+        table, lease = _versions.pin_version(self)
+        # The version stays pinned until the stream is read or dropped
+        _versions.release_when_collected(table, lease)
+        read.can_read_table(table, cols, rows, mmap)
+
+        stored_cols = table._table_data["columns"]
 
         cols = common.format_cols_arg(cols, like=stored_cols)
-        rows = common.format_rows_arg(rows, to_dtype=index_type)
+        cols = read.add_index_levels_to_cols(table, cols)
+        rows = read.format_rows_arg(table, rows)
 
-        partition_names = read.get_partition_names(self, rows)
-        df = read.read_table(self, partition_names, cols, rows, mmap=mmap)
+        partition_names = read.get_partition_names(table, rows)
+        return read.stream_table(table, partition_names, cols, rows, mmap, lease)
 
-        if has_default_index and (
-            rows.values() is None or common.index_is_default(df[index_name])
-        ):
-            df = read.drop_default_index(df, index_name)
+    def __arrow_c_stream__(self, requested_schema=None):
+        """Exports the table through the Arrow PyCapsule stream interface
 
-        return df
+        Same as `Table.read_batches().__arrow_c_stream__(requested_schema)`.
+        """
+        reader = self.read_batches()
+        return reader.__arrow_c_stream__(requested_schema)
 
-    def read_pandas(self, *, cols=None, rows=None, mmap=None):
+    def read_pandas(
+        self,
+        *,
+        cols=None,
+        rows=None,
+        where=None,
+        limit=None,
+        iloc=None,
+        mmap=None,
+        low_memory=False,
+    ):
         """Reads the data as a Pandas DataFrame or Series
 
         Parameters
@@ -129,10 +253,34 @@ class Table:
         rows : Collection, optional
             List of index values or filter-predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
-            or `between`. If not provided, all rows are read.
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are `(first, second)` tuples, or first level values
+            that select all of their rows, and ranges compare them
+            lexicographically.
+        where : dict, optional
+            Mapping of column names to the values to keep rows for, e.g.
+            `{'symbol': ['AAPL', 'MSFT']}`. Rows must match every column.
+            Columns indexed with `create_index` are looked up in the index,
+            so only the partitions holding the values are read, as are only
+            the partitions of the given keys of a table partitioned by key. If
+            not provided, rows are not filtered by value.
+        limit : int, optional
+            Maximum number of rows to read. A negative limit reads the last
+            rows instead. Only the partitions holding the rows are opened. If
+            not provided, all matching rows are read.
+        iloc : slice, list or numpy.ndarray of int, optional
+            Positions of the rows to read, e.g. `slice(1000, 2000)`. Only the
+            partitions overlapping the positions are opened. Can't be combined
+            with `rows` or `where`. If not provided, rows are not selected by
+            position.
         mmap: bool, optional
             Use memory mapping when opening table on disk, by default `False` on
             Windows and `True` on other systems.
+        low_memory: bool, optional
+            Convert to Pandas one column at a time, releasing the Arrow memory
+            as each column is converted. Lowers peak memory use to about the
+            size of the table, but leaves every column in its own block, which
+            can make some Pandas operations slower. By default `False`
 
         Returns
         -------
@@ -140,13 +288,34 @@ class Table:
 
         Raises
         ------
-        Same exceptions as :meth:`read_arrow`.
+        Same exceptions as :meth:`read_arrow`, and ``TypeError`` if
+        ``low_memory`` is not a bool.
         """
-        df = self.read_arrow(cols=cols, rows=rows, mmap=mmap)
-        df = read.convert_table_to_pandas(df)
+        read.can_convert_to_pandas(low_memory)
+        # The index is rebuilt from the metadata of the version the data is
+        # read from
+        with _versions.pin(self) as table:
+            df = table.read_arrow(
+                cols=cols, rows=rows, where=where, limit=limit, iloc=iloc, mmap=mmap
+            )
+
+            is_row_range = read.is_row_range(rows) and not where
+            is_row_range = is_row_range and common.get_partition_key(table) is None
+            is_row_range = is_row_range and (iloc is None or isinstance(iloc, slice))
+            index_freq = read.get_index_freq(table, is_row_range)
+            index_levels = common.get_composite_index(table)
+        df = read.convert_table_to_pandas(
+            df,
+            index_freq=index_freq,
+            is_row_range=is_row_range,
+            low_memory=low_memory,
+            index_levels=index_levels,
+        )
         return df
 
-    def read_polars(self, *, cols=None, rows=None, mmap=None):
+    def read_polars(
+        self, *, cols=None, rows=None, where=None, limit=None, iloc=None, mmap=None
+    ):
         """Reads the data as a Polars DataFrame or Series
 
         Parameters
@@ -157,7 +326,26 @@ class Table:
         rows : Collection, optional
             List of index values or filter-predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
-            or `between`. If not provided, all rows are read.
+            or `between`. If not provided, all rows are read. Rows of a
+            composite index are `(first, second)` tuples, or first level values
+            that select all of their rows, and ranges compare them
+            lexicographically.
+        where : dict, optional
+            Mapping of column names to the values to keep rows for, e.g.
+            `{'symbol': ['AAPL', 'MSFT']}`. Rows must match every column.
+            Columns indexed with `create_index` are looked up in the index,
+            so only the partitions holding the values are read, as are only
+            the partitions of the given keys of a table partitioned by key. If
+            not provided, rows are not filtered by value.
+        limit : int, optional
+            Maximum number of rows to read. A negative limit reads the last
+            rows instead. Only the partitions holding the rows are opened. If
+            not provided, all matching rows are read.
+        iloc : slice, list or numpy.ndarray of int, optional
+            Positions of the rows to read, e.g. `slice(1000, 2000)`. Only the
+            partitions overlapping the positions are opened. Can't be combined
+            with `rows` or `where`. If not provided, rows are not selected by
+            position.
         mmap: bool, optional
             Use memory mapping when opening table on disk, by default `False` on
             Windows and `True` on other systems.
@@ -170,10 +358,199 @@ class Table:
         ------
         Same exceptions as :meth:`read_arrow`.
         """
-        df = self.read_arrow(cols=cols, rows=rows, mmap=mmap)
+        df = self.read_arrow(
+            cols=cols, rows=rows, where=where, limit=limit, iloc=iloc, mmap=mmap
+        )
         df = read.convert_table_to_polars(df)
         return df
 
+    def head(self, n=5, *, cols=None, mmap=None):
+        """Reads the first `n` rows as a Pandas DataFrame or Series
+
+        Only the partitions holding the first `n` rows are opened.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of rows to read, by default 5
+        cols : Collection, optional
+            List of column names or filter predicates in the form of
+            `{'like': pattern}`. If not provided, all columns are read.
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        pandas.DataFrame or pandas.Series
+
+        Raises
+        ------
+        Same exceptions as :meth:`read_arrow`, and ``ValueError`` if ``n`` is
+        negative.
+        """
+        read.can_read_head_or_tail(n)
+        return self.read_pandas(cols=cols, limit=n, mmap=mmap)
+
+    def tail(self, n=5, *, cols=None, mmap=None):
+        """Reads the last `n` rows as a Pandas DataFrame or Series
+
+        Only the partitions holding the last `n` rows are opened.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of rows to read, by default 5
+        cols : Collection, optional
+            List of column names or filter predicates in the form of
+            `{'like': pattern}`. If not provided, all columns are read.
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        pandas.DataFrame or pandas.Series
+
+        Raises
+        ------
+        Same exceptions as :meth:`read_arrow`, and ``ValueError`` if ``n`` is
+        negative.
+        """
+        read.can_read_head_or_tail(n)
+        return self.read_pandas(cols=cols, limit=-n, mmap=mmap)
+
+    def sample(self, n=None, *, frac=None, seed=None, cols=None, mmap=None):
+        """Reads a random sample of rows as a Pandas DataFrame or Series
+
+        Rows are chosen by position, so only the partitions holding the
+        sampled rows are opened. The rows are returned in stored order.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of rows to sample. Can't be combined with `frac`.
+        frac : float, optional
+            Fraction of the rows to sample, between 0 and 1. Can't be combined
+            with `n`.
+        seed : int, optional
+            Seed for the random number generator, for reproducible samples
+        cols : Collection, optional
+            List of column names or filter predicates in the form of
+            `{'like': pattern}`. If not provided, all columns are read.
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        pandas.DataFrame or pandas.Series
+
+        Raises
+        ------
+        Same exceptions as :meth:`read_arrow`, and ``ValueError`` if neither or
+        both of ``n`` and ``frac`` are given, or they are out of range.
+        """
+        # The positions are drawn from the version the rows are read from
+        with _versions.pin(self) as table:
+            sample.can_sample(table, n, frac, seed)
+            positions = sample.sample_positions(table, n, frac, seed)
+            return table.read_pandas(cols=cols, iloc=positions, mmap=mmap)
+
+    def scan_polars(self, *, mmap=None):
+        """Lazily scans the table as a Polars LazyFrame
+
+        Column selections, filters that only use the index, and `head(n)` are
+        pushed down into the scan, so partitions and columns the query doesn't
+        need are never read. Tables with a default index are scanned without
+        the index column. The scan reads the version of the table published
+        when it's made, which is kept as long as the LazyFrame is referenced.
+
+        Parameters
+        ----------
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        polars.LazyFrame
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        ValueError
+            If ``mmap`` is not a bool or ``None``.
+        """
+        scan.can_scan_table(self, mmap)
+        return scan.scan_table(self, mmap)
+
+    def to_dataset(self, *, mmap=None):
+        """Exposes the table as a PyArrow Dataset without reading it
+
+        Each partition file is a fragment of the dataset, tagged with the
+        smallest and largest index value it holds, so filters on the index skip
+        the partitions that can't match. Tables with a default index are
+        exposed without the index column. Partitions whose files don't hold
+        their data as it's read, like those of tables with dictionary columns
+        or with rows dropped by a deletion vector, are still one fragment
+        each, read and decoded in memory one at a time as they're scanned. The
+        dataset reads the version of the
+        table published when it's made, which is kept as long as the dataset is
+        referenced.
+
+        Parameters
+        ----------
+        mmap: bool, optional
+            Use memory mapping when opening table on disk, by default `False` on
+            Windows and `True` on other systems.
+
+        Returns
+        -------
+        pyarrow.dataset.Dataset
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        ValueError
+            If ``mmap`` is not a bool or ``None``.
+        """
+        dataset.can_make_dataset(self, mmap)
+        return dataset.make_dataset(self, mmap)
+
+    def register_duckdb(self, connection, *, name=None):
+        """Registers the table as a view in a DuckDB connection
+
+        The view is backed by :meth:`to_dataset`, so DuckDB queries the
+        partition files directly without copying the table into memory first.
+
+        Parameters
+        ----------
+        connection : duckdb.DuckDBPyConnection
+            The connection to register the table in.
+        name : str, optional
+            The name of the view, by default the table name
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        TypeError
+            If ``connection`` is not a DuckDB connection or ``name`` is not a
+            str.
+        """
+        dataset.can_make_dataset(self, mmap=None)
+        dataset.can_register_duckdb(connection, name)
+        dataset.register_duckdb(self, connection, name)
+
     def write(
         self,
         df,
@@ -183,6 +560,11 @@ class Table:
         partition_size=DEFAULT_PARTITION_SIZE,
         errors="raise",
         warnings="warn",
+        validate="full",
+        bloom_filter=False,
+        dictionary=None,
+        partition_by=None,
+        partition_key=None,
     ):
         """Writes a DataFrame to the current table.
 
@@ -191,13 +573,19 @@ class Table:
         (date, time, or timestamp). FeatherStore sorts the DataFrame by the
         index before storage.
 
+        A composite index of two levels, like a Pandas MultiIndex of (symbol,
+        timestamp), sorts the rows lexicographically. Its first level is stored
+        like a `partition_key` column, and reads select rows by `(first,
+        second)` tuples or by first level values alone.
+
         Parameters
         ----------
         df : pandas DataFrame or Series, polars DataFrame or Series, or pyarrow Table
             The DataFrame to be stored
-        index : str, optional
-            The name of the column to be used as index. Uses current index for
-            Pandas or a standard integer index for Arrow and Polars if `index` not
+        index : str or list of str, optional
+            The name of the column to be used as index, or the names of the two
+            columns of a composite index. Uses current index for Pandas or a
+            standard integer index for Arrow and Polars if `index` not
             provided, by default `None`
         partition_size : int, optional
             The size of each partition in bytes. A `partition_size` value of `-1`
@@ -209,6 +597,42 @@ class Table:
         warnings : str, optional
             Whether or not to warn if an unsorted index is about to get sorted.
             Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
+        bloom_filter : bool, optional
+            Keep a Bloom filter of the index values of each partition, which
+            lets reads of a list of rows skip partitions that don't hold any of
+            them without opening their files. Mostly useful for string or
+            sparse integer indices, where the rows looked up are spread over
+            many partitions. The filters are kept up to date as the table
+            changes. By default `False`
+        dictionary : Collection[str], optional
+            Columns to store dictionary encoded, with one dictionary shared by
+            the whole table. Partitions then only store indices into the
+            dictionary, and the columns are read as ``pd.Categorical``,
+            ``pl.Categorical`` or Arrow dictionary arrays. Best suited for
+            columns with few distinct values. By default `None`
+        partition_by : str, optional
+            Partition a table with a datetime index by calendar period instead
+            of by size, with one partition per period. Can be either `h`, `D`,
+            `W`, `M`, `Q` or `Y`, optionally prefixed by `1`. Partitions are
+            then found from the index values alone, appends only rewrite the
+            partition of the last period, and rows dropped period by period
+            drop whole partitions. `partition_size` is ignored. By default
+            `None`
+        partition_key : str, optional
+            Column to group the rows by, like a symbol in a table holding many
+            time series. The rows of each key are sorted by the index and
+            stored in partitions of their own, split by `partition_size`, so
+            reads with `where={partition_key: [...]}` only open the partitions
+            of those keys. The index then only has to be unique within each
+            key, and `validate='cheap'` trusts the rows to be sorted by key and
+            index. Tables partitioned by key can be read, appended to and have
+            their columns changed, but rows can't be inserted, updated, upserted
+            or dropped. By default `None`
 
         Raises
         ------
@@ -216,10 +640,14 @@ class Table:
             If FeatherStore is not connected to a database.
         TableAlreadyExistsError
             If ``errors='raise'`` and the table already exists.
+        ColumnNotFoundError
+            If ``dictionary`` or ``partition_key`` names a column not in the
+            table.
         DuplicateColumnNamesError
             If column names are not unique.
         DuplicateIndexValuesError
-            If index values are not unique.
+            If index values are not unique, or not unique within each key when
+            ``partition_key`` is given.
         IndexNotInColumnsError
             If ``index`` is not among the table columns.
         UnsupportedIndexTypeError
@@ -229,23 +657,175 @@ class Table:
         TypeError
             If arguments have invalid types.
         ValueError
-            If ``errors`` or ``warnings`` is invalid.
+            If ``errors``, ``warnings`` or ``validate`` is invalid, or a
+            composite index doesn't have two levels.
         """
-        write.can_write_table(self, df, index, partition_size, errors, warnings)
+        write.can_write_index_levels(df, index, partition_by, partition_key)
+        composite_index = write.has_composite_index(df, index)
+        df, index, partition_key = write.split_index_levels(df, index, partition_key)
+        write.can_write_table(
+            self,
+            df,
+            index,
+            partition_size,
+            errors,
+            warnings,
+            validate,
+            bloom_filter,
+            dictionary,
+            partition_by,
+            partition_key,
+        )
 
-        df = common.format_table(df, index, warnings)
-        rows_per_partition = common.compute_rows_per_partition(df, partition_size)
+        # A stored table is replaced by a new version, so readers keep seeing
+        # it until the commit is published
+        replaces_table = self.exists()
+        if not replaces_table:
+            self._create_table()
+        try:
+            with write.commit(self):
+                self._stage_table(
+                    df,
+                    index,
+                    partition_size,
+                    warnings,
+                    validate,
+                    bloom_filter,
+                    dictionary,
+                    partition_by,
+                    partition_key,
+                    composite_index,
+                )
+        except BaseException:
+            if not replaces_table:
+                self.drop_table(warnings="ignore")
+            raise
+
+    def write_stream(
+        self,
+        batches,
+        /,
+        schema=None,
+        index=None,
+        *,
+        partition_size=DEFAULT_PARTITION_SIZE,
+        errors="raise",
+        warnings="warn",
+        validate="full",
+        bloom_filter=False,
+    ):
+        """Writes a stream of batches to the current table, without holding
+        more than a few partitions of it in memory.
+
+        Meant for tables too large to fit in memory, like a large file read in
+        chunks. Each partition is written to disk as soon as enough rows have
+        arrived, while the table only becomes visible once the stream ends, when
+        its metadata is published together with the partitions. A table that's
+        overwritten is read as it was until then. If the stream raises, nothing
+        is stored and an overwritten table is kept as it was.
+
+        Each batch is sorted by the index if needed, and must come after the
+        batch before it. Without an index column, like Arrow and Polars batches
+        or Pandas batches with a range index, the rows of the whole stream are
+        numbered from 0. The rows are partitioned like `write` partitions them,
+        but `dictionary`, `partition_by`, `partition_key` and composite indices
+        aren't supported.
 
-        partitions = write.create_partitions(df, rows_per_partition)
-        metadata = write.generate_metadata(
-            partitions, partition_size, rows_per_partition
-        )
-        self.drop_table(warnings="ignore")
-        self._create_table()
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+        Parameters
+        ----------
+        batches : Iterable
+            The batches to be stored, in order, as pandas DataFrames or Series,
+            polars DataFrames or Series, or pyarrow Tables or RecordBatches. Can
+            be a generator or a pyarrow RecordBatchReader
+        schema : pyarrow Schema, optional
+            The schema each batch is cast to, which also lets an empty stream
+            be stored as an empty table. Uses the schema of the first batch if
+            not provided, by default `None`
+        index : str, optional
+            The name of the column to be used as index. Uses current index for
+            Pandas or a standard integer index for Arrow and Polars if `index`
+            not provided, by default `None`
+        partition_size : int, optional
+            The size of each partition in bytes, estimated from the first batch.
+            A `partition_size` value of `-1` disables partitioning, which holds
+            the whole stream in memory, by default 128 MB
+        errors : str, optional
+            Whether to raise an error if the table already exists. Can be either
+            `raise` or `ignore`; `ignore` overwrites the existing table.
+            Default is `raise`.
+        warnings : str, optional
+            Whether or not to warn if the index of a batch is about to get
+            sorted. Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check each batch before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index of each
+            batch is sorted and unique, while `none` also skips checking that
+            the batches come in order. By default `full`
+        bloom_filter : bool, optional
+            Keep a Bloom filter of the index values of each partition, like
+            `write` does. By default `False`
 
-    def append(self, df, *, warnings="warn"):
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableAlreadyExistsError
+            If ``errors='raise'`` and the table already exists.
+        AppendIndexError
+            If a batch doesn't come after the batch before it.
+        ColumnMismatchError
+            If the columns of a batch don't match the schema.
+        ColumnDtypeMismatchError
+            If a batch can't be cast to the schema.
+        DuplicateColumnNamesError
+            If column names are not unique.
+        DuplicateIndexValuesError
+            If the index values of a batch are not unique.
+        IndexNotInColumnsError
+            If ``index`` is not among the table columns.
+        UnsupportedIndexTypeError
+            If the index type is not supported.
+        TypeError
+            If arguments have invalid types.
+        ValueError
+            If ``errors``, ``warnings`` or ``validate`` is invalid, or the
+            stream is empty and no ``schema`` is provided.
+        """
+        write.can_write_stream(
+            self,
+            batches,
+            schema,
+            index,
+            partition_size,
+            errors,
+            warnings,
+            validate,
+            bloom_filter,
+        )
+        # A stored table is replaced by a new version once the stream ends, and
+        # kept as it is if the stream fails
+        replaces_table = self.exists()
+        if not replaces_table:
+            self._create_table()
+        try:
+            with write.commit(self):
+                metadata = write.write_stream(
+                    self,
+                    batches,
+                    schema,
+                    index,
+                    partition_size,
+                    warnings,
+                    validate,
+                    bloom_filter,
+                )
+                write.replace_metadata(self, metadata)
+        except BaseException:
+            if not replaces_table:
+                self.drop_table(warnings="ignore")
+            raise
+
+    def append(self, df, *, warnings="warn", validate="full"):
         """Appends data to the current table
 
         Parameters
@@ -255,6 +835,11 @@ class Table:
         warnings : str, optional
             Whether or not to warn if an unsorted index is about to get sorted.
             Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
 
         Raises
         ------
@@ -281,36 +866,73 @@ class Table:
         TypeError
             If ``df`` has an invalid type.
         ValueError
-            If ``warnings`` is invalid.
+            If ``warnings`` or ``validate`` is invalid.
         """
-        append.can_append_table(self, df, warnings)
+        df = append.split_index_levels(df)
+        append.can_append_table(self, df, warnings, validate)
 
         index_name = self._table_data["index_name"]
         has_default_index = self._table_data["has_default_index"]
         rows_per_partition = self._table_data["rows_per_partition"]
-        last_partition_name = self._partition_data.keys()[-1]
-
-        df = common.format_table(df, index_name, warnings)
+        partition_by = common.get_partition_by(self)
+        partition_key = common.get_partition_key(self)
+        all_partition_names = self._partition_data.keys()
+        last_partition_name = all_partition_names[-1]
+        stored_schema = common.get_stored_schema(self)
+
+        assume_sorted = validate != "full"
+        df = common.format_table(
+            df,
+            index_name,
+            warnings,
+            assume_sorted=assume_sorted,
+            schema=stored_schema,
+            dictionaries=common.get_dictionaries(self),
+            partition_key=partition_key,
+        )
         if has_default_index:
             if common.index_is_default(df[index_name]):
                 df = append.format_default_index(self, df)
             else:
                 has_default_index = insert_rows.has_still_default_index(self, df)
-        last_partition = read.read_table(self, [last_partition_name])
 
-        df = append.append_data(df, to=last_partition)
-        partitions = append.create_partitions(
-            df, rows_per_partition, last_partition_name
-        )
+        if partition_key is None:
+            partition_names = [last_partition_name]
+            last_partition = read.read_table(self, partition_names)
+            df = append.append_data(df, to=last_partition)
+            index_freq = append.update_index_freq(self, df)
+            partitions = append.create_partitions(
+                df, rows_per_partition, last_partition_name, partition_by=partition_by
+            )
+        else:  # Only the last partition of each appended key is rewritten
+            last_partitions = append.get_last_partitions_of_keys(self, df)
+            partition_names = sorted(last_partitions.values())
+            if partition_names:
+                stored_df = read.read_table(self, partition_names)
+                df = append.append_data(df, to=stored_df)
+            index_freq = None
+            partitions = append.create_key_partitions(
+                df,
+                rows_per_partition,
+                last_partitions,
+                all_partition_names,
+                partition_key=partition_key,
+            )
 
         metadata = common.update_metadata(
-            self, partitions, [last_partition_name], has_default_index=has_default_index
+            self,
+            partitions,
+            partition_names,
+            has_default_index=has_default_index,
+            index_freq=index_freq,
         )
 
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+        with write.commit(self):
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
+            self.enforce_retention()
 
-    def update(self, df):
+    def update(self, df, *, validate="full"):
         """Updates data in the current table.
 
         *Note*: You can't use this method to update index values. Updating index
@@ -322,6 +944,11 @@ class Table:
         df : pandas DataFrame or Series, polars DataFrame, or pyarrow Table
             The updated data. The index of `df` is the rows to be updated, while
             the columns of `df` are the new values.
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
 
         Raises
         ------
@@ -345,23 +972,136 @@ class Table:
             If any row is not in the stored table.
         TypeError
             If ``df`` is not a supported table type.
+        ValueError
+            If ``validate`` is invalid.
         """
-        update.can_update_table(self, df)
+        update.can_update_table(self, df, validate)
 
         index_name = self._table_data["index_name"]
         index_type = self._table_data["index_dtype"]
-        rows_per_partition = self._table_data["rows_per_partition"]
-
-        df = common.format_table(df, index_name=index_name, warnings=False)
-        rows = common.format_rows_arg(df[index_name].to_pylist(), to_dtype=index_type)
+        stored_schema = common.get_stored_schema(self)
+
+        assume_sorted = validate != "full"
+        df = common.format_table(
+            df,
+            index_name=index_name,
+            warnings=False,
+            assume_sorted=assume_sorted,
+            schema=stored_schema,
+            dictionaries=common.get_dictionaries(self),
+        )
+        rows = common.format_rows_arg(df[index_name], to_dtype=index_type)
 
         partition_names = read.get_partition_names(self, rows)
         stored_df = read.read_table(self, partition_names)
 
         df = update.update_data(stored_df, to=df)
-        partitions = write.create_partitions(df, rows_per_partition, partition_names)
+        partitions = update.create_partitions(self, df, partition_names)
+
+        with write.commit(self):
+            update.update_dictionaries(self, partitions)
+            write.write_partitions(self, partitions)
+
+    def upsert(self, df, *, warnings="warn", validate="full"):
+        """Updates the rows of `df` that are already stored and inserts the rest.
+
+        The stored rows are replaced and the new rows inserted in a single
+        pass over the affected partitions. If every row comes after the last
+        stored row, only the last partition is read, like in `append`.
+
+        Parameters
+        ----------
+        df : pandas DataFrame or Series, polars DataFrame, or pyarrow Table
+            The data to be upserted. `df` must have the same index and column
+            types as the stored data.
+        warnings : str, optional
+            Whether or not to warn if an unsorted index is about to get sorted.
+            Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        ColumnDtypeMismatchError
+            If column dtypes are incompatible.
+        ColumnMismatchError
+            If column names do not match the stored table.
+        DuplicateColumnNamesError
+            If column names are not unique.
+        DuplicateIndexValuesError
+            If index values are not unique.
+        IndexNameMismatchError
+            If the index name does not match the stored table.
+        IndexTypeMismatchError
+            If the index type does not match the stored table.
+        TypeError
+            If ``df`` is not a supported table type.
+        ValueError
+            If ``warnings`` or ``validate`` is invalid.
+        """
+        upsert.can_upsert_table(self, df, warnings, validate)
+
+        index_name = self._table_data["index_name"]
+        index_type = self._table_data["index_dtype"]
+        rows_per_partition = self._table_data["rows_per_partition"]
+        partition_by = common.get_partition_by(self)
+        all_partition_names = self._partition_data.keys()
+        stored_schema = common.get_stored_schema(self)
+
+        assume_sorted = validate != "full"
+        df = common.format_table(
+            df,
+            index_name=index_name,
+            warnings=warnings,
+            assume_sorted=assume_sorted,
+            schema=stored_schema,
+            dictionaries=common.get_dictionaries(self),
+        )
+
+        if upsert.only_appends(self, df):
+            partition_names = all_partition_names[-1:]
+            stored_df = read.read_table(self, partition_names)
+            has_default_index = insert_rows.has_still_default_index(self, df)
 
-        write.write_partitions(partitions, self._table_path)
+            df = append.append_data(df, to=stored_df)
+            index_freq = append.update_index_freq(self, df)
+            partitions = append.create_partitions(
+                df, rows_per_partition, partition_names[0], partition_by=partition_by
+            )
+        else:
+            rows = common.format_rows_arg(df[index_name], to_dtype=index_type)
+            partition_names = read.get_partition_names(self, rows)
+            stored_df = read.read_table(self, partition_names)
+            has_default_index = upsert.has_still_default_index(self, df, stored_df)
+
+            df = upsert.upsert_data(df, to=stored_df)
+            index_freq = common.reset_index_freq(self)
+            partitions = insert_rows.create_partitions(
+                df,
+                rows_per_partition,
+                partition_names,
+                all_partition_names,
+                partition_by=partition_by,
+            )
+
+        metadata = common.update_metadata(
+            self,
+            partitions,
+            partition_names,
+            has_default_index=has_default_index,
+            index_freq=index_freq,
+        )
+
+        with write.commit(self):
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
 
     def insert(self, df, *, idx=-1, warnings="warn"):
         """Insert one or more rows or columns into the current table.
@@ -395,7 +1135,7 @@ class Table:
         else:
             self.insert_columns(df, idx=idx, warnings=warnings)
 
-    def insert_rows(self, df, *, warnings="warn"):
+    def insert_rows(self, df, *, warnings="warn", validate="full"):
         """Insert one or more rows into the current table.
 
         Parameters
@@ -406,6 +1146,11 @@ class Table:
         warnings : str, optional
             Whether or not to warn if an unsorted index is about to get sorted.
             Can be either `warn` or `ignore`, by default `warn`
+        validate : str, optional
+            How thoroughly to check `df` before storing it. Can be either
+            `full`, `cheap` or `none`. `cheap` trusts that the index is sorted
+            and unique and skips the checks that scan the index values, while
+            `none` skips all checks on the data itself. By default `full`
 
         Raises
         ------
@@ -430,33 +1175,52 @@ class Table:
         TypeError
             If ``df`` is not a supported table type.
         ValueError
-            If ``warnings`` is invalid.
+            If ``warnings`` or ``validate`` is invalid.
         """
-        insert_rows.can_insert_rows(self, df, warnings)
+        insert_rows.can_insert_rows(self, df, warnings, validate)
 
         index_name = self._table_data["index_name"]
         index_type = self._table_data["index_dtype"]
         rows_per_partition = self._table_data["rows_per_partition"]
+        partition_by = common.get_partition_by(self)
         all_partition_names = self._partition_data.keys()
-
-        df = common.format_table(df, index_name=index_name, warnings=warnings)
+        stored_schema = common.get_stored_schema(self)
+
+        assume_sorted = validate != "full"
+        df = common.format_table(
+            df,
+            index_name=index_name,
+            warnings=warnings,
+            assume_sorted=assume_sorted,
+            schema=stored_schema,
+            dictionaries=common.get_dictionaries(self),
+        )
         has_default_index = insert_rows.has_still_default_index(self, df)
 
-        rows = common.format_rows_arg(df[index_name].to_pylist(), to_dtype=index_type)
+        rows = common.format_rows_arg(df[index_name], to_dtype=index_type)
         partition_names = read.get_partition_names(self, rows)
         stored_df = read.read_table(self, partition_names)
 
-        df = insert_rows.insert_data(df, to=stored_df)
+        df = insert_rows.insert_data(df, to=stored_df, validate=validate)
         partitions = insert_rows.create_partitions(
-            df, rows_per_partition, partition_names, all_partition_names
+            df,
+            rows_per_partition,
+            partition_names,
+            all_partition_names,
+            partition_by=partition_by,
         )
 
         metadata = common.update_metadata(
-            self, partitions, partition_names, has_default_index=has_default_index
+            self,
+            partitions,
+            partition_names,
+            has_default_index=has_default_index,
+            index_freq=common.reset_index_freq(self),
         )
 
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+        with write.commit(self):
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
 
     def insert_columns(self, df, *, idx=-1, warnings="warn"):
         """Insert one or more columns into the current table.
@@ -501,6 +1265,7 @@ class Table:
 
         index_name = self._table_data["index_name"]
         partition_size = self._table_data["partition_size"]
+        partition_by = common.get_partition_by(self)
 
         df = common.format_table(df, index_name=index_name, warnings=warnings)
 
@@ -512,7 +1277,7 @@ class Table:
         rows_per_partition = common.compute_rows_per_partition(df, partition_size)
         columns = df.column_names
         partitions = insert_cols.create_partitions(
-            df, rows_per_partition, partition_names
+            df, rows_per_partition, partition_names, partition_by=partition_by
         )
 
         metadata = common.update_metadata(
@@ -523,8 +1288,9 @@ class Table:
             columns=columns,
         )
 
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+        with write.commit(self):
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
 
     def drop(self, *, cols=None, rows=None):
         """Drop specified labels from rows or columns.
@@ -570,7 +1336,7 @@ class Table:
         if cols is not None:
             self.drop_columns(cols)
 
-    def drop_rows(self, rows):
+    def drop_rows(self, rows, *, deletion_vector=False):
         """Drops specified rows from table
 
         Same as `Table.drop(rows=value)`
@@ -581,35 +1347,148 @@ class Table:
             List of index values or filter predicates in the form of
             `{keyword: value}`, where keyword can be either `before`, `after`,
             or `between`, by default `None`
+        deletion_vector : bool, optional
+            Whether to record the dropped rows in a deletion vector of each
+            partition instead of rewriting the partitions. The rows are
+            filtered out on read and removed from the files when the
+            partitions are rewritten or the table is compacted. Tables with a
+            default index are always rewritten. By default `False`
 
         Raises
         ------
         Same exceptions as :meth:`drop` when dropping rows.
         """
-        drop.can_drop_rows_from_table(self, rows)
+        drop.can_drop_rows_from_table(self, rows, deletion_vector)
 
         index_name = self._table_data["index_name"]
         index_type = self._table_data["index_dtype"]
         rows_per_partition = self._table_data["rows_per_partition"]
+        partition_by = common.get_partition_by(self)
+        stored_schema = common.get_stored_schema(self)
 
         rows = common.format_rows_arg(rows, to_dtype=index_type)
+        has_default_index = drop.has_still_default_index(self, rows)
+        index_freq = drop.update_index_freq(self, rows)
+
+        with write.commit(self):
+            covered_partitions, partition_names = drop.split_covered_partitions(
+                self, rows
+            )
+            drop.drop_covered_partitions(
+                self,
+                covered_partitions,
+                has_default_index=has_default_index,
+                index_freq=index_freq,
+            )
+            if not partition_names:
+                return
+
+            if deletion_vector:
+                stored_indexes = drop.read_stored_indexes(self, partition_names)
+                if stored_indexes is not None:
+                    metadata, emptied_partitions = drop.mark_rows_as_deleted(
+                        self, rows, stored_indexes
+                    )
+                    drop.drop_partitions(self, emptied_partitions)
+                    write.write_metadata(self, metadata)
+                    return
+
+            partition_names = drop.add_adjacent_partition(self, partition_names)
+            stored_df = read.read_table(self, partition_names)
+
+            df = drop.drop_rows_from_data(stored_df, rows, index_name)
+            df = common.format_table(
+                df, index_name=index_name, warnings=False, schema=stored_schema
+            )
+            partitions = drop.create_partitions(
+                df, rows_per_partition, partition_names, partition_by=partition_by
+            )
+
+            metadata = common.update_metadata(
+                self,
+                partitions,
+                partition_names,
+                has_default_index=has_default_index,
+                index_freq=index_freq,
+            )
+            partitions_to_drop = drop.get_partitions_to_drop(
+                partitions, partition_names
+            )
+            drop.drop_partitions(self, partitions_to_drop)
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
+
+    def set_retention(self, *, keep=None, max_rows=None):
+        """Sets how much data the table keeps.
+
+        The retention policy is enforced after every append and by
+        `enforce_retention`. Whole partitions that fall outside it are removed
+        without being read, and only the partition at the boundary is
+        rewritten. Calling it without arguments removes the policy.
 
-        partition_names = drop.get_partition_names(self, rows)
-        stored_df = read.read_table(self, partition_names)
+        Parameters
+        ----------
+        keep : str or timedelta, optional
+            The time span of rows to keep, counted back from the last row in
+            the table, like `"90D"`. Only for datetime indices. By default
+            `None`
+        max_rows : int, optional
+            The number of rows to keep, counted from the end of the table. By
+            default `None`
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        TypeError
+            If ``keep`` or ``max_rows`` has an invalid type, or ``keep`` is
+            given for a table without a datetime index.
+        ValueError
+            If ``keep`` is not a positive time span or ``max_rows`` is less
+            than 1.
+        """
+        retention.can_set_retention(self, keep, max_rows)
+        with write.commit(self):
+            self._table_data["retention"] = retention.make_retention(keep, max_rows)
 
-        df = drop.drop_rows_from_data(stored_df, rows, index_name)
-        df = common.format_table(df, index_name=index_name, warnings=False)
-        partitions = drop.create_partitions(df, rows_per_partition, partition_names)
+    def enforce_retention(self):
+        """Drops the rows that the retention policy of the table doesn't keep.
 
-        has_default_index = drop.has_still_default_index(self, rows)
-        metadata = common.update_metadata(
-            self, partitions, partition_names, has_default_index=has_default_index
-        )
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        """
+        retention.can_enforce_retention(self)
+        rows = retention.get_rows_to_drop(self)
+        if rows is not None:
+            self.drop_rows(rows)
 
-        partitions_to_drop = drop.get_partitions_to_drop(partitions, partition_names)
-        drop.drop_partitions(self, partitions_to_drop)
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+    def compact(self):
+        """Removes the rows dropped with deletion vectors from the partition
+        files.
+
+        Only the partitions with a deletion vector are rewritten.
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        """
+        drop.can_compact_table(self)
+
+        partition_names = drop.get_partitions_to_compact(self)
+        if not partition_names:
+            return
+        partitions = drop.compact_partitions(self, partition_names)
+        with write.commit(self):
+            write.write_partitions(self, partitions)
 
     def drop_columns(self, cols):
         """Drops specified columns from table
@@ -630,6 +1509,8 @@ class Table:
 
         index_name = self._table_data["index_name"]
         partition_size = self._table_data["partition_size"]
+        partition_by = common.get_partition_by(self)
+        partition_key = common.get_partition_key(self)
         stored_cols = self._table_data["columns"]
         old_rows_per_partition = self._table_data["rows_per_partition"]
 
@@ -639,11 +1520,19 @@ class Table:
         stored_df = read.read_table(self, partition_names)
 
         df = drop.drop_cols_from_data(stored_df, cols)
-        df = common.format_table(df, index_name=index_name, warnings=False)
+        df = common.format_table(
+            df, index_name=index_name, warnings=False, partition_key=partition_key
+        )
 
         rows_per_partition = common.compute_rows_per_partition(df, partition_size)
         rows_per_partition = max(rows_per_partition, old_rows_per_partition)
-        partitions = drop.create_partitions(df, rows_per_partition, partition_names)
+        partitions = drop.create_partitions(
+            df,
+            rows_per_partition,
+            partition_names,
+            partition_by=partition_by,
+            partition_key=partition_key,
+        )
 
         columns = df.column_names
         metadata = common.update_metadata(
@@ -655,9 +1544,10 @@ class Table:
         )
 
         partitions_to_drop = drop.get_partitions_to_drop(partitions, partition_names)
-        drop.drop_partitions(self, partitions_to_drop)
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+        with write.commit(self):
+            drop.drop_partitions(self, partitions_to_drop)
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
 
     def rename_columns(self, cols, *, to=None):
         """Rename one or more columns.
@@ -698,18 +1588,30 @@ class Table:
 
         index_name = self._table_data["index_name"]
         rows_per_partition = self._table_data["rows_per_partition"]
+        partition_by = common.get_partition_by(self)
 
         cols_mapping = common.format_cols_and_to_args(cols, to)
+        partition_key = rename_cols.get_renamed_partition_key(self, cols_mapping)
 
         partition_names = read.get_partition_names(self, None)
         df = read.read_table(self, partition_names)
 
         df = rename_cols.rename_columns(df, cols_mapping)
-        df = common.format_table(df, index_name=index_name, warnings=False)
-        partitions = write.create_partitions(df, rows_per_partition, partition_names)
+        df = common.format_table(
+            df, index_name=index_name, warnings=False, partition_key=partition_key
+        )
+        partitions = write.create_partitions(
+            df,
+            rows_per_partition,
+            partition_names,
+            partition_by=partition_by,
+            partition_key=partition_key,
+        )
 
-        rename_cols.write_metadata(self, partitions)
-        write.write_partitions(partitions, self._table_path)
+        with write.commit(self):
+            rename_cols.write_metadata(self, partitions, cols_mapping)
+            secondary_index.rename_indexes(self, cols_mapping)
+            write.write_partitions(self, partitions)
 
     @property
     def columns(self):
@@ -741,7 +1643,8 @@ class Table:
         """
         misc.can_reorder_columns(self, cols)
         index_name = self._table_data["index_name"]
-        self._table_data["columns"] = [index_name, *cols]
+        with write.commit(self):
+            self._table_data["columns"] = [index_name, *cols]
 
     def reorder_columns(self, cols):
         """Reorder the current columns
@@ -777,6 +1680,11 @@ class Table:
         -------
         pandas.Index
         """
+        read.can_read_table(self, cols=None, rows=None, mmap=None)
+        if self._table_data["has_default_index"]:
+            return read.make_default_index(self)
+        if common.get_composite_index(self) is not None:
+            return self.read_pandas(cols=[]).index
         index = self.read_arrow(cols=[])
         index = index.to_pandas().index
         return index
@@ -817,6 +1725,8 @@ class Table:
         astype.can_change_type(self, cols, to)
         index_name = self._table_data["index_name"]
         partition_size = self._table_data["partition_size"]
+        partition_by = common.get_partition_by(self)
+        partition_key = common.get_partition_key(self)
 
         astype_mapping = common.format_cols_and_to_args(cols, to)
 
@@ -824,11 +1734,19 @@ class Table:
         df = read.read_table(self, partition_names)
 
         df = astype.change_type(df, astype_mapping)
-        df = common.format_table(df, index_name=index_name, warnings=False)
+        df = common.format_table(
+            df, index_name=index_name, warnings=False, partition_key=partition_key
+        )
         has_default_index = astype.has_still_default_index(self, df)
 
         rows_per_partition = common.compute_rows_per_partition(df, partition_size)
-        partitions = astype.create_partitions(df, rows_per_partition, partition_names)
+        partitions = astype.create_partitions(
+            df,
+            rows_per_partition,
+            partition_names,
+            partition_by=partition_by,
+            partition_key=partition_key,
+        )
 
         metadata = common.update_metadata(
             self,
@@ -836,13 +1754,68 @@ class Table:
             partition_names,
             rows_per_partition=rows_per_partition,
             has_default_index=has_default_index,
+            index_freq=common.infer_index_freq(df[index_name]),
         )
 
         partitions_to_drop = astype.get_partitions_to_drop(partitions, partition_names)
-        drop.drop_partitions(self, partitions_to_drop)
+        with write.commit(self):
+            drop.drop_partitions(self, partitions_to_drop)
+            write.write_metadata(self, metadata)
+            write.write_partitions(self, partitions)
+
+    def create_index(self, col):
+        """Indexes a column so that rows can be read by its values
+
+        Reading with `read_arrow(where={col: values})` then only opens the
+        partitions that hold the values. The index stores where each distinct value is found in each partition.
+        It's kept up to date as the table changes, only re-indexing the
+        partitions being written. Indexing a column that is already indexed
+        rebuilds its index.
+
+        Parameters
+        ----------
+        col : str
+            The column to index.
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        ColumnNotFoundError
+            If ``col`` is not in the table.
+        IndexNameInColumnsError
+            If ``col`` is the table index.
+        TypeError
+            If ``col`` is not a str.
+        """
+        secondary_index.can_create_index(self, col)
+        with write.commit(self):
+            secondary_index.create_index(self, col)
+
+    def drop_index(self, col):
+        """Removes the index of a column made by `create_index`
+
+        Parameters
+        ----------
+        col : str
+            The indexed column.
 
-        write.write_metadata(self, metadata)
-        write.write_partitions(partitions, self._table_path)
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        TypeError
+            If ``col`` is not a str.
+        ValueError
+            If ``col`` is not indexed.
+        """
+        secondary_index.can_drop_index(self, col)
+        with write.commit(self):
+            secondary_index.drop_index(self, col)
 
     def rename_table(self, *, to):
         """Renames the current table
@@ -866,12 +1839,13 @@ class Table:
         new_table_name = to
         store_path = os.path.split(self._table_path)[0]
         new_path = os.path.join(store_path, new_table_name)
-        misc.can_rename_table(new_table_name, new_path)
+        misc.can_rename_table(self, new_table_name, new_path)
 
+        _versions.close_metadata(self)
         os.rename(self._table_path, new_path)
         self._table_path = new_path
-        self._table_data = Metadata(self._table_path, "table")
-        self._partition_data = Metadata(self._table_path, "partition")
+        metadata = _versions.load_metadata(self._table_path)
+        self._table_data, self._partition_data = metadata
 
     def drop_table(self, *, warnings="warn"):
         """Deletes the current table
@@ -889,10 +1863,40 @@ class Table:
         """
         misc.can_drop_table(self, warnings)
         if self.exists():
+            _versions.close_metadata(self)
             _utils.delete_folder_tree(self._table_path, current_db())
             # Reset the metadata indices:
-            self._table_data = Metadata(self._table_path, "table")
-            self._partition_data = Metadata(self._table_path, "partition")
+            metadata = _versions.load_metadata(self._table_path)
+            self._table_data, self._partition_data = metadata
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Groups changes to the table into one commit.
+
+        The changes made within the block are kept in memory and each changed
+        partition is written once when the block ends, together with a single
+        metadata update. Reads of the table within the block see the changes,
+        while other readers keep seeing the table as it was until the block
+        ends. If the block raises, none of the changes are stored.
+
+        Yields
+        ------
+        Table
+            The table itself.
+
+        Raises
+        ------
+        NotConnectedError
+            If FeatherStore is not connected to a database.
+        TableNotFoundError
+            If the table does not exist.
+        TableInBatchError
+            If ``write``, ``repartition``, ``rename_table`` or ``drop_table`` is
+            called within the block.
+        """
+        misc.can_start_batch(self)
+        with write.commit(self):
+            yield self
 
     def create_snapshot(self, path):
         """Creates a compressed backup of the table.
@@ -924,15 +1928,41 @@ class Table:
             The size of each partition in bytes. A `new_partition_size` value of `-1`
             disables partitioning
         """
-        df = self.read_arrow()
-        has_default_index = self._table_data["has_default_index"]
-        if has_default_index:
-            index_name = None
-        else:
-            index_name = self._table_data["index_name"]
-        self.write(
-            df, index=index_name, partition_size=new_partition_size, errors="ignore"
-        )
+        # Published as one version, with its secondary indexes and retention
+        # policy, so readers never see the table half repartitioned
+        with write.commit(self):
+            df = self.read_arrow()
+            has_default_index = self._table_data["has_default_index"]
+            indexed_cols = common.get_indexed_cols(self)
+            retention_policy = retention.get_retention(self)
+            bloom_filter = common.has_bloom_filters(self)
+            dictionary = list(common.get_dictionaries(self))
+            partition_by = common.get_partition_by(self)
+            partition_key = common.get_partition_key(self)
+            composite_index = common.get_composite_index(self)
+            if composite_index is not None:  # Both levels are written as the index
+                df, index_name, partition_key = write.split_index_levels(
+                    df, composite_index, partition_key
+                )
+            elif has_default_index:
+                index_name = None
+            else:
+                index_name = self._table_data["index_name"]
+            self._stage_table(
+                df,
+                index_name,
+                new_partition_size,
+                "ignore",
+                "full",
+                bloom_filter,
+                dictionary,
+                partition_by,
+                partition_key,
+                composite_index is not None,
+            )
+            for col in indexed_cols:
+                secondary_index.create_index(self, col)
+            self._table_data["retention"] = retention_policy
 
     @property
     def shape(self):
@@ -966,7 +1996,51 @@ class Table:
         table_name = os.path.split(self._table_path)[-1]
         return table_name
 
+    def _stage_table(
+        self,
+        df,
+        index,
+        partition_size,
+        warnings,
+        validate,
+        bloom_filter,
+        dictionary,
+        partition_by,
+        partition_key,
+        composite_index,
+    ):
+        # Stages the data in place of the table in the current commit
+        assume_sorted = validate != "full"
+        df = common.format_table(
+            df,
+            index,
+            warnings,
+            assume_sorted=assume_sorted,
+            partition_key=partition_key,
+        )
+        df = write.cast_dictionary_cols(df, dictionary)
+        rows_per_partition = common.compute_rows_per_partition(df, partition_size)
+        partition_by = write.format_partition_by(partition_by)
+
+        partitions = write.create_partitions(
+            df,
+            rows_per_partition,
+            partition_by=partition_by,
+            partition_key=partition_key,
+        )
+        metadata = write.generate_metadata(
+            partitions,
+            partition_size,
+            rows_per_partition,
+            bloom_filter,
+            dictionary,
+            partition_by,
+            partition_key,
+            composite_index,
+        )
+        write.replace_metadata(self, metadata)
+        write.write_partitions(self, partitions)
+
     def _create_table(self):
         os.makedirs(self._table_path)
-        self._table_data.create()
-        self._partition_data.create()
+        _versions.create(self._table_path)
@@ -1,10 +1,15 @@
 """Public re-exports and shared constants for the test fixture package."""
 
-from os.path import join
-
 from featherstore._utils import DEFAULT_ARROW_INDEX_NAME
 
-from ._utils import get_index_name
+from ._utils import (
+    DB_PATH,
+    MD_NAME,
+    STORE_NAME,
+    TABLE_NAME,
+    TABLE_PATH,
+    get_index_name,
+)
 from .assertions import assert_df_equals, assert_store_table_equal, assert_table_equals
 from .cast_table import cast_timestamp_index, change_dtype, to_arrow_dtype
 from .convert_table import convert_expected, convert_table
@@ -20,6 +25,7 @@ from .make_table import (
     continuous_string_index,
     default_index,
     fake_default_index,
+    make_symbols_table,
     make_table,
     sorted_binary_index,
     sorted_date32_index,
@@ -37,22 +43,20 @@ from .make_table import (
     unsorted_int_index,
     unsorted_string_index,
 )
-from .misc import get_partition_size, paths
+from .misc import get_partition_size, paths, write_table
 from .partitions import (
+    assert_bloom_filters_match_files,
+    assert_dictionary_indices_are_stored,
+    assert_index_is_not_stored,
     assert_partition_bounds_are_ordered,
     assert_partition_metadata_matches_files,
+    assert_value_indexes_match_files,
     partition_layout,
     partition_names,
     pruned_partitions,
 )
 from .split_table import split_table
 
-DB_PATH = join("tests", "_db")
-STORE_NAME = "test_store"
-TABLE_NAME = "table_name"
-TABLE_PATH = join(DB_PATH, STORE_NAME, TABLE_NAME)
-MD_NAME = "db"
-
 __all__ = [
     "DB_PATH",
     "DEFAULT_ARROW_INDEX_NAME",
@@ -60,11 +64,15 @@ __all__ = [
     "STORE_NAME",
     "TABLE_NAME",
     "TABLE_PATH",
+    "assert_bloom_filters_match_files",
     "assert_df_equals",
+    "assert_dictionary_indices_are_stored",
+    "assert_index_is_not_stored",
     "assert_partition_bounds_are_ordered",
     "assert_partition_metadata_matches_files",
     "assert_store_table_equal",
     "assert_table_equals",
+    "assert_value_indexes_match_files",
     "cast_timestamp_index",
     "change_dtype",
     "continuous_datetime_index",
@@ -76,6 +84,7 @@ __all__ = [
     "get_index_name",
     "get_partition_size",
     "insert_column_names_at",
+    "make_symbols_table",
     "make_table",
     "partition_layout",
     "partition_names",
@@ -102,4 +111,5 @@ __all__ = [
     "unsorted_int_index",
     "unsorted_string_index",
     "update_table",
+    "write_table",
 ]
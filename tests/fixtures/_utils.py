@@ -4,12 +4,20 @@ Put cross-cutting table utilities here (column/index names, dtype parsing,
 Arrow formatting) rather than in the public test API.
 """
 
+import os
+
 import pandas as pd
 import polars as pl
 import pyarrow as pa
 
 from featherstore._utils import DEFAULT_ARROW_INDEX_NAME
 
+DB_PATH = os.path.join("tests", "_db")
+STORE_NAME = "test_store"
+TABLE_NAME = "table_name"
+TABLE_PATH = os.path.join(DB_PATH, STORE_NAME, TABLE_NAME)
+MD_NAME = "db"
+
 
 def parse_astype(astype):
     """Split a ``make_table``-style astype into ``(backend, as_series)``."""
@@ -45,6 +45,27 @@ def make_table(
     return df
 
 
+def make_symbols_table(
+    symbols=("MSFT", "AAPL", "GOOG"),
+    rows=20,
+    start="2021-01-01",
+    *,
+    composite_index=False,
+):
+    """A Pandas table of `rows` days per symbol, with the symbol in a `symbol`
+    column, or as the first level of a (symbol, Date) index."""
+    dfs = []
+    for symbol in symbols:
+        df = make_table(default_index, rows=rows, cols=2, astype="pandas")
+        df.index = pd.date_range(start, periods=rows, freq="D", name="Date")
+        df.insert(0, "symbol", symbol)
+        dfs.append(df)
+    df = pd.concat(dfs)
+    if composite_index:
+        df = df.set_index("symbol", append=True).swaplevel()
+    return df
+
+
 def _make_df(rows, cols, dtype=None, rng=None):
     col_dtypes = get_col_dtypes()
 
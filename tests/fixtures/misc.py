@@ -13,6 +13,8 @@ import pyarrow as pa
 from featherstore import _utils
 from featherstore.table import DEFAULT_PARTITION_SIZE
 
+from ._utils import TABLE_NAME
+
 
 class Paths:
     """Entry point for deleting files and trees via the production deletion stack."""
@@ -53,6 +55,13 @@ def get_partition_size(df, num_partitions=5):
     return partition_size
 
 
+def write_table(store, df, table_name=TABLE_NAME, *, num_partitions=5, **kwargs):
+    """Writes `df` to `table_name` in about `num_partitions` partitions."""
+    table = store.select_table(table_name)
+    table.write(df, partition_size=get_partition_size(df, num_partitions), **kwargs)
+    return table
+
+
 def _has_rangeindex(df):
     try:
         index_type = df.schema.pandas_metadata["index_columns"][0]["kind"]
@@ -9,10 +9,21 @@ import os
 from collections import namedtuple
 
 import pyarrow as pa
+import pyarrow.compute as pc
 from pyarrow import ipc
 
-from featherstore._table.common import format_rows_arg
-from featherstore._table.read import get_partition_names
+from featherstore._table._bloom_filter import might_contain
+from featherstore._table._indexers import ColIndexer
+from featherstore._table._versions import (
+    get_index_files,
+    get_partition_files,
+    make_partition_path,
+)
+from featherstore._table.read import (
+    format_rows_arg,
+    get_partition_names,
+    iter_partitions,
+)
 
 Partition = namedtuple("Partition", ["name", "min", "max", "num_rows"])
 
@@ -33,7 +44,7 @@ def partition_names(partitions):
 
 def pruned_partitions(table, rows):
     """The partitions a read of `rows` narrows down to."""
-    rows = format_rows_arg(rows, to_dtype=table._table_data["index_dtype"])
+    rows = format_rows_arg(table, rows)
     return get_partition_names(table, rows)
 
 
@@ -46,10 +57,79 @@ def assert_partition_metadata_matches_files(table):
     assert table._table_data["num_rows"] == sum(p.num_rows for p in partitions)
 
     for partition in partitions:
-        index = _read_partition_index(table, partition.name)
-        assert partition.min == index[0]
-        assert partition.max == index[-1]
-        assert partition.num_rows == len(index)
+        stored = _read_partition(table, partition.name)
+        schema = _stored_file_schema(table)
+        assert partition.num_rows == stored.num_rows
+        if _has_virtual_index(table, stored):
+            assert stored.schema == schema.remove(0)
+            assert_virtual_index_matches_metadata(partition)
+        else:
+            assert stored.schema == schema
+            index = stored[table._table_data["index_name"]].to_pylist()
+            assert partition.min == index[0]
+            assert partition.max == index[-1]
+
+
+def _stored_file_schema(table):
+    # Dictionary encoded columns are stored as indices into the table-wide
+    # dictionary
+    schema = table._table_data["schema"]
+    dictionaries = table._table_data.read().get("dictionaries", {})
+    for col in dictionaries:
+        idx = schema.get_field_index(col)
+        schema = schema.set(idx, schema.field(idx).with_type(pa.int32()))
+    return schema
+
+
+def assert_dictionary_indices_are_stored(table):
+    """Dictionary columns are stored as indices into the table dictionaries."""
+    dictionaries = table._table_data["dictionaries"]
+    for name in _stored_partition_names(table):
+        stored = _read_partition(table, name)
+        for col, dictionary in dictionaries.items():
+            assert stored.schema.field(col).type == pa.int32()
+            assert pa.compute.max(stored[col]).as_py() < len(dictionary)
+
+
+def assert_virtual_index_matches_metadata(partition):
+    """A partition without a stored index covers a continuous row range."""
+    if partition.num_rows:
+        assert partition.max - partition.min + 1 == partition.num_rows
+
+
+def assert_index_is_not_stored(table):
+    """None of the partition files of `table` contain the index column."""
+    for name in _stored_partition_names(table):
+        stored = _read_partition(table, name)
+        assert _has_virtual_index(table, stored)
+
+
+def assert_bloom_filters_match_files(table):
+    """The Bloom filter of every partition holds each of its index values."""
+    index_name = table._table_data["index_name"]
+    partition_data = table._partition_data.read()
+    for name, data in partition_data.items():
+        partition = next(iter_partitions(table, [name], ColIndexer([]), mmap=None))
+        index = partition[index_name].combine_chunks()
+        assert might_contain(data["bloom_filter"], index).all()
+
+
+def assert_value_indexes_match_files(table):
+    """Every indexed column has a sidecar pointing each value to its row."""
+    indexed_cols = table._table_data["indexed_cols"]
+    index_files = get_index_files(table)
+    for name, data in table._partition_data.read().items():
+        assert "indexes" not in data
+        stored = _read_partition(table, name)
+        for col in indexed_cols:
+            path = os.path.join(table._table_path, index_files[(name, col)])
+            with pa.OSFile(path, "r") as source:
+                index = ipc.open_file(source).read_all()
+            assert index["value"] == index["value"].take(
+                pc.sort_indices(index["value"])
+            )
+            assert sorted(index["position"].to_pylist()) == list(range(stored.num_rows))
+            assert stored[col].take(index["position"]) == index["value"]
 
 
 def assert_partition_bounds_are_ordered(table):
@@ -60,15 +140,19 @@ def assert_partition_bounds_are_ordered(table):
 
 
 def _stored_partition_names(table):
-    file_names = os.listdir(table._table_path)
-    return sorted(
-        os.path.splitext(name)[0] for name in file_names if name.endswith(".feather")
-    )
+    file_names = [
+        name for name in os.listdir(table._table_path) if name.endswith(".feather")
+    ]
+    partition_files = get_partition_files(table)
+    names = {file_name: name for name, file_name in partition_files.items()}
+    return sorted(names.get(file_name, file_name) for file_name in file_names)
 
 
-def _read_partition_index(table, partition_name):
-    path = os.path.join(table._table_path, f"{partition_name}.feather")
-    index_name = table._table_data["index_name"]
+def _has_virtual_index(table, stored):
+    return table._table_data["index_name"] not in stored.column_names
+
+
+def _read_partition(table, partition_name):
+    path = make_partition_path(table, partition_name)
     with pa.OSFile(path, "r") as source:
-        partition = ipc.open_file(source).read_all()
-    return partition[index_name].to_pylist()
+        return ipc.open_file(source).read_all()
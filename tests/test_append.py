@@ -13,7 +13,9 @@ from featherstore.exceptions import (
 
 from .fixtures import (
     TABLE_NAME,
+    assert_bloom_filters_match_files,
     assert_df_equals,
+    assert_dictionary_indices_are_stored,
     assert_partition_bounds_are_ordered,
     assert_partition_metadata_matches_files,
     assert_table_equals,
@@ -81,6 +83,60 @@ def test_store_append_table(store):
     assert_df_equals(df, expected)
 
 
+@pytest.mark.parametrize("validate", ["cheap", "none"])
+@pytest.mark.parametrize("index", [default_index, sorted_datetime_index])
+def test_append_table_with_trusted_validation(store, index, validate):
+    # Arrange
+    expected = make_table(index, astype="arrow")
+    original_df, append_df = split_table(expected, rows={"after": 20}, iloc=True)
+
+    partition_size = get_partition_size(original_df)
+    index_name = get_index_name(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, index=index_name)
+    # Act
+    table.append(append_df, validate=validate)
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_append_arrow_table_read_from_another_table(store):
+    # Arrange
+    expected = make_table(sorted_datetime_index, astype="arrow")
+    original_df, append_df = split_table(expected, rows={"after": 20}, iloc=True)
+
+    source = store.select_table("source")
+    source.write(append_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    # Act
+    table.append(source.read_arrow())
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_cheap_validation_still_checks_append_order(store):
+    # Arrange
+    original_df = make_table(rows=10, astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    # Act and Assert
+    with pytest.raises(AppendIndexError):
+        table.append(_index_value_already_in_stored_data(), validate="cheap")
+
+
+def test_append_rejects_invalid_validate_arg(store):
+    # Arrange
+    original_df, append_df = split_table(make_table(), rows={"after": 20})
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    # Act and Assert
+    with pytest.raises(ValueError):
+        table.append(append_df, validate="partial")
+
+
 def test_append_custom_values_to_default_index(store):
     df = make_table(default_index, astype="pandas")
     original_df, extra_df = split_table(df, rows={"after": 20})
@@ -119,6 +175,45 @@ def test_append_that_overflows_the_last_partition_splits_it(store):
     assert_partition_metadata_matches_files(table)
 
 
+def test_append_keeps_bloom_filters_up_to_date(store):
+    # Arrange
+    full_df = make_table(sorted_string_index, rows=36, astype="pandas")
+    original_df, append_df = split_table(full_df, rows={"after": 30}, iloc=True)
+    rows = full_df.index[[0, 31, 35]].tolist()
+    expected = full_df.loc[rows]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, bloom_filter=True)
+    # Act
+    table.append(append_df)
+    # Assert
+    assert_bloom_filters_match_files(table)
+    assert_df_equals(table.read_pandas(rows=rows), expected)
+
+
+def test_append_adds_new_values_to_the_table_dictionary(store):
+    # Arrange
+    full_df = make_table(sorted_string_index, rows=36, astype="pandas")
+    full_df["c0"] = full_df["c0"].str[:1]
+    original_df, append_df = split_table(full_df, rows={"after": 30}, iloc=True)
+    append_df["c0"] = ["new value", *append_df["c0"].iloc[1:]]
+    expected = pd.concat([original_df, append_df])["c0"].tolist()
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, dictionary=["c0"])
+    dictionary = table._table_data["dictionaries"]["c0"]
+    # Act
+    table.append(append_df)
+    # Assert
+    new_dictionary = table._table_data["dictionaries"]["c0"]
+    assert new_dictionary.slice(0, len(dictionary)).equals(dictionary)
+    assert "new value" in new_dictionary.to_pylist()
+    assert_dictionary_indices_are_stored(table)
+    assert table.read_pandas()["c0"].tolist() == expected
+
+
 def test_reading_after_the_new_seam_opens_only_the_split_off_partition(store):
     # Arrange
     full_df = make_table(default_index, rows=36, astype="pandas")
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from featherstore._table import _versions
+from featherstore.exceptions import TableInBatchError
+
+from .fixtures import (
+    assert_df_equals,
+    assert_partition_metadata_matches_files,
+    make_table,
+    sorted_datetime_index,
+    write_table,
+)
+
+
+def _change_table(table, df):
+    table.drop_rows(df.index[10:20].tolist())
+    table.update(df.iloc[[0, 25]][["c1"]] * 2)
+    table.insert_rows(df.iloc[10:15])
+
+
+def test_batch_matches_the_changes_made_one_by_one(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected_table = write_table(store, original_df, "expected_table")
+    _change_table(expected_table, original_df)
+    expected = expected_table.read_pandas()
+    # Act
+    with table.batch():
+        _change_table(table, original_df)
+        df_in_batch = table.read_pandas()
+    # Assert
+    df = table.read_pandas()
+    assert_df_equals(df_in_batch, expected)
+    assert_df_equals(df, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_batch_writes_each_partition_once(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    version = _versions.read_version(table._table_path)
+    old_files = set(_versions.get_partition_files(table).values())
+    # Act
+    with table.batch():
+        _change_table(table, original_df)
+    # Assert
+    new_version = _versions.read_version(table._table_path)
+    new_files = set(_versions.get_partition_files(table).values()) - old_files
+    assert new_version == version + 1
+    assert new_files == set(_make_file_names(new_files, new_version))
+
+
+def _make_file_names(file_names, version):
+    partition_names = {file_name.split("_")[0] for file_name in file_names}
+    return [_versions.make_file_name(name, version) for name in partition_names]
+
+
+def test_failed_batch_leaves_the_table_unchanged(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    files = set(os.listdir(table._table_path))
+    # Act
+    with pytest.raises(RuntimeError), table.batch():
+        _change_table(table, original_df)
+        raise RuntimeError("Batch failed")
+    # Assert
+    df = table.read_pandas()
+    assert_df_equals(df, original_df)
+    assert set(os.listdir(table._table_path)) == files
+
+
+def test_can_not_replace_the_table_in_a_batch(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    # Act
+    with pytest.raises(TableInBatchError), table.batch():
+        table.write(original_df, errors="ignore")
+    # Assert
+    assert_df_equals(table.read_pandas(), original_df)
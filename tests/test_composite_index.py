@@ -0,0 +1,197 @@
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from featherstore.exceptions import (
+    CompositeIndexError,
+    IndexTypeMismatchError,
+    RowNotFoundError,
+)
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_df_equals,
+    assert_partition_metadata_matches_files,
+    get_partition_size,
+    make_symbols_table,
+    pruned_partitions,
+    write_table,
+)
+
+
+def _partition_keys(table, rows):
+    partition_data = table._partition_data.read()
+    return {partition_data[name]["key"] for name in pruned_partitions(table, rows)}
+
+
+@pytest.mark.parametrize(
+    "astype",
+    [
+        lambda df: df,
+        lambda df: pa.Table.from_pandas(df),
+    ],
+)
+def test_write_sorts_rows_lexicographically(store, astype):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    expected = original_df.sort_index()
+    # Act
+    shuffled_df = astype(original_df.sample(frac=1, random_state=0))
+    table = write_table(store, shuffled_df, num_partitions=9)
+    # Assert
+    assert_df_equals(table.read_pandas(), expected)
+    assert table.index.equals(expected.index)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_write_composite_index_from_columns(store):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    expected = original_df.sort_index()
+    df = pl.from_pandas(original_df.reset_index())
+    # Act
+    table = write_table(store, df, num_partitions=9, index=["symbol", "Date"])
+    # Assert
+    assert_df_equals(table.read_pandas(), expected)
+
+
+def test_read_rows_of_first_level_prefix(store):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    expected = original_df.loc[["GOOG"]]
+    table = write_table(store, original_df, num_partitions=9)
+    # Act
+    df = table.read_pandas(rows=["GOOG"])
+    # Assert
+    assert_df_equals(df, expected)
+    assert _partition_keys(table, ["GOOG"]) == {"GOOG"}
+
+
+def test_read_list_of_composite_rows(store):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    rows = [("MSFT", "2021-01-05"), ("AAPL", "2021-01-20"), ("GOOG", "2021-01-01")]
+    expected = original_df.loc[[rows[1], rows[2], rows[0]]]
+    table = write_table(store, original_df, num_partitions=9)
+    # Act
+    df = table.read_pandas(rows=rows)
+    # Assert
+    assert_df_equals(df, expected)
+    assert len(pruned_partitions(table, rows)) == len(rows)
+
+
+@pytest.mark.parametrize(
+    ["rows", "low", "high"],
+    [
+        [{"between": ["AAPL", "GOOG"]}, ("AAPL",), ("GOOG",)],
+        [
+            {"between": [("AAPL", "2021-01-15"), ("GOOG", "2021-01-03")]},
+            ("AAPL", "2021-01-15"),
+            ("GOOG", "2021-01-03"),
+        ],
+        [{"after": ("GOOG", "2021-01-18")}, ("GOOG", "2021-01-18"), ("MSFT",)],
+        [{"before": "AAPL"}, ("AAPL",), ("AAPL",)],
+    ],
+)
+def test_read_range_of_composite_rows(store, rows, low, high):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True).sort_index()
+    expected = original_df.loc[low:high]
+    table = write_table(store, original_df, num_partitions=9)
+    # Act
+    df = table.read_pandas(rows=rows)
+    # Assert
+    assert_df_equals(df, expected)
+    assert _partition_keys(table, rows) == set(expected.index.get_level_values(0))
+
+
+def test_append_composite_rows(store):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    append_df = make_symbols_table(
+        ["AAPL", "TSLA"], rows=5, start="2021-01-21", composite_index=True
+    )
+    expected = pd.concat([original_df, append_df]).sort_index()
+    table = write_table(store, original_df, num_partitions=9)
+    # Act
+    table.append(append_df)
+    # Assert
+    assert_df_equals(table.read_pandas(), expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_repartition_keeps_composite_index(store):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    expected = original_df.sort_index()
+    table = write_table(store, original_df, num_partitions=9)
+    # Act
+    table.repartition(get_partition_size(original_df, num_partitions=4))
+    # Assert
+    assert_df_equals(table.read_pandas(), expected)
+    assert_df_equals(table.read_pandas(rows=["GOOG"]), expected.loc[["GOOG"]])
+    assert table._table_data["composite_index"]
+    assert table._table_data["columns"] == ["Date", "symbol", "c0", "c1"]
+    assert_partition_metadata_matches_files(table)
+
+
+@pytest.mark.parametrize(
+    ["rows", "exception"],
+    [
+        [[("AAPL", "2021-02-01")], RowNotFoundError],
+        [["TSLA"], RowNotFoundError],
+        [[("AAPL", "2021-01-01", 1)], ValueError],
+        [{"between": ["AAPL"]}, ValueError],
+        [[1], IndexTypeMismatchError],
+        [[("AAPL", "not a date")], IndexTypeMismatchError],
+    ],
+)
+def test_can_not_read_composite_rows(store, rows, exception):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    table = write_table(store, original_df, num_partitions=9)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.read_pandas(rows=rows)
+
+
+@pytest.mark.parametrize(
+    ["levels", "kwargs", "exception"],
+    [
+        [["symbol", "Date", "level"], {}, ValueError],
+        [["symbol", None], {}, TypeError],
+        [["symbol", "Date"], {"partition_key": "c0"}, ValueError],
+    ],
+)
+def test_can_not_write_composite_index(store, levels, kwargs, exception):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True).reset_index()
+    original_df["level"] = 1
+    original_df = original_df.set_index(["symbol", "Date", "level"][: len(levels)])
+    original_df.index.names = levels
+    table = store.select_table(TABLE_NAME)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.write(original_df, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda table, df: table.insert_rows(df),
+        lambda table, df: table.update(df),
+        lambda table, df: table.upsert(df),
+        lambda table, df: table.drop_rows(df.index[:1]),
+        lambda table, df: table.insert_columns(df[["c0"]].rename(columns={"c0": "c9"})),
+        lambda table, df: table.set_retention(max_rows=10),
+        lambda table, df: table.drop_columns(["symbol"]),
+    ],
+)
+def test_can_not_change_rows_of_table_with_composite_index(store, change):
+    # Arrange
+    original_df = make_symbols_table(composite_index=True)
+    table = write_table(store, original_df, num_partitions=9)
+    # Act and Assert
+    with pytest.raises(CompositeIndexError, match="composite index"):
+        change(table, original_df.iloc[:2])
@@ -1,3 +1,5 @@
+import os
+
 import pandas as pd
 import pytest
 
@@ -95,6 +97,7 @@ def test_default_index_behavior_when_dropping(store, rows):
     table.drop(rows=rows)
     # Assert
     assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
 
 
 def _drop_before_a_partitions_last_row(partitions):
@@ -226,6 +229,140 @@ def test_reading_across_a_removed_partition_returns_the_surrounding_rows(store):
     assert_df_equals(df, expected)
 
 
+def test_dropping_a_range_only_reads_the_boundary_partitions(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="pandas")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+
+    first, second, third, *_ = partition_layout(table)
+    for partition in (first, second):
+        os.remove(os.path.join(table._table_path, f"{partition.name}.feather"))
+    expected = original_df.loc[third.min :].iloc[1:]
+    # Act
+    table.drop_rows({"before": third.min})
+    # Assert
+    assert_df_equals(table.read_pandas(), expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_dropping_whole_partitions_writes_no_files(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="pandas")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+
+    _, second, *rest = partition_layout(table)
+    files = {f"{partition.name}.feather" for partition in rest}
+    # Act
+    table.drop_rows({"before": second.max})
+    # Assert
+    assert set(os.listdir(table._table_path)) - {".metadata"} == files
+    assert partition_names(partition_layout(table)) == partition_names(rest)
+    assert_partition_metadata_matches_files(table)
+
+
+DELETION_VECTOR_ARGS = [
+    (default_index, [10, 24, 0, 13]),
+    (continuous_string_index, pd.Index(["ab", "bd", "al"])),
+    (continuous_string_index, {"between": ["aj", "ba"]}),
+    (continuous_datetime_index, pd.DatetimeIndex(["2021-01-01", "2021-01-17"])),
+    (continuous_datetime_index, {"before": pd.Timestamp("2021-01-17")}),
+    (continuous_datetime_index, {"after": "2021-01-17"}),
+]
+
+
+@pytest.mark.parametrize(["index", "rows"], DELETION_VECTOR_ARGS)
+def test_drop_rows_with_deletion_vector(store, index, rows):
+    # Arrange
+    original_df = make_table(index, cols=5, astype="pandas")
+    expected, _ = split_table(original_df, rows=rows)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, warnings="ignore")
+    # Act
+    table.drop_rows(rows, deletion_vector=True)
+    # Assert
+    assert_table_equals(table, expected)
+    assert table.read_pandas(iloc=slice(3, 12)).index.equals(expected.index[3:12])
+    assert table.to_dataset().count_rows() == len(expected)
+
+
+def test_drop_rows_with_deletion_vector_keeps_the_partition_files(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, cols=5, astype="pandas")
+    rows = original_df.index[2:25:3].tolist()
+    expected = original_df.drop(rows)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    files = set(os.listdir(table._table_path))
+    # Act
+    table.drop_rows(rows, deletion_vector=True)
+    # Assert
+    assert set(os.listdir(table._table_path)) == files
+    assert_table_equals(table, expected)
+
+
+def test_deletion_vector_is_applied_to_secondary_index_lookups(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, cols=5, astype="pandas")
+    original_df["c0"] = [f"value {row % 4}" for row in range(len(original_df))]
+    rows = original_df.index[1:30:4].tolist()
+    expected = original_df.drop(rows)
+    expected = expected[expected["c0"] == "value 2"]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.create_index("c0")
+    # Act
+    table.drop_rows(rows, deletion_vector=True)
+    # Assert
+    df = table.read_pandas(where={"c0": ["value 2"]})
+    assert_df_equals(df, expected)
+
+
+def test_compact_removes_the_dropped_rows_from_the_files(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, cols=5, astype="pandas")
+    rows = original_df.index[2:25:3].tolist()
+    expected = original_df.drop(rows)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.drop_rows(rows, deletion_vector=True)
+    # Act
+    table.compact()
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_rewriting_a_partition_removes_its_dropped_rows(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, cols=5, astype="pandas")
+    rows = original_df.index[2:25:3].tolist()
+    update_df = original_df.iloc[[0, 29]][["c1"]] * 2
+    expected = original_df.drop(rows)
+    expected.update(update_df)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.drop_rows(rows, deletion_vector=True)
+    # Act
+    table.update(update_df)
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
 INVALID_ROWS_DTYPE = "c1, c2, c3"
 INVALID_ROWS_ELEMENTS_DTYPE = ["3", "19", "25"]
 ROWS_NOT_IN_TABLE = [2, 5, 7, 10, 459]
@@ -1,5 +1,6 @@
 import warnings
 
+import pandas as pd
 import pytest
 
 from featherstore._metadata import METADATA_FOLDER_NAME
@@ -210,6 +211,18 @@ def test_get_index(store):
     assert index.name == expected.name
 
 
+def test_get_default_index(store):
+    # Arrange
+    df = make_table(rows=30, astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    table.write(df)
+    # Act
+    index = table.index
+    # Assert
+    assert isinstance(index, pd.RangeIndex)
+    assert index.equals(df.index)
+
+
 def test_get_columns(store):
     # Arrange
     df = make_table(sorted_datetime_index)
@@ -81,6 +81,24 @@ def test_insert_table(
     assert_table_equals(table, expected)
 
 
+@pytest.mark.parametrize("validate", ["cheap", "none"])
+def test_insert_rows_with_trusted_validation(store, validate):
+    # Arrange
+    expected = make_table(continuous_datetime_index, rows=30, astype="arrow")
+    original_df, insert_df = split_table(
+        expected, rows=["2021-01-10", "2021-01-14"], index_name="Date"
+    )
+
+    partition_size = get_partition_size(original_df, 5)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index="Date", partition_size=partition_size)
+    # Act
+    table.insert_rows(insert_df, validate=validate)
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
 @pytest.mark.parametrize(
     ["index", "row_indices"],
     [
@@ -103,6 +121,19 @@ def test_insert_series(store, index, row_indices):
     assert_table_equals(table, expected)
 
 
+def test_insert_rows_with_cheap_validation_still_rejects_existing_rows(store):
+    # Arrange
+    original_df = make_table(default_index, rows=30, astype="pandas")
+    insert_df = make_table(default_index, rows=2, astype="pandas")
+    insert_df.index = [4, 40]
+
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    # Act and Assert
+    with pytest.raises(RowAlreadyExistsError):
+        table.insert_rows(insert_df, validate="cheap")
+
+
 @pytest.mark.parametrize(
     "row_indices",
     (
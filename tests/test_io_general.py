@@ -1,9 +1,12 @@
+import os
 from contextlib import nullcontext
 
 import pandas as pd
+import polars as pl
 import pyarrow as pa
 import pytest
 
+from featherstore._table._partitions import make_partitions
 from featherstore.exceptions import (
     ColumnNotFoundError,
     DuplicateColumnNamesError,
@@ -18,7 +21,11 @@ from featherstore.exceptions import (
 
 from .fixtures import (
     TABLE_NAME,
+    assert_bloom_filters_match_files,
     assert_df_equals,
+    assert_dictionary_indices_are_stored,
+    assert_index_is_not_stored,
+    assert_partition_metadata_matches_files,
     assert_table_equals,
     default_index,
     get_index_name,
@@ -36,6 +43,7 @@ from .fixtures import (
     sorted_float_index,
     sorted_large_binary_index,
     sorted_large_string_index,
+    sorted_string_index,
     sorted_time32_index,
     sorted_timedelta_index,
     sorted_uint_index,
@@ -127,6 +135,49 @@ def test_empty_df_io(store, astype):
     assert_table_equals(table, expected)
 
 
+@pytest.mark.parametrize("num_partitions", [1, 3, 7])
+def test_write_chunked_arrow_table(store, num_partitions):
+    # Arrange
+    expected = make_table(rows=40, astype="arrow")
+    chunked_df = pa.concat_tables([expected[:13], expected[13:17], expected[17:]])
+
+    partition_size = get_partition_size(expected, num_partitions)
+    table = store.select_table(TABLE_NAME)
+    # Act
+    table.write(chunked_df, partition_size=partition_size)
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_default_index_is_not_stored(store):
+    # Arrange
+    df = make_table(rows=40, astype="pandas")
+    expected = df.iloc[15:25]
+
+    partition_size = get_partition_size(df, num_partitions=4)
+    table = store.select_table(TABLE_NAME)
+    # Act
+    table.write(df, partition_size=partition_size)
+    # Assert
+    assert_index_is_not_stored(table)
+    assert_partition_metadata_matches_files(table)
+    assert_df_equals(table.read_pandas(rows={"between": [15, 24]}), expected)
+
+
+def test_partitions_within_a_chunk_are_not_copied():
+    # Arrange
+    df = make_table(rows=40, cols=1, dtype="int", astype="arrow")
+    df = pa.concat_tables([df[:20], df[20:]])
+    # Act
+    partitions = make_partitions(df, rows_per_partition=10)
+    # Assert
+    source_address = df["c0"].chunks[1].buffers()[1].address
+    partition_address = partitions[2]["c0"].buffers()[1].address
+    assert [partition.num_rows for partition in partitions] == [10, 10, 10, 10]
+    assert partition_address == source_address
+
+
 def _before_the_first_partitions_last_row(partitions):
     return {"before": partitions[0].max}, partitions[:1]
 
@@ -210,6 +261,229 @@ def test_reading_at_a_partition_seam_prunes_to_the_matching_partitions(
     assert pruned == partition_names(expected)
 
 
+@pytest.mark.parametrize("index", [sorted_string_index, unsorted_int_index])
+def test_read_rows_with_bloom_filter(store, index):
+    # Arrange
+    original_df = make_table(index, astype="pandas")
+    original_df = sort_table(original_df)
+    rows = original_df.index[[2, 3, 17, 26]].tolist()
+    expected = original_df.loc[rows]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, bloom_filter=True)
+    # Act
+    df = table.read_pandas(rows=rows)
+    # Assert
+    assert_bloom_filters_match_files(table)
+    assert_df_equals(df, expected)
+
+
+def test_bloom_filter_skips_partitions_between_the_rows(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, astype="pandas")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, bloom_filter=True)
+
+    first, *middle, last = partition_layout(table)
+    rows = [first.min, last.max]
+    expected = original_df.loc[rows]
+    for partition in middle:
+        os.remove(os.path.join(table._table_path, f"{partition.name}.feather"))
+    # Act
+    df = table.read_pandas(rows=rows)
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_bloom_filter_still_reports_missing_rows(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, astype="pandas")
+    rows = [original_df.index[0], "missing row"]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, bloom_filter=True)
+    # Act and Assert
+    with pytest.raises(RowNotFoundError):
+        table.read_pandas(rows=rows)
+
+
+def test_dictionary_cols_io(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, astype="pandas")
+    original_df["c0"] = original_df["c0"].str[:1]
+    expected = original_df.astype({"c0": "category"})
+    expected["c0"] = expected["c0"].cat.reorder_categories(original_df["c0"].unique())
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    # Act
+    table.write(original_df, partition_size=partition_size, dictionary=["c0"])
+    # Assert
+    assert_dictionary_indices_are_stored(table)
+    assert_partition_metadata_matches_files(table)
+    assert_df_equals(table.read_pandas(), expected)
+    assert table.read_polars()["c0"].dtype == pl.Categorical
+    assert pa.types.is_dictionary(table.read_arrow()["c0"].type)
+
+
+@pytest.mark.parametrize("index", [default_index, sorted_datetime_index])
+@pytest.mark.parametrize("n", [0, 3, 12, 40])
+def test_head_and_tail(store, index, n):
+    # Arrange
+    original_df = make_table(index, astype="pandas")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    head = table.head(n)
+    tail = table.tail(n)
+    # Assert
+    assert_df_equals(head, original_df.head(n))
+    assert_df_equals(tail, original_df.tail(n))
+
+
+@pytest.mark.parametrize(
+    ["rows", "limit"],
+    [
+        ({"after": 7}, 5),
+        ({"before": 20}, -4),
+        ({"between": [3, 25]}, 40),
+        ([20, 2, 11, 5], 2),
+        ([20, 2, 11, 5], -3),
+    ],
+)
+def test_read_with_limit(store, rows, limit):
+    # Arrange
+    original_df = make_table(astype="pandas")
+    if isinstance(rows, list):
+        expected = original_df.loc[rows]
+    elif "after" in rows:
+        expected = original_df.loc[rows["after"] :]
+    elif "before" in rows:
+        expected = original_df.loc[: rows["before"]]
+    else:
+        expected = original_df.loc[rows["between"][0] : rows["between"][1]]
+    expected = expected.head(limit) if limit >= 0 else expected.tail(-limit)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    df = table.read_pandas(rows=rows, limit=limit)
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_read_with_limit_only_opens_the_partitions_needed(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+
+    first, *middle, last = partition_layout(table)
+    for partition in middle:
+        os.remove(os.path.join(table._table_path, f"{partition.name}.feather"))
+    # Act
+    head = table.head(first.num_rows)
+    tail = table.read_arrow(limit=-last.num_rows)
+    # Assert
+    assert_df_equals(head, original_df.head(first.num_rows))
+    assert tail.num_rows == last.num_rows
+
+
+@pytest.mark.parametrize("index", [default_index, sorted_datetime_index])
+@pytest.mark.parametrize(
+    "iloc",
+    [
+        slice(None),
+        slice(0, 7),
+        slice(5, 23),
+        slice(-4, None),
+        slice(12, 3),
+        slice(25, 100),
+        [29, 0, 14, 15, 3, 3],
+        [-1, 8],
+        [],
+    ],
+)
+def test_read_with_iloc(store, index, iloc):
+    # Arrange
+    original_df = make_table(index, astype="pandas")
+    expected = original_df.iloc[iloc]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    df = table.read_pandas(iloc=iloc)
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_read_with_iloc_only_opens_the_partitions_needed(store):
+    # Arrange
+    original_df = make_table(astype="pandas")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+
+    first, _, *rest = partition_layout(table)
+    for partition in rest:
+        os.remove(os.path.join(table._table_path, f"{partition.name}.feather"))
+    iloc = slice(first.num_rows - 2, first.num_rows + 2)
+    # Act
+    df = table.read_arrow(iloc=iloc)
+    # Assert
+    assert df["__index_level_0__"].to_pylist() == original_df.index[iloc].tolist()
+
+
+@pytest.mark.parametrize("index", [default_index, sorted_string_index])
+@pytest.mark.parametrize(
+    ["n", "frac"], [(10, None), (1, None), (30, None), (None, 0.5)]
+)
+def test_sample(store, index, n, frac):
+    # Arrange
+    original_df = make_table(index, astype="pandas")
+    original_df = sort_table(original_df)
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    df = table.sample(n, frac=frac, seed=42)
+    # Assert
+    expected_num_rows = n if n is not None else 15
+    assert len(df) == expected_num_rows
+    assert df.index.is_unique
+    assert df.index.is_monotonic_increasing
+    assert_df_equals(df, original_df.loc[df.index])
+    assert_df_equals(table.sample(n, frac=frac, seed=42), df)
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "exception"],
+    [
+        ({}, ValueError),
+        ({"n": 5, "frac": 0.5}, ValueError),
+        ({"n": 31}, ValueError),
+        ({"n": 5.0}, TypeError),
+        ({"frac": 1.5}, ValueError),
+        ({"n": 5, "seed": "42"}, TypeError),
+    ],
+)
+def test_can_sample(store, kwargs, exception):
+    # Arrange
+    df = make_table(rows=30)
+    store.write_table(TABLE_NAME, df)
+    table = store.select_table(TABLE_NAME)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.sample(**kwargs)
+
+
 def _invalid_table_dtype():
     df = make_table(astype="pandas")
     args = [TABLE_NAME, df.values]
@@ -288,6 +562,20 @@ def _invalid_partition_size_dtype():
     return args, kwargs
 
 
+def _dictionary_col_not_in_table():
+    df = make_table()
+    args = [TABLE_NAME, df]
+    kwargs = {"dictionary": ["c0", "c3334"]}
+    return args, kwargs
+
+
+def _invalid_bloom_filter_dtype():
+    df = make_table()
+    args = [TABLE_NAME, df]
+    kwargs = {"bloom_filter": "yes"}
+    return args, kwargs
+
+
 @pytest.mark.parametrize(
     ("arguments", "exception"),
     [
@@ -300,6 +588,8 @@ def _invalid_partition_size_dtype():
         (_invalid_warnings_arg, ValueError),
         (_invalid_errors_arg, ValueError),
         (_invalid_partition_size_dtype, TypeError),
+        (_invalid_bloom_filter_dtype, TypeError),
+        (_dictionary_col_not_in_table, ColumnNotFoundError),
     ],
     ids=[
         "_invalid_table_dtype",
@@ -311,6 +601,8 @@ def _invalid_partition_size_dtype():
         "_invalid_warnings_arg",
         "_invalid_errors_arg",
         "_invalid_partition_size_dtype",
+        "_invalid_bloom_filter_dtype",
+        "_dictionary_col_not_in_table",
     ],
 )
 def test_can_write(store, arguments, exception):
@@ -344,6 +636,11 @@ ROWS_NOT_IN_TABLE = [TABLE_NAME, {"rows": [0, 1, 3334]}]
 INVALID_COL_DTYPE = [TABLE_NAME, {"cols": 14}]
 INVALID_COL_ELEMENTS_DTYPE = [TABLE_NAME, {"cols": ["c1", "C2", 12]}]
 COLS_NOT_IN_TABLE = [TABLE_NAME, {"cols": ["c0", "c1", "c3334"]}]
+INVALID_LIMIT_DTYPE = [TABLE_NAME, {"limit": 2.0}]
+INVALID_ILOC_DTYPE = [TABLE_NAME, {"iloc": (0, 5)}]
+INVALID_ILOC_STEP = [TABLE_NAME, {"iloc": slice(0, 10, 2)}]
+ILOC_OUT_OF_BOUNDS = [TABLE_NAME, {"iloc": [0, 3334]}]
+ILOC_WITH_ROWS = [TABLE_NAME, {"iloc": slice(0, 5), "rows": [0, 1]}]
 
 
 @pytest.mark.parametrize(
@@ -357,6 +654,11 @@ COLS_NOT_IN_TABLE = [TABLE_NAME, {"cols": ["c0", "c1", "c3334"]}]
         (INVALID_COL_DTYPE, TypeError),
         (INVALID_COL_ELEMENTS_DTYPE, TypeError),
         (COLS_NOT_IN_TABLE, ColumnNotFoundError),
+        (INVALID_LIMIT_DTYPE, TypeError),
+        (INVALID_ILOC_DTYPE, TypeError),
+        (INVALID_ILOC_STEP, ValueError),
+        (ILOC_OUT_OF_BOUNDS, IndexError),
+        (ILOC_WITH_ROWS, ValueError),
     ],
     ids=[
         "INVALID_TABLE_NAME_DTYPE",
@@ -367,6 +669,11 @@ COLS_NOT_IN_TABLE = [TABLE_NAME, {"cols": ["c0", "c1", "c3334"]}]
         "INVALID_COL_DTYPE",
         "INVALID_COL_ELEMENTS_DTYPE",
         "COLS_NOT_IN_TABLE",
+        "INVALID_LIMIT_DTYPE",
+        "INVALID_ILOC_DTYPE",
+        "INVALID_ILOC_STEP",
+        "ILOC_OUT_OF_BOUNDS",
+        "ILOC_WITH_ROWS",
     ],
 )
 def test_can_read(store, arguments, exception):
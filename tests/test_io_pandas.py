@@ -1,5 +1,7 @@
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 import pytest
 
 from featherstore.exceptions import MultiTypeColumnError
@@ -69,6 +71,40 @@ def test_pandas_filtering(store, index, rows, cols):
     assert_df_equals(df, expected)
 
 
+@pytest.mark.parametrize(
+    "as_array",
+    [
+        np.array,
+        pd.Series,
+        pd.Index,
+        pl.Series,
+        pa.array,
+        lambda x: pa.chunked_array([x]),
+    ],
+    ids=["numpy", "pandas", "pandas_index", "polars", "arrow", "chunked_arrow"],
+)
+@pytest.mark.parametrize(
+    ["index", "rows"],
+    [
+        (default_index, [3, 12, 27]),
+        (continuous_datetime_index, pd.to_datetime(["2021-01-07", "2021-01-20"])),
+        (continuous_string_index, ["aa", "ba"]),
+    ],
+)
+def test_pandas_filtering_with_array_like_rows(store, index, rows, as_array):
+    # Arrange
+    original_df = make_table(index, cols=3, astype="pandas")
+    _, expected = split_table(original_df, rows=list(rows))
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, warnings="ignore")
+    # Act
+    df = table.read_pandas(rows=as_array(rows))
+    # Assert
+    assert_df_equals(df, expected)
+
+
 @pytest.mark.parametrize(
     "cols", [["c0"], {"like": "c?"}, {"like": ["%0"]}, {"like": "?1%"}]
 )
@@ -163,3 +199,71 @@ def test_multitype_col_and_row_io(store):
 def _shuffle_col(df, seed=42):
     np.random.seed(seed)
     return np.random.permutation(df.values)
+
+
+@pytest.mark.parametrize(
+    "index", [default_index, continuous_datetime_index, sorted_string_index]
+)
+def test_read_pandas_with_low_memory(store, index):
+    # Arrange
+    expected = make_table(index, astype="pandas")
+    partition_size = get_partition_size(expected)
+    store.write_table(TABLE_NAME, expected, partition_size=partition_size)
+    # Act
+    df = store.read_pandas(TABLE_NAME, low_memory=True)
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_index_freq_is_kept_when_appending(store):
+    # Arrange
+    expected = make_table(continuous_datetime_index, astype="pandas")
+    original_df, append_df = split_table(expected, rows={"after": 20}, iloc=True)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    table.append(append_df)
+    # Assert
+    df = table.read_pandas(rows={"after": "2021-01-05"})
+    assert table._table_data["index_freq"] == "D"
+    assert df.index.freq == "D"
+
+
+def test_index_freq_is_dropped_when_appending_a_gap(store):
+    # Arrange
+    df = make_table(continuous_datetime_index, astype="pandas")
+    original_df, append_df = split_table(df, rows={"after": 20}, iloc=True)
+    append_df = append_df.iloc[1:]
+    expected = pd.concat([original_df, append_df])
+    expected.index.freq = None
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    table.append(append_df)
+    # Assert
+    assert table._table_data["index_freq"] is None
+    assert_df_equals(table.read_pandas(), expected)
+
+
+@pytest.mark.parametrize(
+    ["rows", "freq"],
+    [
+        ({"after": "2021-01-20"}, "D"),
+        ({"between": ["2021-01-05", "2021-01-08"]}, None),
+        (["2021-01-05"], None),
+    ],
+)
+def test_index_freq_after_dropping_rows(store, rows, freq):
+    # Arrange
+    df = make_table(continuous_datetime_index, astype="pandas")
+    partition_size = get_partition_size(df)
+    table = store.select_table(TABLE_NAME)
+    table.write(df, partition_size=partition_size)
+    # Act
+    table.drop_rows(rows)
+    # Assert
+    assert table.read_pandas().index.freq == freq
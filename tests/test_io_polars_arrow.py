@@ -1,4 +1,12 @@
+from datetime import datetime
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.dataset as ds
 import pytest
+from pyarrow import ipc
+
+from featherstore._table import scan
 
 from .fixtures import (
     DEFAULT_ARROW_INDEX_NAME,
@@ -12,6 +20,7 @@ from .fixtures import (
     get_index_name,
     get_partition_size,
     make_table,
+    partition_layout,
     sorted_string_index,
     split_table,
 )
@@ -86,3 +95,254 @@ def test_polars_series_io(store, rows, cols):
     table.write(original_df, partition_size=partition_size)
     # Assert
     assert_table_equals(table, expected, rows=rows, cols=cols)
+
+
+@pytest.mark.parametrize("index", [fake_default_index, continuous_datetime_index])
+def test_scan_polars(store, index):
+    # Arrange
+    original_df = make_table(index, astype="polars")
+    index_name = get_index_name(original_df)
+    if index == fake_default_index:
+        original_df = original_df.drop(DEFAULT_ARROW_INDEX_NAME)
+        index_name = None
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index=index_name, partition_size=partition_size)
+    # Act
+    df = table.scan_polars().collect()
+    # Assert
+    assert_df_equals(df, table.read_polars())
+
+
+def test_scan_polars_pushes_down_index_filter_projection_and_head(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="polars")
+    partition_size = get_partition_size(original_df)
+    store.write_table(
+        TABLE_NAME, original_df, index="Date", partition_size=partition_size
+    )
+    expected = store.read_polars(
+        TABLE_NAME, cols=["c1"], rows={"after": "2021-01-12"}
+    ).head(3)
+    # Act
+    lf = store.scan_polars(TABLE_NAME)
+    df = lf.filter(pl.col("Date") >= datetime(2021, 1, 12)).select(["Date", "c1"])
+    df = df.head(3).collect()
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_scan_polars_filters_on_columns(store):
+    # Arrange
+    original_df = make_table(rows=40, dtype="int", astype="polars")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    expected = table.read_polars().filter(pl.col("c0") > 0)
+    # Act
+    df = table.scan_polars().filter(pl.col("c0") > 0).collect()
+    # Assert
+    assert_df_equals(df, expected)
+
+
+@pytest.mark.parametrize(
+    ["predicate", "is_pruned"],
+    [
+        (pl.col("Date") < datetime(2021, 1, 5), True),
+        (datetime(2021, 1, 20) <= pl.col("Date"), True),
+        (pl.col("Date").is_between(datetime(2021, 1, 9), datetime(2021, 1, 14)), True),
+        (pl.col("Date").is_in([datetime(2021, 1, 3), datetime(2021, 1, 8)]), True),
+        ((pl.col("Date") > datetime(2021, 1, 15)) & (pl.col("c1") > 0), True),
+        (
+            (pl.col("Date") == datetime(2021, 1, 2))
+            | (pl.col("Date") == datetime(2021, 1, 4)),
+            True,
+        ),
+        ((pl.col("Date") < datetime(2021, 1, 5)) | (pl.col("c1") > 0), False),
+        (pl.col("Date").dt.day() == 3, False),
+    ],
+)
+def test_scan_polars_skips_partitions_outside_the_index_bounds(
+    store, monkeypatch, predicate, is_pruned
+):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="polars")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index="Date", partition_size=partition_size)
+    expected = table.read_polars().filter(predicate)
+    read_partitions = []
+    read_partition = scan._read_partition
+
+    def record_read(table, partition_name, cols, mmap):
+        read_partitions.append(partition_name)
+        return read_partition(table, partition_name, cols, mmap)
+
+    monkeypatch.setattr(scan, "_read_partition", record_read)
+    # Act
+    df = table.scan_polars().filter(predicate).collect()
+    # Assert
+    assert_df_equals(df, expected)
+    assert len(read_partitions) == len(set(read_partitions))
+    assert (len(read_partitions) < len(partition_layout(table))) == is_pruned
+    for partition in partition_layout(table):
+        if partition.name in read_partitions:
+            continue
+        skipped_df = original_df.filter(
+            pl.col("Date").is_between(partition.min, partition.max)
+        )
+        assert skipped_df.filter(predicate).is_empty()
+
+
+@pytest.mark.parametrize("index", [fake_default_index, continuous_datetime_index])
+def test_to_dataset(store, index):
+    # Arrange
+    original_df = make_table(index, astype="arrow")
+    index_name = get_index_name(original_df)
+    if index == fake_default_index:
+        original_df = original_df.drop([DEFAULT_ARROW_INDEX_NAME])
+        index_name = None
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index=index_name, partition_size=partition_size)
+    # Act
+    df = table.to_dataset().to_table()
+    # Assert
+    assert df.equals(table.read_arrow())
+
+
+def test_to_dataset_skips_partitions_outside_an_index_filter(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="arrow")
+    partition_size = get_partition_size(original_df, num_partitions=5)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index="Date", partition_size=partition_size)
+
+    last_partition = partition_layout(table)[-1]
+    index_filter = ds.field("Date") >= pa.scalar(
+        last_partition.min, type=original_df["Date"].type
+    )
+    # Act
+    dataset = table.to_dataset()
+    fragments = list(dataset.get_fragments(filter=index_filter))
+    # Assert
+    assert len(fragments) == 1
+    assert dataset.to_table(filter=index_filter).num_rows == last_partition.num_rows
+
+
+def test_to_dataset_after_default_index_is_replaced(store):
+    # Arrange
+    original_df = make_table(rows=30, astype="pandas")
+    append_df = make_table(rows=2, astype="pandas")
+    append_df.index = [100, 101]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.append(append_df)
+    # Act
+    df = table.to_dataset().to_table()
+    # Assert
+    assert df.equals(table.read_arrow())
+
+
+def test_to_dataset_does_not_open_partition_files(store, monkeypatch):
+    # Arrange
+    original_df = make_table(rows=30, astype="pandas")
+    append_df = make_table(rows=2, astype="pandas")
+    append_df.index = [100, 101]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.append(append_df)
+    expected = table.read_arrow()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("A partition file was opened")
+
+    # Act
+    with monkeypatch.context() as m:
+        m.setattr(ipc, "open_file", fail)
+        dataset = table.to_dataset()
+    # Assert
+    assert dataset.to_table().equals(expected)
+
+
+def test_to_dataset_with_dictionary_cols(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, astype="pandas")
+    original_df["c0"] = original_df["c0"].str[:1]
+    partition_size = get_partition_size(original_df, num_partitions=5)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, dictionary=["c0"])
+
+    index_name = table._table_data["index_name"]
+    last_partition = partition_layout(table)[-1]
+    index_filter = ds.field(index_name) >= last_partition.min
+    # Act
+    dataset = table.to_dataset()
+    fragments = list(dataset.get_fragments(filter=index_filter))
+    # Assert
+    assert dataset.to_table().equals(table.read_arrow())
+    assert len(list(dataset.get_fragments())) == len(partition_layout(table))
+    assert len(fragments) == 1
+    assert dataset.to_table(filter=index_filter).num_rows == last_partition.num_rows
+
+
+def test_register_duckdb(store):
+    # Arrange
+    duckdb = pytest.importorskip("duckdb")
+    original_df = make_table(continuous_datetime_index, astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    connection = duckdb.connect()
+    # Act
+    table.register_duckdb(connection, name="prices")
+    # Assert
+    num_rows = connection.sql("SELECT count(*) FROM prices").fetchone()[0]
+    assert num_rows == len(original_df)
+
+
+@pytest.mark.parametrize(
+    ["index", "rows"],
+    [
+        (fake_default_index, None),
+        (fake_default_index, {"after": 12}),
+        (fake_default_index, {"before": 12}),
+        (continuous_datetime_index, {"between": ["2021-01-07", "2021-01-20"]}),
+        (continuous_datetime_index, ["2021-01-20", "2021-01-07"]),
+    ],
+)
+def test_read_batches(store, index, rows):
+    # Arrange
+    original_df = make_table(index, astype="arrow")
+    index_name = get_index_name(original_df)
+    if index == fake_default_index:
+        original_df = original_df.drop([DEFAULT_ARROW_INDEX_NAME])
+        index_name = None
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index=index_name, partition_size=partition_size)
+    expected = table.read_arrow(rows=rows, cols=["c1", "c0"])
+    # Act
+    reader = table.read_batches(rows=rows, cols=["c1", "c0"])
+    # Assert
+    assert reader.read_all().equals(expected)
+
+
+@pytest.mark.parametrize("astype", ["arrow", "polars"])
+def test_table_exports_arrow_c_stream(store, astype):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="arrow")
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, index="Date", partition_size=partition_size)
+    expected = convert_table(table.read_arrow(), to=astype)
+    # Act
+    df = pa.table(table) if astype == "arrow" else pl.DataFrame(table)
+    # Assert
+    assert_df_equals(df, expected)
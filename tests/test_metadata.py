@@ -1,6 +1,6 @@
 import os
 
-from featherstore._metadata import METADATA_FOLDER_NAME, Metadata
+from featherstore._metadata import METADATA_FOLDER_NAME, Metadata, MetadataSnapshot
 
 from .fixtures import DB_PATH
 
@@ -105,3 +105,18 @@ def test_compact(metadata):
     assert size_before_compact == SIZE
     assert size_after_compact == SIZE + 1
     assert metadata.read() == new_items
+
+
+def test_snapshot_reads_items_as_they_were_after_compaction(metadata):
+    # Arrange
+    items = {f"a{i}": i for i in range(100)}
+    metadata.write(items)
+    snapshot = MetadataSnapshot(metadata._db_path, metadata.index._data)
+    # Act
+    for _ in range(3):  # Overwrites every item, so the db is compacted
+        metadata.write({key: -1 for key in items})
+    # Assert
+    assert snapshot.keys() == sorted(items.keys())
+    assert snapshot.read() == items
+    assert metadata.read() == {key: -1 for key in items}
+    snapshot.close()
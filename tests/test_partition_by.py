@@ -0,0 +1,164 @@
+import os
+
+import pandas as pd
+import pytest
+
+from featherstore._table import _partitions, _versions
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_partition_metadata_matches_files,
+    assert_table_equals,
+    continuous_datetime_index,
+    continuous_string_index,
+    make_table,
+    partition_layout,
+    pruned_partitions,
+    sort_table,
+    split_table,
+    timestamp_index,
+    write_table,
+)
+
+
+def _assert_one_partition_per_period(table, period):
+    periods = []
+    for partition in partition_layout(table):
+        first_period = pd.Period(partition.min, freq=period)
+        last_period = pd.Period(partition.max, freq=period)
+        assert first_period == last_period
+        periods.append(first_period)
+    assert len(set(periods)) == len(periods)
+
+
+@pytest.mark.parametrize(["partition_by", "num_partitions"], [["M", 3], ["1W", 14]])
+def test_write_makes_one_partition_per_period(store, partition_by, num_partitions):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    # Act
+    table = write_table(store, original_df, partition_by=partition_by)
+    # Assert
+    assert_table_equals(table, original_df)
+    assert_partition_metadata_matches_files(table)
+    assert table._table_data["num_partitions"] == num_partitions
+    _assert_one_partition_per_period(table, partition_by)
+
+
+def test_periods_of_timezone_aware_indices_follow_utc(store):
+    # Arrange
+    index = timestamp_index(tz="Europe/Oslo", start="2021-01-01 00:30")
+    original_df = make_table(index, rows=90, astype="pandas")
+    first_period = pd.Period("2020-12-31", freq="D")
+    # Act
+    table = write_table(store, original_df, partition_by="D")
+    # Assert
+    first, *_ = partition_layout(table)
+    assert first.name == _partitions.make_period_partition_name(first_period.ordinal)
+    assert_table_equals(table, original_df)
+    assert table._table_data["num_partitions"] == 90
+
+
+def test_append_only_rewrites_the_last_period(store):
+    # Arrange
+    full_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    original_df, append_df = full_df.iloc[:45], full_df.iloc[45:]
+    table = write_table(store, original_df, partition_by="M")
+    files = _versions.get_partition_files(table)
+    # Act
+    table.append(append_df)
+    # Assert
+    new_files = _versions.get_partition_files(table)
+    first_name, second_name, _ = new_files
+    assert new_files[first_name] == files[first_name]
+    assert new_files[second_name] != files[second_name]
+    assert_table_equals(table, full_df)
+    assert_partition_metadata_matches_files(table)
+    _assert_one_partition_per_period(table, "M")
+
+
+def test_read_only_opens_the_partitions_of_the_periods_read(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    table = write_table(store, original_df, partition_by="M")
+    first, second, third = partition_layout(table)
+    files = _versions.get_partition_files(table)
+    for partition in (first, third):
+        os.remove(os.path.join(table._table_path, files[partition.name]))
+    rows = {"between": ["2021-02-03", "2021-02-20"]}
+    # Act
+    df = table.read_pandas(rows=rows)
+    # Assert
+    assert pruned_partitions(table, rows) == [second.name]
+    assert df.equals(original_df.loc["2021-02-03":"2021-02-20"])
+
+
+def test_drop_rows_of_whole_periods_drops_their_partitions(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    table = write_table(store, original_df, partition_by="M")
+    files = _versions.get_partition_files(table)
+    _, _, third = partition_layout(table)
+    # Act
+    table.drop_rows({"before": "2021-02-28"})
+    # Assert
+    assert _versions.get_partition_files(table) == {third.name: files[third.name]}
+    assert_table_equals(table, original_df.loc["2021-03-01":])
+    assert_partition_metadata_matches_files(table)
+
+
+def test_insert_rows_into_a_new_period(store):
+    # Arrange
+    full_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    original_df, insert_df = split_table(full_df, rows=full_df.index[31:59])
+    table = write_table(store, original_df, partition_by="M")
+    # Act
+    table.insert_rows(insert_df)
+    # Assert
+    assert_table_equals(table, sort_table(full_df))
+    assert_partition_metadata_matches_files(table)
+    _assert_one_partition_per_period(table, "M")
+
+
+def test_column_changes_keep_one_partition_per_period(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    expected = original_df.drop(columns=["c1"]).astype({"c2": "float64"})
+    table = write_table(store, original_df, partition_by="M")
+    # Act
+    table.drop_columns(["c1"])
+    table.astype({"c2": "float64"})
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+    _assert_one_partition_per_period(table, "M")
+
+
+def test_repartition_keeps_partitioning_by_period(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=90, astype="pandas")
+    table = write_table(store, original_df, partition_by="M")
+    # Act
+    table.repartition(1024)
+    # Assert
+    assert table._table_data["partition_by"] == "M"
+    assert_table_equals(table, original_df)
+    _assert_one_partition_per_period(table, "M")
+
+
+@pytest.mark.parametrize(
+    ["partition_by", "index", "exception"],
+    [
+        [1, continuous_datetime_index, TypeError],
+        ["2D", continuous_datetime_index, ValueError],
+        ["min", continuous_datetime_index, ValueError],
+        ["not a period", continuous_datetime_index, ValueError],
+        ["D", continuous_string_index, TypeError],
+    ],
+)
+def test_can_not_partition_by_period(store, partition_by, index, exception):
+    # Arrange
+    original_df = make_table(index, astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.write(original_df, partition_by=partition_by)
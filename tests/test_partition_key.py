@@ -0,0 +1,189 @@
+import os
+
+import pandas as pd
+import pytest
+
+from featherstore._table import _versions
+from featherstore.exceptions import (
+    AppendIndexError,
+    ColumnNotFoundError,
+    DuplicateIndexValuesError,
+    PartitionKeyError,
+)
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_df_equals,
+    assert_partition_metadata_matches_files,
+    make_symbols_table,
+    pruned_partitions,
+    write_table,
+)
+
+
+def _sort_by_key(df):
+    return df.rename_axis("Date").sort_values(["symbol", "Date"], kind="stable")
+
+
+def _select_key(df, key, col="symbol"):
+    df = df[df[col] == key]
+    df.index.freq = df.index.inferred_freq  # Inferred when read, like any read
+    return df
+
+
+def _partition_keys(table):
+    return [data["key"] for data in table._partition_data.read().values()]
+
+
+def test_write_groups_rows_by_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    expected = _sort_by_key(original_df)
+    # Act
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    # Assert
+    assert_df_equals(table.read_pandas(), expected)
+    assert_partition_metadata_matches_files(table)
+    keys = _partition_keys(table)
+    assert keys == sorted(keys)
+    assert len(keys) > original_df["symbol"].nunique()
+
+
+def test_read_where_key_only_opens_its_partitions(store):
+    # Arrange
+    original_df = make_symbols_table()
+    expected = _select_key(original_df, "GOOG")
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    files = _versions.get_partition_files(table)
+    for name, data in table._partition_data.read().items():
+        if data["key"] != "GOOG":
+            os.remove(os.path.join(table._table_path, files[name]))
+    # Act
+    df = table.read_pandas(where={"symbol": "GOOG"})
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_read_rows_of_every_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    dates = pd.date_range("2021-01-03", "2021-01-05")
+    expected = _sort_by_key(original_df[original_df.index.isin(dates)])
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    rows = {"between": ["2021-01-03", "2021-01-05"]}
+    # Act
+    df = table.read_pandas(rows=rows)
+    # Assert
+    assert_df_equals(df, expected)
+    assert len(pruned_partitions(table, rows)) == original_df["symbol"].nunique()
+
+
+def test_read_list_of_rows_returns_the_rows_of_every_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    expected = _sort_by_key(original_df)
+    expected = expected[
+        expected.index.isin(pd.to_datetime(["2021-01-02", "2021-01-20"]))
+    ]
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    # Act
+    df = table.read_pandas(rows=["2021-01-20", "2021-01-02"])
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_append_only_rewrites_the_last_partition_of_each_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    append_df = make_symbols_table(["AAPL", "TSLA"], rows=10, start="2021-01-21")
+    expected = _sort_by_key(pd.concat([original_df, append_df]))
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    files = _versions.get_partition_files(table)
+    last_partitions = dict(zip(_partition_keys(table), table._partition_data.keys()))
+    # Act
+    table.append(append_df)
+    # Assert
+    new_files = _versions.get_partition_files(table)
+    changed = {name for name in files if new_files.get(name) != files[name]}
+    assert changed == {last_partitions["AAPL"]}
+    assert_df_equals(_sort_by_key(table.read_pandas()), expected)
+    assert _partition_keys(table)[-1] == "TSLA"
+    assert_partition_metadata_matches_files(table)
+
+
+def test_append_must_come_after_the_stored_rows_of_its_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    append_df = make_symbols_table(["AAPL"], rows=5, start="2021-01-18")
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    # Act and Assert
+    with pytest.raises(AppendIndexError):
+        table.append(append_df)
+
+
+def test_column_changes_keep_the_rows_grouped_by_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    expected = _sort_by_key(original_df).drop(columns=["c0"])
+    expected = expected.rename(columns={"symbol": "ticker"})
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    # Act
+    table.drop_columns(["c0"])
+    table.rename_columns({"symbol": "ticker"})
+    table.repartition(1024)
+    # Assert
+    assert table._table_data["partition_key"] == "ticker"
+    assert_df_equals(table.read_pandas(), expected)
+    assert_df_equals(
+        table.read_pandas(where={"ticker": "AAPL"}),
+        _select_key(expected, "AAPL", col="ticker"),
+    )
+    assert_partition_metadata_matches_files(table)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda table, df: table.insert_rows(df),
+        lambda table, df: table.update(df),
+        lambda table, df: table.upsert(df),
+        lambda table, df: table.drop_rows(df.index[:1]),
+        lambda table, df: table.set_retention(max_rows=10),
+        lambda table, df: table.drop_columns(["symbol"]),
+    ],
+)
+def test_can_not_change_rows_of_table_partitioned_by_key(store, change):
+    # Arrange
+    original_df = make_symbols_table()
+    table = write_table(store, original_df, num_partitions=9, partition_key="symbol")
+    # Act and Assert
+    with pytest.raises(PartitionKeyError):
+        change(table, original_df.iloc[:2])
+
+
+@pytest.mark.parametrize(
+    ["partition_key", "kwargs", "exception"],
+    [
+        [1, {}, TypeError],
+        ["symbol", {"partition_by": "D"}, ValueError],
+        ["not a column", {}, ColumnNotFoundError],
+        ["Date", {}, ColumnNotFoundError],
+    ],
+)
+def test_can_not_partition_by_key(store, partition_key, kwargs, exception):
+    # Arrange
+    original_df = make_symbols_table()
+    table = store.select_table(TABLE_NAME)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.write(original_df, partition_key=partition_key, **kwargs)
+
+
+def test_index_must_be_unique_within_each_key(store):
+    # Arrange
+    original_df = make_symbols_table()
+    original_df = pd.concat([original_df, original_df.iloc[:1]])
+    table = store.select_table(TABLE_NAME)
+    # Act and Assert
+    with pytest.raises(DuplicateIndexValuesError):
+        table.write(original_df, partition_key="symbol")
@@ -0,0 +1,114 @@
+import datetime
+import os
+
+import pytest
+
+from .fixtures import (
+    assert_partition_metadata_matches_files,
+    assert_table_equals,
+    continuous_datetime_index,
+    continuous_string_index,
+    make_table,
+    partition_layout,
+    write_table,
+)
+
+
+@pytest.mark.parametrize("keep", ["10D", datetime.timedelta(days=10)])
+def test_enforce_retention_keeps_a_time_span(store, keep):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="pandas")
+    expected = original_df.loc[original_df.index[-1] - datetime.timedelta(days=10) :]
+    expected = expected.iloc[1:]
+    table = write_table(store, original_df)
+    table.set_retention(keep=keep)
+    # Act
+    table.enforce_retention()
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_enforce_retention_keeps_a_number_of_rows(store):
+    # Arrange
+    original_df = make_table(continuous_string_index, astype="pandas")
+    table = write_table(store, original_df)
+    table.set_retention(max_rows=13)
+    # Act
+    table.enforce_retention()
+    # Assert
+    assert_table_equals(table, original_df.iloc[-13:])
+    assert_partition_metadata_matches_files(table)
+
+
+def test_enforce_retention_only_reads_the_boundary_partition(store):
+    # Arrange
+    original_df = make_table(continuous_string_index, astype="pandas")
+    table = write_table(store, original_df)
+    first, _, *rest = partition_layout(table)
+    os.remove(os.path.join(table._table_path, f"{first.name}.feather"))
+    max_rows = sum(partition.num_rows for partition in rest) + 1
+    table.set_retention(max_rows=max_rows)
+    # Act
+    table.enforce_retention()
+    # Assert
+    assert_table_equals(table, original_df.iloc[-max_rows:])
+
+
+def test_append_enforces_retention(store):
+    # Arrange
+    full_df = make_table(continuous_datetime_index, rows=40, astype="pandas")
+    original_df, append_df = full_df.iloc[:30], full_df.iloc[30:]
+    table = write_table(store, original_df)
+    table.set_retention(max_rows=30)
+    # Act
+    table.append(append_df)
+    # Assert
+    assert_table_equals(table, full_df.iloc[-30:])
+    assert_partition_metadata_matches_files(table)
+
+
+def test_store_enforces_the_retention_of_every_table(store):
+    # Arrange
+    original_df = make_table(continuous_string_index, astype="pandas")
+    table = write_table(store, original_df)
+    table.set_retention(max_rows=10)
+    other_table = store.select_table("table_without_retention")
+    other_table.write(original_df)
+    # Act
+    store.enforce_retention()
+    # Assert
+    assert_table_equals(table, original_df.iloc[-10:])
+    assert_table_equals(other_table, original_df)
+
+
+def test_retention_is_kept_when_repartitioning(store):
+    # Arrange
+    original_df = make_table(continuous_string_index, astype="pandas")
+    table = write_table(store, original_df)
+    table.set_retention(max_rows=10)
+    # Act
+    table.repartition(-1)
+    table.enforce_retention()
+    # Assert
+    assert_table_equals(table, original_df.iloc[-10:])
+
+
+@pytest.mark.parametrize(
+    ("index", "kwargs", "exception"),
+    [
+        (continuous_datetime_index, {"keep": 10}, TypeError),
+        (continuous_datetime_index, {"keep": "ten days"}, ValueError),
+        (continuous_datetime_index, {"keep": "-1D"}, ValueError),
+        (continuous_string_index, {"keep": "10D"}, TypeError),
+        (continuous_string_index, {"max_rows": 10.0}, TypeError),
+        (continuous_string_index, {"max_rows": 0}, ValueError),
+    ],
+)
+def test_can_set_retention(store, index, kwargs, exception):
+    # Arrange
+    original_df = make_table(index, astype="pandas")
+    table = write_table(store, original_df)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.set_retention(**kwargs)
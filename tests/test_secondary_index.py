@@ -0,0 +1,260 @@
+import os
+
+import pandas as pd
+import pytest
+
+from featherstore.exceptions import ColumnNotFoundError, IndexNameInColumnsError
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_df_equals,
+    assert_partition_metadata_matches_files,
+    assert_value_indexes_match_files,
+    convert_table,
+    get_partition_size,
+    make_table,
+    partition_layout,
+    sorted_datetime_index,
+)
+
+SYMBOLS = ["AAPL", "MSFT", "AAPL", "GOOG", "TSLA"]
+VENUES = ["XNAS", "XNYS"]
+
+
+def _make_tick_table(rows=30):
+    df = make_table(sorted_datetime_index, rows=rows, cols=2, astype="pandas")
+    df.insert(0, "symbol", [SYMBOLS[row % len(SYMBOLS)] for row in range(rows)])
+    df.insert(1, "venue", [VENUES[row % len(VENUES)] for row in range(rows)])
+    return df
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+@pytest.mark.parametrize("astype", ["pandas", "arrow", "polars"])
+@pytest.mark.parametrize(
+    ["where", "cols"],
+    [
+        ({"symbol": "AAPL"}, None),
+        ({"symbol": ["MSFT", "TSLA", "NFLX"]}, ["venue", "c1"]),
+        ({"symbol": "NFLX"}, ["symbol", "c0"]),
+        ({"symbol": ["AAPL", "GOOG"], "venue": "XNYS"}, None),
+    ],
+)
+def test_read_where(store, indexed, astype, where, cols):
+    # Arrange
+    original_df = _make_tick_table()
+    mask = pd.Series(True, index=original_df.index)
+    for col, values in where.items():
+        values = values if isinstance(values, list) else [values]
+        mask &= original_df[col].isin(values)
+    expected = original_df[mask]
+    if cols:
+        expected = expected[cols]
+    expected = convert_table(expected, to=astype)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    if indexed:
+        table.create_index("symbol")
+    # Act
+    if astype == "pandas":
+        df = table.read_pandas(where=where, cols=cols)
+    elif astype == "arrow":
+        df = table.read_arrow(where=where, cols=cols)
+    else:
+        df = table.read_polars(where=where, cols=cols)
+    # Assert
+    if astype == "pandas":
+        expected.index.freq = None
+    assert_df_equals(df, expected)
+
+
+def test_read_where_with_rows(store):
+    # Arrange
+    original_df = _make_tick_table()
+    rows = {"after": original_df.index[10]}
+    expected = original_df.loc[rows["after"] :]
+    expected = expected[expected["symbol"] == "AAPL"]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.create_index("symbol")
+    # Act
+    df = table.read_pandas(rows=rows, where={"symbol": "AAPL"})
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def test_read_where_only_opens_partitions_holding_the_values(store):
+    # Arrange
+    original_df = _make_tick_table()
+    original_df["symbol"] = "MSFT"
+    original_df.iloc[:3, 0] = "AAPL"
+    expected = original_df.iloc[:3]
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.create_index("symbol")
+
+    last_partition = partition_layout(table)[-1]
+    os.remove(os.path.join(table._table_path, f"{last_partition.name}.feather"))
+    # Act
+    df = table.read_pandas(where={"symbol": "AAPL"})
+    # Assert
+    assert_df_equals(df, expected)
+
+
+def _append(table, df):
+    original_df, append_df = df.iloc[:20], df.iloc[20:]
+    table.write(original_df, partition_size=get_partition_size(original_df))
+    table.create_index("symbol")
+    table.append(append_df)
+    return df
+
+
+def _insert_rows(table, df):
+    insert_df = df.iloc[[3, 11, 12, 25]]
+    original_df = df.drop(insert_df.index)
+    table.write(original_df, partition_size=get_partition_size(original_df))
+    table.create_index("symbol")
+    table.insert_rows(insert_df)
+    return df
+
+
+def _update(table, df):
+    table.write(df, partition_size=get_partition_size(df))
+    table.create_index("symbol")
+    update_df = df.iloc[[2, 3, 17]].copy()
+    update_df["symbol"] = "NFLX"
+    table.update(update_df)
+    df = df.copy()
+    df.loc[update_df.index, "symbol"] = "NFLX"
+    return df
+
+
+def _drop_rows(table, df):
+    table.write(df, partition_size=get_partition_size(df))
+    table.create_index("symbol")
+    rows = df.index[[0, 5, 6, 7, 19]]
+    table.drop_rows(rows)
+    return df.drop(rows)
+
+
+def _insert_columns(table, df):
+    original_df = df.drop(columns=["c1"])
+    table.write(original_df, partition_size=get_partition_size(original_df))
+    table.create_index("symbol")
+    table.insert_columns(df[["c1"]])
+    return df
+
+
+@pytest.mark.parametrize(
+    "edit_table", [_append, _insert_rows, _update, _drop_rows, _insert_columns]
+)
+def test_index_is_kept_up_to_date(store, edit_table):
+    # Arrange
+    df = _make_tick_table()
+    table = store.select_table(TABLE_NAME)
+    # Act
+    df = edit_table(table, df)
+    # Assert
+    expected = df[df["symbol"].isin(["AAPL", "NFLX"])]
+    expected.index.freq = None
+    result = table.read_pandas(where={"symbol": ["AAPL", "NFLX"]})
+    assert_value_indexes_match_files(table)
+    assert_partition_metadata_matches_files(table)
+    assert_df_equals(result, expected)
+
+
+def test_index_follows_renamed_column(store):
+    # Arrange
+    df = _make_tick_table()
+    expected = df[df["symbol"] == "GOOG"].rename(columns={"symbol": "ticker"})
+    expected.index.freq = None
+
+    table = store.select_table(TABLE_NAME)
+    table.write(df, partition_size=get_partition_size(df))
+    table.create_index("symbol")
+    # Act
+    table.rename_columns({"symbol": "ticker"})
+    # Assert
+    assert table._table_data["indexed_cols"] == ["ticker"]
+    assert_value_indexes_match_files(table)
+    assert_df_equals(table.read_pandas(where={"ticker": "GOOG"}), expected)
+
+
+def test_index_is_removed_with_its_column(store):
+    # Arrange
+    df = _make_tick_table()
+    table = store.select_table(TABLE_NAME)
+    table.write(df, partition_size=get_partition_size(df))
+    table.create_index("symbol")
+    # Act
+    table.drop_columns(["symbol"])
+    # Assert
+    assert table._table_data["indexed_cols"] == []
+    assert_value_indexes_match_files(table)
+
+
+def test_index_is_kept_when_repartitioning(store):
+    # Arrange
+    df = _make_tick_table()
+    table = store.select_table(TABLE_NAME)
+    table.write(df, partition_size=get_partition_size(df))
+    table.create_index("symbol")
+    # Act
+    table.repartition(get_partition_size(df, num_partitions=2))
+    # Assert
+    assert table._table_data["indexed_cols"] == ["symbol"]
+    assert_value_indexes_match_files(table)
+
+
+def test_drop_index(store):
+    # Arrange
+    df = _make_tick_table()
+    table = store.select_table(TABLE_NAME)
+    table.write(df, partition_size=get_partition_size(df))
+    table.create_index("symbol")
+    # Act
+    table.drop_index("symbol")
+    # Assert
+    assert table._table_data["indexed_cols"] == []
+    assert_value_indexes_match_files(table)
+
+
+@pytest.mark.parametrize(
+    ["col", "exception"],
+    [
+        ("c5", ColumnNotFoundError),
+        ("Date", IndexNameInColumnsError),
+        (["symbol"], TypeError),
+    ],
+)
+def test_can_create_index(store, col, exception):
+    # Arrange
+    df = _make_tick_table()
+    table = store.select_table(TABLE_NAME)
+    table.write(df)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.create_index(col)
+
+
+@pytest.mark.parametrize(
+    ["where", "exception"],
+    [
+        (["symbol", "AAPL"], TypeError),
+        ({"ticker": "AAPL"}, ColumnNotFoundError),
+        ({"symbol": 1}, TypeError),
+    ],
+)
+def test_can_read_where(store, where, exception):
+    # Arrange
+    df = _make_tick_table()
+    table = store.select_table(TABLE_NAME)
+    table.write(df)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.read_arrow(where=where)
@@ -12,6 +12,7 @@ from featherstore.exceptions import (
 
 from .fixtures import (
     TABLE_NAME,
+    assert_dictionary_indices_are_stored,
     assert_partition_metadata_matches_files,
     assert_table_equals,
     continuous_datetime_index,
@@ -130,6 +131,25 @@ def _assert_partitions_are_same_structure_after_update(
         assert num_rows == metadata["num_rows"]
 
 
+def test_update_dictionary_col_with_new_values(store):
+    # Arrange
+    original_df = make_table(sorted_string_index, astype="pandas")
+    original_df["c0"] = original_df["c0"].str[:1]
+    update_df = original_df.iloc[[2, 17]][["c0"]].copy()
+    update_df["c0"] = ["new value", "b"]
+    expected = original_df["c0"].copy()
+    expected.update(update_df["c0"])
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size, dictionary=["c0"])
+    # Act
+    table.update(update_df)
+    # Assert
+    assert_dictionary_indices_are_stored(table)
+    assert table.read_pandas(cols=["c0"]).tolist() == expected.tolist()
+
+
 def test_update_spanning_a_partition_seam(store):
     # Arrange
     original_df = make_table(astype="pandas")
@@ -151,6 +171,27 @@ def test_update_spanning_a_partition_seam(store):
     assert_partition_metadata_matches_files(table)
 
 
+def test_update_partitions_of_uneven_size(store):
+    # Arrange
+    original_df = make_table(astype="pandas")
+    original_df.index.name = "index"
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    table.drop_rows(original_df.index[10:20].tolist())
+    original_df = original_df.drop(original_df.index[10:20])
+
+    _, update_df = split_table(original_df, rows=[0, 25], cols=["c0"])
+    update_df = regenerate_values(update_df)
+    expected = update_table(original_df, update_df)
+    # Act
+    table.update(update_df)
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
 def _update_table_not_supported_type():
     return make_table(cols=1, astype="polars[series]")
 
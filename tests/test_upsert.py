@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+import pytest
+
+from featherstore.exceptions import ColumnMismatchError
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_partition_metadata_matches_files,
+    assert_table_equals,
+    continuous_datetime_index,
+    continuous_string_index,
+    convert_table,
+    default_index,
+    get_partition_size,
+    make_table,
+    partition_layout,
+    regenerate_values,
+    sort_table,
+    split_table,
+    update_table,
+)
+
+
+@pytest.mark.parametrize(
+    ["index", "updated_rows", "inserted_rows"],
+    [
+        [default_index, [3, 17, 20], [4, 8, 9]],
+        [continuous_string_index, ["ab", "bc"], ["af", "ba"]],
+        [
+            continuous_datetime_index,
+            ["2021-01-02", "2021-01-25"],
+            ["2021-01-10", "2021-01-14"],
+        ],
+    ],
+)
+@pytest.mark.parametrize("astype", ["pandas", "polars", "arrow"])
+def test_upsert_table(store, index, updated_rows, inserted_rows, astype):
+    # Arrange
+    full_df = make_table(index, astype="pandas")
+    original_df, insert_df = split_table(full_df, rows=inserted_rows)
+    _, update_df = split_table(original_df, rows=updated_rows)
+    update_df = regenerate_values(update_df)
+    upsert_df = sort_table(pd.concat([update_df, insert_df]))
+    expected = update_table(full_df, update_df)
+
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    table.upsert(convert_table(upsert_df, to=astype, keep_index=True))
+    # Assert
+    assert_table_equals(table, expected)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_upsert_after_the_stored_rows_only_opens_the_last_partition(store):
+    # Arrange
+    full_df = make_table(continuous_datetime_index, rows=40, astype="pandas")
+    original_df, upsert_df = full_df.iloc[:30], full_df.iloc[30:]
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+
+    *rest, _ = partition_layout(table)
+    for partition in rest:
+        os.remove(os.path.join(table._table_path, f"{partition.name}.feather"))
+    # Act
+    table.upsert(upsert_df)
+    # Assert
+    df = table.read_pandas(rows={"after": upsert_df.index[0]})
+    assert df.equals(upsert_df)
+    assert table.shape == (40, 6)
+
+
+def test_upsert_keeps_default_index_when_continued(store):
+    # Arrange
+    full_df = make_table(default_index, rows=40, astype="pandas")
+    original_df, upsert_df = full_df.iloc[:30], full_df.iloc[25:]
+    partition_size = get_partition_size(original_df)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    # Act
+    table.upsert(upsert_df)
+    # Assert
+    assert_table_equals(table, full_df)
+    assert table._table_data["has_default_index"]
+
+
+def test_can_not_upsert_with_other_cols(store):
+    # Arrange
+    original_df = make_table(astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    upsert_df = original_df.iloc[:5][["c0", "c1"]]
+    # Act and Assert
+    with pytest.raises(ColumnMismatchError):
+        table.upsert(upsert_df)
@@ -0,0 +1,248 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+from featherstore import Table
+from featherstore._table import _versions, write
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_df_equals,
+    assert_partition_metadata_matches_files,
+    continuous_datetime_index,
+    make_table,
+    partition_layout,
+    sorted_datetime_index,
+    write_table,
+)
+
+
+def test_stream_reads_the_version_pinned_when_it_was_opened(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected = table.read_arrow()
+    reader = table.read_batches()
+    first_batch = reader.read_next_batch()
+    # Act
+    update_df = original_df.iloc[[0, 15, 29]][["c1"]] * 2
+    table.update(update_df)
+    table.drop_rows(original_df.index[10:20].tolist())
+    df = pa.Table.from_batches([first_batch, *reader], schema=reader.schema)
+    # Assert
+    assert df.equals(expected)
+
+
+def test_files_of_pinned_versions_are_removed_once_released(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    pinned_files = set(_versions.get_partition_files(table).values())
+    reader = table.read_batches()
+    # Act
+    table.drop_rows(original_df.index[10:20].tolist())
+    files_while_pinned = set(os.listdir(table._table_path))
+    reader.read_all()
+    table.update(original_df.iloc[[25]][["c1"]] * 2)
+    # Assert
+    assert pinned_files <= files_while_pinned
+    assert_partition_metadata_matches_files(table)
+
+
+def test_rewritten_partitions_get_new_files(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    first, *rest = partition_layout(table)
+    old_files = _versions.get_partition_files(table)
+    # Act
+    table.update(original_df.iloc[[0]][["c1"]] * 2)
+    # Assert
+    new_files = _versions.get_partition_files(table)
+    assert new_files[first.name] != old_files[first.name]
+    for partition in rest:
+        assert new_files[partition.name] == old_files[partition.name]
+    assert_partition_metadata_matches_files(table)
+
+
+def test_reads_see_the_published_version_until_a_commit_ends(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected = original_df.drop(original_df.index[:10])
+    expected.index.freq = None
+    reader_table = store.select_table(TABLE_NAME)
+    # Act
+    with write.commit(table):
+        table.drop_rows(original_df.index[:10].tolist())
+        df_during_commit = reader_table.read_pandas()
+    df_after_commit = reader_table.read_pandas()
+    # Assert
+    assert_df_equals(df_during_commit, original_df)
+    assert_df_equals(df_after_commit, expected)
+
+
+def test_dataset_reads_the_version_pinned_when_it_was_made(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected = table.read_arrow()
+    dataset = table.to_dataset()
+    # Act
+    table.update(original_df.iloc[[0, 29]][["c1"]] * 2)
+    table.drop_rows(original_df.index[10:20].tolist())
+    df = dataset.to_table()
+    # Assert
+    assert df.equals(expected)
+
+
+def test_scan_reads_the_version_pinned_when_it_was_made(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected = table.read_polars()
+    lf = table.scan_polars().select(["Date", "c1"])
+    # Act
+    table.update(original_df.iloc[[0, 29]][["c1"]] * 2)
+    table.drop_rows(original_df.index[10:20].tolist())
+    df = lf.collect()
+    # Assert
+    assert_df_equals(df, expected.select(["Date", "c1"]))
+
+
+def test_a_crashed_commit_does_not_block_reads(store, monkeypatch):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected = table.read_arrow()
+    version = _versions.read_version(table._table_path)
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    # Act
+    with monkeypatch.context() as m:
+        m.setattr(_versions, "_write_version", crash)
+        try:
+            table.drop_rows(original_df.index[:10].tolist())
+        except KeyboardInterrupt:
+            pass
+    df_after_crash = store.select_table(TABLE_NAME).read_arrow()
+    table.update(original_df.iloc[[25]][["c1"]] * 2)
+    # Assert
+    assert df_after_crash.equals(expected)
+    assert _versions.read_version(table._table_path) == version + 1
+    assert table.read_arrow().num_rows == len(original_df)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_metadata_of_pinned_versions_is_not_changed(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    version = _versions.read_version(table._table_path)
+    table_data = table._table_data.read()
+    partition_data = table._partition_data.read()
+    reader = table.read_batches()
+    # Act
+    for _ in range(5):
+        table.update(original_df.iloc[[0, 29]][["c1"]] * 2)
+    table.drop_rows(original_df.index[10:20].tolist())
+    pinned_metadata = _versions.load_metadata(table._table_path, version)
+    # Assert
+    assert pinned_metadata[0].read() == table_data
+    assert pinned_metadata[1].read() == partition_data
+    reader.read_all()
+
+
+def test_metadata_of_unpinned_versions_is_removed(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    manifest_folder = os.path.join(
+        table._table_path, ".metadata", _versions.MANIFEST_FOLDER_NAME
+    )
+    # Act
+    for _ in range(10):
+        table.update(original_df.iloc[[0, 29]][["c1"]] * 2)
+    # Assert
+    version = _versions.read_version(table._table_path)
+    manifest = _versions._read_manifest(table._table_path, version)
+    assert sorted(os.listdir(manifest_folder)) == sorted(
+        [str(version), f"{manifest['db']}.db"]
+    )
+
+
+def test_overwriting_a_table_publishes_a_new_version(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    expected = table.read_arrow()
+    version = _versions.read_version(table._table_path)
+    reader = table.read_batches()
+    new_df = make_table(sorted_datetime_index, rows=12, astype="pandas")
+    # Act
+    table.write(new_df, errors="ignore", partition_size=-1)
+    df = pa.Table.from_batches(list(reader), schema=reader.schema)
+    # Assert
+    assert df.equals(expected)
+    assert _versions.read_version(table._table_path) == version + 1
+    assert_df_equals(table.read_pandas(), new_df)
+
+
+def test_failed_overwrite_keeps_the_table(store, monkeypatch):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    new_df = make_table(sorted_datetime_index, rows=12, astype="pandas")
+
+    def fail(*args, **kwargs):
+        raise OSError
+
+    # Act
+    with monkeypatch.context() as m:
+        m.setattr(write, "_write_partition_file", fail)
+        try:
+            table.write(new_df, errors="ignore")
+        except OSError:
+            pass
+    # Assert
+    assert_df_equals(table.read_pandas(), original_df)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_repartition_publishes_one_version(store):
+    # Arrange
+    original_df = make_table(sorted_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    table.create_index("c1")
+    version = _versions.read_version(table._table_path)
+    # Act
+    table.repartition(-1)
+    # Assert
+    assert _versions.read_version(table._table_path) == version + 1
+    assert len(partition_layout(table)) == 1
+    assert len(_versions.get_index_files(table)) == 1
+    assert_df_equals(table.read_pandas(), original_df)
+
+
+def test_read_pandas_rebuilds_the_index_from_the_version_it_read(store, monkeypatch):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, astype="pandas")
+    table = write_table(store, original_df)
+    append_df = original_df.iloc[-2:].copy()
+    append_df.index = append_df.index + pd.Timedelta(days=365)
+    read_arrow = Table.read_arrow
+
+    def read_then_append(self, **kwargs):
+        df = read_arrow(self, **kwargs)
+        table.append(append_df)
+        return df
+
+    monkeypatch.setattr(Table, "read_arrow", read_then_append)
+    # Act
+    df = table.read_pandas()
+    # Assert
+    assert_df_equals(df, original_df)
+    assert df.index.freq == original_df.index.freq
@@ -0,0 +1,205 @@
+import os
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from featherstore.exceptions import (
+    AppendIndexError,
+    ColumnDtypeMismatchError,
+    TableAlreadyExistsError,
+)
+
+from .fixtures import (
+    TABLE_NAME,
+    assert_df_equals,
+    assert_index_is_not_stored,
+    assert_partition_metadata_matches_files,
+    continuous_datetime_index,
+    default_index,
+    get_partition_size,
+    make_table,
+    partition_layout,
+    sorted_string_index,
+)
+
+ROWS = 100
+
+
+def _make_batches(df, num_batches=7):
+    batch_size = -(-len(df) // num_batches)
+    for start in range(0, len(df), batch_size):
+        if isinstance(df, pd.DataFrame):
+            yield df.iloc[start : start + batch_size]
+        else:
+            yield df.slice(start, batch_size)
+
+
+def _write_tables(store, df, num_batches=7, **kwargs):
+    partition_size = get_partition_size(df, num_partitions=9)
+    expected = store.select_table("expected")
+    expected.write(df, partition_size=partition_size, **kwargs)
+    table = store.select_table(TABLE_NAME)
+    table.write_stream(
+        _make_batches(df, num_batches), partition_size=partition_size, **kwargs
+    )
+    return table, expected
+
+
+@pytest.mark.parametrize("index", [continuous_datetime_index, sorted_string_index])
+@pytest.mark.parametrize("astype", ["pandas", "polars", "arrow"])
+def test_write_stream_stores_like_write(store, index, astype):
+    # Arrange
+    original_df = make_table(index, rows=ROWS, astype=astype)
+    # Act
+    table, expected = _write_tables(store, original_df)
+    # Assert
+    assert_df_equals(table.read_pandas(), expected.read_pandas())
+    assert partition_layout(table) == partition_layout(expected)
+    assert table._table_data["rows_per_partition"] > 1
+    assert_partition_metadata_matches_files(table)
+
+
+@pytest.mark.parametrize("astype", ["pandas", "polars", "arrow"])
+def test_write_stream_numbers_rows_across_batches(store, astype):
+    # Arrange
+    original_df = make_table(default_index, rows=ROWS, astype=astype)
+    # Act
+    table, expected = _write_tables(store, original_df)
+    # Assert
+    assert_df_equals(table.read_pandas(), expected.read_pandas())
+    assert table._table_data["has_default_index"]
+    assert_index_is_not_stored(table)
+    assert_partition_metadata_matches_files(table)
+
+
+def test_write_stream_writes_partitions_before_the_stream_ends(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=ROWS, astype="arrow")
+    partition_size = get_partition_size(original_df, num_partitions=9)
+    table = store.select_table(TABLE_NAME)
+    stored_partitions = []
+
+    def batches():
+        for df in _make_batches(original_df, num_batches=10):
+            files = os.listdir(table._table_path)
+            stored_partitions.append(len([f for f in files if f.endswith(".feather")]))
+            yield df
+
+    # Act
+    table.write_stream(batches(), partition_size=partition_size)
+    # Assert
+    assert stored_partitions[0] == 0
+    assert stored_partitions[-1] >= table._table_data["num_partitions"] - 2
+    assert_df_equals(table.read_arrow(), original_df)
+
+
+def test_write_stream_sorts_each_batch(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=ROWS, astype="pandas")
+    batches = [df.iloc[::-1] for df in _make_batches(original_df)]
+    table = store.select_table(TABLE_NAME)
+    # Act
+    with pytest.warns(UserWarning):
+        table.write_stream(batches)
+    # Assert
+    assert_df_equals(table.read_pandas(), original_df)
+
+
+def test_write_stream_casts_batches_to_schema(store):
+    # Arrange
+    original_df = make_table(default_index, rows=ROWS, cols=2, astype="polars")
+    schema = pa.schema([("c0", pa.string()), ("c1", pa.float32())])
+    expected = original_df.cast({"c1": pl.Float32})
+    table = store.select_table(TABLE_NAME)
+    # Act
+    table.write_stream(original_df.iter_slices(30), schema=schema)
+    # Assert
+    assert_df_equals(table.read_polars(), expected)
+
+
+def test_write_empty_stream(store):
+    # Arrange
+    schema = pa.schema([("Date", pa.timestamp("ns")), ("c0", pa.float64())])
+    table = store.select_table(TABLE_NAME)
+    # Act
+    table.write_stream(iter([]), schema=schema, index="Date")
+    # Assert
+    df = table.read_arrow()
+    assert df.num_rows == 0
+    assert df.column_names == ["Date", "c0"]
+    assert table._table_data["num_partitions"] == 1
+
+
+@pytest.mark.parametrize(
+    ["batches", "kwargs", "exception"],
+    [
+        [lambda df: [df.iloc[50:], df.iloc[:50]], {}, AppendIndexError],
+        [lambda df: [df.iloc[:50], df.iloc[49:]], {}, AppendIndexError],
+        [
+            lambda df: [df.iloc[:50], df.iloc[50:].assign(c1="not a float")],
+            {},
+            ColumnDtypeMismatchError,
+        ],
+        [lambda df: [], {}, ValueError],
+        [lambda df: df, {}, TypeError],
+        [lambda df: [df], {"index": 1}, TypeError],
+    ],
+)
+def test_can_not_write_stream(store, batches, kwargs, exception):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=ROWS, astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    # Act and Assert
+    with pytest.raises(exception):
+        table.write_stream(batches(original_df), **kwargs)
+    assert not table.exists()
+
+
+def test_write_stream_to_existing_table(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=ROWS, astype="pandas")
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df)
+    # Act and Assert
+    with pytest.raises(TableAlreadyExistsError):
+        table.write_stream(_make_batches(original_df))
+    assert_df_equals(table.read_pandas(), original_df)
+
+
+def test_write_stream_replaces_existing_table(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=ROWS, astype="pandas")
+    new_df = make_table(sorted_string_index, rows=ROWS, astype="pandas")
+    partition_size = get_partition_size(original_df, num_partitions=9)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    expected = table.read_arrow()
+    reader = table.read_batches()
+    # Act
+    table.write_stream(_make_batches(new_df), errors="ignore")
+    # Assert
+    assert reader.read_all().equals(expected)
+    assert_df_equals(table.read_pandas(), new_df)
+
+
+def test_failed_stream_keeps_existing_table(store):
+    # Arrange
+    original_df = make_table(continuous_datetime_index, rows=ROWS, astype="pandas")
+    partition_size = get_partition_size(original_df, num_partitions=9)
+    table = store.select_table(TABLE_NAME)
+    table.write(original_df, partition_size=partition_size)
+    files = set(os.listdir(table._table_path))
+
+    def batches():
+        yield from _make_batches(original_df.iloc[:50])
+        raise RuntimeError("The stream failed")
+
+    # Act
+    with pytest.raises(RuntimeError):
+        table.write_stream(batches(), partition_size=partition_size, errors="ignore")
+    # Assert
+    assert_df_equals(table.read_pandas(), original_df)
+    assert set(os.listdir(table._table_path)) == files
+    assert_partition_metadata_matches_files(table)